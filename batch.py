@@ -0,0 +1,159 @@
+"""
+batch.py - ĐÁNH GIÁ HÀNG LOẠT VỊ TRÍ BẰNG NUMPY (VECTOR HÓA)
+
+Evaluator.score xử lý một Board mỗi lần gọi Python. Các job phân tích
+cần chấm điểm hàng nghìn vị trí một lúc, nên file này tính cùng công
+thức cho cả mảng vị trí bằng phép toán NumPy, không có vòng lặp Python
+theo từng vị trí.
+
+Đầu vào (positions):
+- Mảng (N, 8, 8) int8: 0 = trống, 1 = Đen, 2 = Trắng (như Board.board)
+- Hoặc mảng (N, 2) uint64: cột 0 = bitboard Đen, cột 1 = bitboard Trắng
+  (bit row * 8 + col, như BitBoard)
+
+players: màu người được đánh giá, một số hoặc mảng (N,).
+"""
+
+import numpy as np
+
+from config import BLACK, WHITE
+from evaluator import Evaluator
+from bitboard import INNER
+
+CORNER_MASK = np.uint64(0x8100000000000081)
+EDGE_MASK = np.uint64(0x7E8181818181817E)  # Ô cạnh, không tính góc
+
+# Số bit bật trong mỗi giá trị byte, dùng cho popcount
+POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+# Dịch bit của 4 hướng (mỗi hướng dịch cả 2 chiều), mặt nạ như move_mask
+SHIFTS = ((np.uint64(1), True), (np.uint64(8), False),
+          (np.uint64(9), True), (np.uint64(7), True))
+
+
+def stack_boards(boards):
+    """Gom danh sách Board/BitBoard thành mảng (N, 8, 8) int8"""
+    return np.array([board.board for board in boards], dtype=np.int8)
+
+
+def to_bitboards(positions):
+    """
+    CHUYỂN ĐẦU VÀO VỀ 2 MẢNG BITBOARD
+
+    Returns:
+        tuple (black, white): Hai mảng (N,) uint64
+    """
+    positions = np.asarray(positions)
+    if positions.ndim == 2 and positions.shape[1] == 2:
+        positions = positions.astype(np.uint64)
+        return positions[:, 0], positions[:, 1]
+    if positions.ndim != 3 or positions.shape[1:] != (8, 8):
+        raise ValueError('positions must be (N, 8, 8) or (N, 2), got %s'
+                         % (positions.shape,))
+    cells = positions.reshape(len(positions), 64)
+    black = np.packbits(cells == BLACK, axis=1, bitorder='little')
+    white = np.packbits(cells == WHITE, axis=1, bitorder='little')
+    return (black.view('<u8').ravel().astype(np.uint64),
+            white.view('<u8').ravel().astype(np.uint64))
+
+
+def popcount(x):
+    """Số bit bật của từng phần tử uint64"""
+    x = np.ascontiguousarray(x, dtype=np.uint64)
+    return POPCOUNT8[x.view(np.uint8)].reshape(len(x), 8).sum(axis=1)
+
+
+def move_masks(own, opp):
+    """Mặt nạ nước đi hợp lệ cho từng cặp (own, opp) - như move_mask()"""
+    empty = ~(own | opp)
+    inner = opp & np.uint64(INNER)
+    moves = np.zeros_like(own)
+    for shift, horizontal in SHIFTS:
+        mask = inner if horizontal else opp
+        x = (own << shift) & mask
+        for _ in range(5):
+            x |= (x << shift) & mask
+        moves |= x << shift
+        x = (own >> shift) & mask
+        for _ in range(5):
+            x |= (x >> shift) & mask
+        moves |= x >> shift
+    return moves & empty
+
+
+def _own_opp(positions, players):
+    """Bitboard theo góc nhìn người được đánh giá"""
+    black, white = to_bitboards(positions)
+    isBlack = np.broadcast_to(np.asarray(players) == BLACK, black.shape)
+    own = np.where(isBlack, black, white)
+    opp = np.where(isBlack, white, black)
+    return own, opp
+
+
+def _static_scores(own, opp, depth):
+    """Evaluator.score(board, board, depth, ...) cho mảng bitboard"""
+    mine = popcount(own)
+    yours = popcount(opp)
+    pieces = mine + yours
+    band = np.select([pieces <= 16, pieces <= 32, pieces <= 48,
+                      pieces <= 64 - depth], [0, 1, 2, 3], 4)
+
+    # Khi startBoard là chính board, chỉ còn số quân, góc và cạnh: các
+    # thành phần linh hoạt so sánh board với chính nó nên bằng 0
+    weights = np.array([Evaluator.PIECE_COUNT_WEIGHT, Evaluator.CORNER_WEIGHT,
+                        Evaluator.EDGE_WEIGHT], dtype=np.int64)[:, band]
+    scores = weights[0] * (mine - yours)
+    scores += weights[1] * (popcount(own & CORNER_MASK) -
+                            popcount(opp & CORNER_MASK))
+    scores += weights[2] * (popcount(own & EDGE_MASK) -
+                            popcount(opp & EDGE_MASK))
+    scores = np.where(yours == 0, Evaluator.WIPEOUT_SCORE, scores)
+    return np.where(mine == 0, -Evaluator.WIPEOUT_SCORE, scores)
+
+
+def score_batch(positions, players, depth=0):
+    """
+    CHẤM ĐIỂM HÀNG LOẠT
+
+    Cùng kết quả với Evaluator().score(board, board, depth, player,
+    opponent) cho từng vị trí.
+
+    Returns:
+        ndarray: (N,) int64 điểm theo góc nhìn players
+    """
+    own, opp = _own_opp(positions, players)
+    return _static_scores(own, opp, depth)
+
+
+def win_probability_batch(positions, players, depth=3):
+    """
+    XÁC SUẤT THẮNG HÀNG LOẠT - cùng công thức với
+    Evaluator.calculate_win_probability
+
+    Returns:
+        tuple (player, opponent): Hai mảng (N,) float64 trong [0.05, 0.95]
+    """
+    own, opp = _own_opp(positions, players)
+    current = _static_scores(own, opp, depth)
+
+    mine = popcount(own)
+    yours = popcount(opp)
+    total = mine + yours
+    myMoves = popcount(move_masks(own, opp))
+    yourMoves = popcount(move_masks(opp, own))
+    myCorners = popcount(own & CORNER_MASK)
+    yourCorners = popcount(opp & CORNER_MASK)
+
+    piece = (mine - yours) / np.maximum(total, 1)
+    mobility = (myMoves - yourMoves) / np.maximum(myMoves + yourMoves, 1)
+    corner = (myCorners - yourCorners) / 4.0
+
+    # Trọng số theo giai đoạn: đầu game / giữa game / cuối game
+    factors = np.select(
+        [total < 20, total < 40],
+        [0.3 * piece + 0.4 * mobility + 0.3 * corner,
+         0.4 * piece + 0.3 * mobility + 0.3 * corner],
+        0.6 * piece + 0.2 * mobility + 0.2 * corner)
+    combined = 0.7 * factors + 0.3 * (current / 1000.0)
+    probability = np.clip(1 / (1 + np.exp(-combined * 5)), 0.05, 0.95)
+    return probability, 1 - probability
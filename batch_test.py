@@ -0,0 +1,84 @@
+from bitboard import BitBoard
+from board import Board
+from evaluator import Evaluator
+from batch import score_batch, win_probability_batch, stack_boards, \
+    move_masks, popcount
+import math
+import random
+import numpy as np
+import unittest
+from config import WHITE, BLACK
+
+
+def random_boards(count, seed=3):
+    rng = random.Random(seed)
+    boards, players = [], []
+    for _ in range(count):
+        b = Board()
+        color = BLACK
+        for _ in range(rng.randrange(61)):
+            moves = b.get_valid_moves(color)
+            if moves:
+                b.apply_move(rng.choice(moves), color)
+            color = WHITE if color == BLACK else BLACK
+        boards.append(b)
+        players.append(rng.choice((BLACK, WHITE)))
+    return boards, players
+
+
+def win_probability(board, player, opponent):
+    """ Per-board reference: the formula calculate_win_probability used. """
+    whites, blacks, empty = board.count_stones()
+    total = whites + blacks
+    mine, yours = (whites, blacks) if player == WHITE else (blacks, whites)
+    myMoves = len(board.get_valid_moves(player))
+    yourMoves = len(board.get_valid_moves(opponent))
+    corners = [board.board[i][j] for i in (0, 7) for j in (0, 7)]
+    piece = (mine - yours) / max(total, 1)
+    mobility = (myMoves - yourMoves) / max(myMoves + yourMoves, 1)
+    corner = (corners.count(player) - corners.count(opponent)) / 4.0
+    if total < 20:
+        factor = 0.3 * piece + 0.4 * mobility + 0.3 * corner
+    elif total < 40:
+        factor = 0.4 * piece + 0.3 * mobility + 0.3 * corner
+    else:
+        factor = 0.6 * piece + 0.2 * mobility + 0.2 * corner
+    score = Evaluator().score(board, board, 3, player, opponent)
+    combined = 0.7 * factor + 0.3 * score / 1000.0
+    return max(0.05, min(0.95, 1 / (1 + math.exp(-combined * 5))))
+
+
+class TestBatch(unittest.TestCase):
+    def test_scores_match_evaluator(self):
+        boards, players = random_boards(200)
+        evaluator = Evaluator()
+        grid = stack_boards(boards)
+        bits = np.array([[BitBoard.from_board(b).black,
+                          BitBoard.from_board(b).white] for b in boards],
+                        dtype=np.uint64)
+        for depth in (0, 3):
+            expected = [evaluator.score(b, b, depth, p, 3 - p)
+                        for b, p in zip(boards, players)]
+            self.assertEqual(list(score_batch(grid, players, depth)), expected)
+            self.assertEqual(list(score_batch(bits, players, depth)), expected)
+
+    def test_move_masks(self):
+        boards, players = random_boards(50, seed=4)
+        bits = [BitBoard.from_board(b) for b in boards]
+        black = np.array([b.black for b in bits], dtype=np.uint64)
+        white = np.array([b.white for b in bits], dtype=np.uint64)
+        counts = popcount(move_masks(black, white))
+        self.assertEqual(list(counts),
+                         [len(b.get_valid_moves(BLACK)) for b in boards])
+
+    def test_win_probability(self):
+        boards, players = random_boards(200)
+        mine, yours = win_probability_batch(stack_boards(boards), players)
+        for b, p, x, y in zip(boards, players, mine, yours):
+            self.assertAlmostEqual(x, win_probability(b, p, 3 - p))
+            self.assertAlmostEqual(x + y, 1.0)
+        self.assertEqual(Evaluator().calculate_win_probability(
+            boards[0], players[0], 3 - players[0])[0], mine[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,321 @@
+"""
+benchmark.py - ĐO TỐC ĐỘ CÁC ĐƯỜNG NÓNG CỦA BOARD, EVALUATOR, MINIMAX
+
+Mỗi benchmark chạy một thao tác trên bộ vị trí cố định (khai cuộc, trung
+cuộc, tàn cuộc) và báo thời gian trung bình cho một lần gọi. Bộ vị trí
+được sinh bằng nước đi ngẫu nhiên với seed cố định nên giống hệt nhau
+giữa các lần chạy và giữa các máy.
+
+Kết quả ghi ra JSON; chế độ so sánh đọc một file baseline và đánh dấu
+benchmark nào chậm hơn quá ngưỡng (mã thoát 1 nếu có hồi quy).
+
+Chạy từ dòng lệnh:
+    python benchmark.py --out baseline.json
+    python benchmark.py --compare baseline.json --threshold 0.1
+    python benchmark.py --only evaluator --max-depth 4
+"""
+
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+
+from config import BLACK, WHITE
+from board import Board
+from evaluator import Evaluator
+from minimax import Minimax
+from ordering import MoveOrderer
+from winprob import WinProbability
+
+# (giai đoạn, số nước ngẫu nhiên từ vị trí đầu)
+STAGES = (('opening', 6), ('midgame', 24), ('endgame', 46))
+POSITIONS_PER_STAGE = 4
+CORPUS_SEED = 2016
+SEARCH_DEPTHS = (3, 4, 5, 6)
+MIN_TIME = 0.2    # Giây tối thiểu cho mỗi vòng đo
+REPEAT = 3        # Số vòng đo, lấy vòng nhanh nhất
+THRESHOLD = 0.10  # Chậm hơn baseline quá 10% là hồi quy
+
+
+def make_corpus(per_stage=POSITIONS_PER_STAGE, seed=CORPUS_SEED):
+    """
+    BỘ VỊ TRÍ CỐ ĐỊNH
+
+    Returns:
+        list: (giai đoạn, Board, người đi), không có vị trí kết thúc ván
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for stage, plies in STAGES:
+        found = 0
+        while found < per_stage:
+            board = Board()
+            color = BLACK
+            for _ in range(plies):
+                moves = board.get_valid_moves(color)
+                if moves:
+                    board.apply_move(rng.choice(moves), color)
+                color = WHITE if color == BLACK else BLACK
+            if not board.get_valid_moves(color):
+                continue  # Cần vị trí mà người đi có nước đi
+            corpus.append((stage, board, color))
+            found += 1
+    return corpus
+
+
+def _other(color):
+    return WHITE if color == BLACK else BLACK
+
+
+def bench_valid_moves(corpus):
+    def run():
+        for stage, board, color in corpus:
+            board.get_valid_moves(color)
+    return run, len(corpus)
+
+
+def bench_apply_move(corpus):
+    # apply_move đặt và lật quân trên bảng, nên mỗi lần chạy dùng bản sao
+    cases = [(board, color, board.get_valid_moves(color))
+             for stage, board, color in corpus]
+
+    def run():
+        for board, color, moves in cases:
+            for move in moves:
+                child = board.copy()
+                child.valid_moves = moves
+                child.apply_move(move, color)
+    return run, sum(len(moves) for board, color, moves in cases)
+
+
+def bench_flip(corpus):
+    cases = [(board, color, board.get_valid_moves(color))
+             for stage, board, color in corpus]
+
+    def run():
+        for board, color, moves in cases:
+            for move in moves:
+                child = board.copy()
+                for direction in range(1, 9):
+                    child.flip(direction, move, color)
+    return run, 8 * sum(len(moves) for board, color, moves in cases)
+
+
+def bench_next_states(corpus):
+    def run():
+        for stage, board, color in corpus:
+            for child in board.next_states(color):
+                pass
+    return run, len(corpus)
+
+
+def bench_adjacent_count(corpus):
+    def run():
+        for stage, board, color in corpus:
+            board.get_adjacent_count(color)
+    return run, len(corpus)
+
+
+def bench_score(corpus):
+    evaluator = Evaluator()
+    cases = [(board, list(board.next_states(color)), color)
+             for stage, board, color in corpus]
+
+    def run():
+        for parent, children, color in cases:
+            for child in children:
+                evaluator.score(parent, child, 0, _other(color), color)
+    return run, sum(len(children) for parent, children, color in cases)
+
+
+def bench_win_probability(corpus):
+    evaluator = Evaluator()
+
+    def run():
+        for stage, board, color in corpus:
+            evaluator.calculate_win_probability(board, color, _other(color))
+    return run, len(corpus)
+
+
+def bench_win_probability_table(corpus):
+    def run():
+        # Bảng nhớ mới mỗi lượt: đo phần tra bảng, không phải lần tra nhớ
+        estimator = WinProbability()
+        for stage, board, color in corpus:
+            estimator.estimate(board)
+    return run, len(corpus)
+
+
+def _search_corpus(corpus):
+    """Một vị trí cho mỗi giai đoạn: tìm kiếm sâu rất tốn thời gian"""
+    seen = set()
+    cases = []
+    for stage, board, color in corpus:
+        if stage not in seen:
+            seen.add(stage)
+            cases.append((board, color))
+    return cases
+
+
+def bench_minimax(depth):
+    def bench(corpus):
+        evaluator = Evaluator()
+        cases = _search_corpus(corpus)
+
+        def run():
+            for board, color in cases:
+                Minimax(evaluator.score).minimax(board, board, depth, color,
+                                                 _other(color))
+        return run, len(cases)
+    return bench
+
+
+def bench_search(depth):
+    def bench(corpus):
+        evaluator = Evaluator()
+        cases = _search_corpus(corpus)
+
+        def run():
+            for board, color in cases:
+                Minimax(evaluator.score, orderer=MoveOrderer()).search(
+                    board.copy(), depth, color, _other(color))
+        return run, len(cases)
+    return bench
+
+
+BENCHMARKS = [
+    ('board.get_valid_moves', bench_valid_moves),
+    ('board.apply_move', bench_apply_move),
+    ('board.flip', bench_flip),
+    ('board.next_states', bench_next_states),
+    ('board.get_adjacent_count', bench_adjacent_count),
+    ('evaluator.score', bench_score),
+    ('evaluator.calculate_win_probability', bench_win_probability),
+    ('winprob.estimate', bench_win_probability_table),
+]
+for _depth in SEARCH_DEPTHS:
+    BENCHMARKS.append(('minimax.minimax.d%d' % _depth, bench_minimax(_depth)))
+    BENCHMARKS.append(('minimax.search.d%d' % _depth, bench_search(_depth)))
+
+
+def measure(bench, corpus, min_time=MIN_TIME, repeat=REPEAT):
+    """
+    ĐO MỘT BENCHMARK
+
+    Mỗi vòng lặp lại thao tác tới khi đủ min_time giây; lấy vòng nhanh
+    nhất trong 'repeat' vòng (ít bị nhiễu bởi tiến trình khác nhất).
+
+    Returns:
+        dict: seconds (giây mỗi lần gọi), ops (số lần gọi mỗi lượt chạy),
+        loops (số lượt chạy mỗi vòng)
+    """
+    run, ops = bench(corpus)
+    best = None
+    loops = 0
+    for _ in range(repeat):
+        loops = 0
+        start = time.perf_counter()
+        while True:
+            run()
+            loops += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        perOp = elapsed / (loops * ops)
+        if best is None or perOp < best:
+            best = perOp
+    return {'seconds': best, 'ops': ops, 'loops': loops}
+
+
+def run_benchmarks(only=None, max_depth=max(SEARCH_DEPTHS),
+                   min_time=MIN_TIME, repeat=REPEAT, echo=None):
+    """
+    CHẠY CÁC BENCHMARK
+
+    Args:
+        only: Chỉ chạy benchmark có tên chứa chuỗi này (None = tất cả)
+        max_depth: Bỏ qua benchmark tìm kiếm sâu hơn độ sâu này
+        echo: Hàm nhận (tên, kết quả) sau mỗi benchmark, ví dụ để in ra
+
+    Returns:
+        dict: Dạng ghi ra JSON - meta và results[tên] = kết quả measure()
+    """
+    corpus = make_corpus()
+    results = {}
+    for name, bench in BENCHMARKS:
+        if only is not None and only not in name:
+            continue
+        if '.d' in name and int(name.rsplit('.d', 1)[1]) > max_depth:
+            continue
+        results[name] = measure(bench, corpus, min_time, repeat)
+        if echo is not None:
+            echo(name, results[name])
+    return {'meta': {'python': platform.python_version(),
+                     'platform': platform.platform(),
+                     'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                     'corpus': len(corpus)},
+            'results': results}
+
+
+def compare(current, baseline, threshold=THRESHOLD):
+    """
+    SO SÁNH VỚI BASELINE
+
+    Returns:
+        list: (tên, giây baseline, giây hiện tại, tỉ lệ, hồi quy?) cho mọi
+        benchmark có trong cả hai
+    """
+    rows = []
+    for name, result in current['results'].items():
+        if name not in baseline['results']:
+            continue
+        before = baseline['results'][name]['seconds']
+        ratio = result['seconds'] / before if before else float('inf')
+        rows.append((name, before, result['seconds'], ratio,
+                     ratio > 1 + threshold))
+    return rows
+
+
+def _format_time(seconds):
+    if seconds >= 1:
+        return '%.3fs' % seconds
+    if seconds >= 1e-3:
+        return '%.3fms' % (seconds * 1e3)
+    return '%.2fus' % (seconds * 1e6)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Hot path benchmarks.')
+    parser.add_argument('--out', help='write results to this JSON file')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='flag regressions against this JSON file')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='slowdown ratio counted as a regression')
+    parser.add_argument('--only', help='run benchmarks whose name contains this')
+    parser.add_argument('--max-depth', type=int, default=max(SEARCH_DEPTHS))
+    parser.add_argument('--min-time', type=float, default=MIN_TIME)
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    args = parser.parse_args()
+
+    def echo(name, result):
+        print('%-40s %12s' % (name, _format_time(result['seconds'])))
+
+    current = run_benchmarks(args.only, args.max_depth, args.min_time,
+                             args.repeat, echo)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print()
+        regressions = 0
+        for name, before, after, ratio, regressed in compare(
+                current, baseline, args.threshold):
+            regressions += regressed
+            print('%-40s %12s %12s %+7.1f%%%s' % (
+                name, _format_time(before), _format_time(after),
+                100 * (ratio - 1), '  REGRESSION' if regressed else ''))
+        sys.exit(1 if regressions else 0)
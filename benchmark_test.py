@@ -0,0 +1,42 @@
+from benchmark import make_corpus, measure, run_benchmarks, compare, \
+    bench_valid_moves, STAGES
+import json
+import unittest
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_corpus_is_fixed(self):
+        first = make_corpus(2)
+        second = make_corpus(2)
+        self.assertEqual(len(first), 2 * len(STAGES))
+        for (stage, a, ca), (_, b, cb) in zip(first, second):
+            self.assertEqual(a.board, b.board)
+            self.assertEqual(ca, cb)
+            self.assertTrue(a.get_valid_moves(ca))
+
+    def test_measure(self):
+        result = measure(bench_valid_moves, make_corpus(1), 0.01, 1)
+        self.assertGreater(result['seconds'], 0)
+        self.assertEqual(result['ops'], len(STAGES))
+
+    def test_run_is_json(self):
+        current = run_benchmarks('get_adjacent', min_time=0.01, repeat=1)
+        self.assertEqual(list(current['results']), ['board.get_adjacent_count'])
+        json.dumps(current)
+        skipped = run_benchmarks('minimax.search', max_depth=2)
+        self.assertEqual(skipped['results'], {})
+
+    def test_compare_flags_regressions(self):
+        baseline = {'results': {'a': {'seconds': 1.0}, 'b': {'seconds': 1.0},
+                                'gone': {'seconds': 1.0}}}
+        current = {'results': {'a': {'seconds': 1.05}, 'b': {'seconds': 1.5},
+                               'new': {'seconds': 1.0}}}
+        rows = {row[0]: row for row in compare(current, baseline, 0.1)}
+        self.assertEqual(sorted(rows), ['a', 'b'])
+        self.assertFalse(rows['a'][4])
+        self.assertTrue(rows['b'][4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,349 @@
+"""
+bitboard.py - BẢNG CỜ OTHELLO DẠNG BITBOARD
+
+Biểu diễn thay thế cho board.Board: mỗi màu quân là một số nguyên 64 bit,
+bit thứ (row * 8 + col) bật khi ô (row, col) có quân của màu đó.
+
+Mọi phép toán đều dùng dịch bit và mặt nạ (shift-and-mask):
+- Tìm nước đi hợp lệ: lan theo 8 hướng qua chuỗi quân đối phương
+- Lật quân: đi theo từng hướng từ ô vừa đặt
+- Đếm quân, đếm ô trống kề bên: popcount
+
+Giữ nguyên API công khai của board.Board (get_valid_moves, apply_move,
+count_stones, next_states, game_ended, ...) để Minimax và Evaluator dùng
+được mà không cần sửa.
+"""
+
+from config import WHITE, BLACK, EMPTY  # Hằng số màu quân cờ
+from zobrist import mask_key            # Khóa Zobrist cho bảng chuyển vị
+
+FULL = 0xFFFFFFFFFFFFFFFF    # Mặt nạ 64 bit
+NOT_A = 0xFEFEFEFEFEFEFEFE   # Mọi ô trừ cột 0
+NOT_H = 0x7F7F7F7F7F7F7F7F   # Mọi ô trừ cột 7
+INNER = 0x7E7E7E7E7E7E7E7E   # Mọi ô trừ cột 0 và cột 7
+
+# 8 hướng dịch bit: (số bit dịch, mặt nạ loại bỏ ô bị tràn sang hàng khác)
+# Dịch trái: Đông (+1), Nam (+8), Đông Nam (+9), Tây Nam (+7)
+LEFT_SHIFTS = ((1, NOT_A), (8, FULL), (9, NOT_A), (7, NOT_H))
+# Dịch phải: Tây (-1), Bắc (-8), Tây Bắc (-9), Đông Bắc (-7)
+RIGHT_SHIFTS = ((1, NOT_H), (8, FULL), (9, NOT_H), (7, NOT_A))
+
+# Bit khởi đầu chuẩn: Đen ở [3,4] và [4,3], Trắng ở [3,3] và [4,4]
+START_BLACK = (1 << 28) | (1 << 35)
+START_WHITE = (1 << 27) | (1 << 36)
+START_HASH = mask_key(BLACK, START_BLACK) ^ mask_key(WHITE, START_WHITE)
+
+
+def square_bit(move):
+    """Chuyển (row, col) thành bit tương ứng"""
+    return 1 << (move[0] * 8 + move[1])
+
+
+def bits_to_moves(bits):
+    """Chuyển mặt nạ bit thành danh sách (row, col) theo thứ tự ô tăng dần"""
+    moves = []
+    while bits:
+        low = bits & -bits
+        sq = low.bit_length() - 1
+        moves.append((sq >> 3, sq & 7))
+        bits ^= low
+    return moves
+
+
+def move_mask(own, opp):
+    """
+    TÌM TẤT CẢ NƯỚC ĐI HỢP LỆ BẰNG DỊCH BIT
+
+    Với mỗi hướng: bắt đầu từ quân của mình, lan qua chuỗi quân đối phương
+    liên tiếp (tối đa 6 quân), ô trống ngay sau chuỗi là nước đi hợp lệ.
+    Quân đối phương ở cột 0 và cột 7 không thể nằm giữa chuỗi theo hướng
+    ngang/chéo, nên mặt nạ INNER vừa chặn tràn hàng vừa đủ cho cả 2 chiều.
+
+    Returns:
+        int: Mặt nạ các ô có thể đặt quân
+    """
+    empty = ~(own | opp) & FULL
+    inner = opp & INNER
+    moves = 0
+    for shift, mask in ((1, inner), (8, opp), (9, inner), (7, inner)):
+        x = (own << shift) & mask
+        x |= (x << shift) & mask
+        x |= (x << shift) & mask
+        x |= (x << shift) & mask
+        x |= (x << shift) & mask
+        x |= (x << shift) & mask
+        moves |= x << shift
+        x = (own >> shift) & mask
+        x |= (x >> shift) & mask
+        x |= (x >> shift) & mask
+        x |= (x >> shift) & mask
+        x |= (x >> shift) & mask
+        x |= (x >> shift) & mask
+        moves |= x >> shift
+    return moves & empty
+
+
+def flip_mask(bit, own, opp):
+    """
+    TÍNH CÁC QUÂN BỊ LẬT KHI ĐẶT QUÂN TẠI 'bit'
+
+    Đi theo từng hướng qua các quân đối phương; chỉ lật nếu cuối chuỗi
+    là quân cùng màu.
+
+    Returns:
+        int: Mặt nạ các quân đối phương bị lật
+    """
+    flips = 0
+    for shift, mask in LEFT_SHIFTS:
+        run = 0
+        x = (bit << shift) & mask
+        while x & opp:
+            run |= x
+            x = (x << shift) & mask
+        if x & own:
+            flips |= run
+    for shift, mask in RIGHT_SHIFTS:
+        run = 0
+        x = (bit >> shift) & mask
+        while x & opp:
+            run |= x
+            x = (x >> shift) & mask
+        if x & own:
+            flips |= run
+    return flips
+
+
+def move_key(color, bit, flips):
+    """
+    THAY ĐỔI HASH ZOBRIST KHI 'color' ĐẶT QUÂN TẠI 'bit' VÀ LẬT 'flips'
+
+    Dùng được cho cả thực hiện lẫn hoàn tác nước đi (XOR tự nghịch đảo).
+    """
+    other = BLACK if color == WHITE else WHITE
+    return mask_key(color, bit | flips) ^ mask_key(other, flips)
+
+
+def adjacent_count(own, opp):
+    """
+    ĐẾM CẶP (QUÂN, Ô TRỐNG KỀ BÊN) - GIỐNG Board.get_adjacent_count
+
+    Dịch quân của mình theo từng hướng rồi giao với ô trống: mỗi bit còn
+    lại ứng với đúng một cặp (quân, ô trống kề theo hướng đó).
+    """
+    empty = ~(own | opp) & FULL
+    count = 0
+    for shift, mask in LEFT_SHIFTS:
+        count += ((own << shift) & mask & empty).bit_count()
+    for shift, mask in RIGHT_SHIFTS:
+        count += ((own >> shift) & mask & empty).bit_count()
+    return count
+
+
+class BitBoard:
+
+    """
+    LỚP BITBOARD - CÙNG API VỚI board.Board NHƯNG DÙNG 2 SỐ NGUYÊN 64 BIT
+
+    Thuộc tính:
+        black, white: Mặt nạ bit quân đen / quân trắng
+        valid_moves: Danh sách nước đi hợp lệ lần gần nhất
+        board: Lưới 8x8 (tính khi cần, dùng cho Evaluator và giao diện)
+    """
+
+    def __init__(self):
+        """KHỞI TẠO VỊ TRÍ CHUẨN VỚI 4 QUÂN Ở GIỮA"""
+        self.black = START_BLACK
+        self.white = START_WHITE
+        self.valid_moves = []
+        self.hash = START_HASH  # Hash Zobrist, cập nhật mỗi khi đặt/lật quân
+        self._grid = None  # Lưới 8x8 cache, xóa mỗi khi bảng thay đổi
+
+    @classmethod
+    def from_board(cls, other):
+        """
+        TẠO BITBOARD TỪ MỘT BẢNG DẠNG LƯỚI 8x8
+
+        Args:
+            other: board.Board (hoặc bất kỳ đối tượng có thuộc tính .board)
+        """
+        new = cls()
+        new.black = 0
+        new.white = 0
+        for i in range(8):
+            row = other.board[i]
+            for j in range(8):
+                if row[j] == BLACK:
+                    new.black |= 1 << (i * 8 + j)
+                elif row[j] == WHITE:
+                    new.white |= 1 << (i * 8 + j)
+        new.hash = mask_key(BLACK, new.black) ^ mask_key(WHITE, new.white)
+        return new
+
+    def copy(self):
+        """Bản copy nhẹ (chỉ 2 số nguyên), thay cho deepcopy"""
+        new = BitBoard.__new__(BitBoard)
+        new.black = self.black
+        new.white = self.white
+        new.valid_moves = []
+        new.hash = self.hash
+        new._grid = None
+        return new
+
+    def bits(self, color):
+        """Trả về (quân của color, quân đối phương) dạng mặt nạ bit"""
+        if color == BLACK:
+            return self.black, self.white
+        return self.white, self.black
+
+    @property
+    def board(self):
+        """Lưới 8x8 tương thích với board.Board.board (chỉ đọc)"""
+        if self._grid is None:
+            grid = [[EMPTY] * 8 for _ in range(8)]
+            for i, j in bits_to_moves(self.black):
+                grid[i][j] = BLACK
+            for i, j in bits_to_moves(self.white):
+                grid[i][j] = WHITE
+            self._grid = grid
+        return self._grid
+
+    def __getitem__(self, i, j):
+        """Truy cập phần tử board[i][j]"""
+        return self.board[i][j]
+
+    def get_valid_moves(self, color):
+        """
+        TÌM TẤT CẢ NƯỚC ĐI HỢP LỆ CHO MỘT MÀU QUÂN
+
+        Returns:
+            List các vị trí (row, col), lưu vào self.valid_moves
+        """
+        own, opp = self.bits(color)
+        places = bits_to_moves(move_mask(own, opp))
+        self.valid_moves = places
+        return places
+
+    def apply_move(self, move, color):
+        """
+        THỰC HIỆN NƯỚC ĐI VÀ LẬT QUÂN (nước đi phải nằm trong valid_moves)
+        """
+        if move in self.valid_moves:
+            bit = square_bit(move)
+            own, opp = self.bits(color)
+            flips = flip_mask(bit, own, opp)
+            own |= bit | flips
+            opp &= ~flips
+            if color == BLACK:
+                self.black, self.white = own, opp
+            else:
+                self.white, self.black = own, opp
+            self.hash ^= move_key(color, bit, flips)
+            self._grid = None
+
+    def make_move(self, move, color):
+        """
+        THỰC HIỆN NƯỚC ĐI KHÔNG KIỂM TRA valid_moves - DÀNH CHO TÌM KIẾM
+
+        Returns:
+            tuple (bit, flips): Bit ô vừa đặt và mặt nạ quân bị lật,
+            dùng cho unmake_move()
+        """
+        bit = square_bit(move)
+        if color == BLACK:
+            flips = flip_mask(bit, self.black, self.white)
+            self.black |= bit | flips
+            self.white &= ~flips
+        else:
+            flips = flip_mask(bit, self.white, self.black)
+            self.white |= bit | flips
+            self.black &= ~flips
+        self.hash ^= move_key(color, bit, flips)
+        self._grid = None
+        return (bit, flips)
+
+    def unmake_move(self, undo):
+        """HOÀN TÁC NƯỚC ĐI CỦA make_move()"""
+        bit, flips = undo
+        if self.black & bit:
+            self.black &= ~(bit | flips)
+            self.white |= flips
+            self.hash ^= move_key(BLACK, bit, flips)
+        else:
+            self.white &= ~(bit | flips)
+            self.black |= flips
+            self.hash ^= move_key(WHITE, bit, flips)
+        self._grid = None
+
+    def get_changes(self):
+        """Trả về (board, blacks, whites) cho giao diện"""
+        whites, blacks, empty = self.count_stones()
+        return (self.board, blacks, whites)
+
+    def game_ended(self):
+        """
+        KIỂM TRA GAME KẾT THÚC: bảng đầy, một bên hết quân,
+        hoặc cả 2 bên đều không có nước đi
+        """
+        if not self.black or not self.white or not (~(self.black | self.white) & FULL):
+            return True
+        if not move_mask(self.black, self.white) and \
+           not move_mask(self.white, self.black):
+            return True
+        return False
+
+    def print_board(self):
+        """In bảng cờ ra console - dành cho debug"""
+        for i in range(8):
+            print(i, ' |', end=' ')
+            for j in range(8):
+                bit = 1 << (i * 8 + j)
+                if self.black & bit:
+                    print('B', end=' ')
+                elif self.white & bit:
+                    print('W', end=' ')
+                else:
+                    print(' ', end=' ')
+                print('|', end=' ')
+            print()
+
+    def count_stones(self):
+        """
+        ĐẾM QUÂN BẰNG POPCOUNT
+
+        Returns:
+            tuple (whites, blacks, empty)
+        """
+        whites = self.white.bit_count()
+        blacks = self.black.bit_count()
+        return whites, blacks, 64 - whites - blacks
+
+    def compare(self, otherBoard):
+        """Giữ nguyên hành vi của Board.compare (trả về otherBoard)"""
+        return otherBoard
+
+    def get_adjacent_count(self, color):
+        """ĐẾM SỐ Ô TRỐNG KỀ BÊN QUÂN CÙNG MÀU (có tính lặp như Board)"""
+        own, opp = self.bits(color)
+        return adjacent_count(own, opp)
+
+    def next_states(self, color):
+        """
+        TẠO TẤT CẢ BẢNG CỜ SAU 1 NƯỚC ĐI - CHO MINIMAX
+
+        Yields:
+            BitBoard: Các trạng thái sau mỗi nước đi hợp lệ
+        """
+        own, opp = self.bits(color)
+        moves = move_mask(own, opp)
+        self.valid_moves = bits_to_moves(moves)
+        while moves:
+            bit = moves & -moves
+            moves ^= bit
+            flips = flip_mask(bit, own, opp)
+            newBoard = self.copy()
+            if color == BLACK:
+                newBoard.black, newBoard.white = own | bit | flips, opp & ~flips
+            else:
+                newBoard.white, newBoard.black = own | bit | flips, opp & ~flips
+            newBoard.hash ^= move_key(color, bit, flips)
+            yield newBoard
@@ -0,0 +1,55 @@
+from board import Board
+from bitboard import BitBoard
+import random
+import unittest
+from config import WHITE, BLACK
+
+
+class TestBitBoard(unittest.TestCase):
+    def test_start_position(self):
+        b = BitBoard()
+        self.assertEqual(b.board, Board().board)
+        self.assertEqual(b.count_stones(), (2, 2, 60))
+        self.assertEqual(b.get_valid_moves(BLACK), [(2, 3), (3, 2), (4, 5), (5, 4)])
+
+    def test_matches_list_board(self):
+        rng = random.Random(7)
+        for _ in range(20):
+            b = Board()
+            bb = BitBoard()
+            color = BLACK
+            while not b.game_ended():
+                with self.subTest():
+                    moves = sorted(b.get_valid_moves(color))
+                    self.assertEqual(bb.get_valid_moves(color), moves)
+                    self.assertEqual(bb.count_stones(), b.count_stones())
+                    for c in (BLACK, WHITE):
+                        self.assertEqual(bb.get_adjacent_count(c),
+                                         b.get_adjacent_count(c))
+                if moves:
+                    move = rng.choice(moves)
+                    b.apply_move(move, color)
+                    bb.apply_move(move, color)
+                    self.assertEqual(bb.board, b.board)
+                color = WHITE if color == BLACK else BLACK
+            self.assertTrue(bb.game_ended())
+
+    def test_make_unmake_move(self):
+        b = BitBoard()
+        for move in b.get_valid_moves(BLACK):
+            undo = b.make_move(move, BLACK)
+            expected = Board()
+            expected.get_valid_moves(BLACK)
+            expected.apply_move(move, BLACK)
+            self.assertEqual(b.board, expected.board)
+            b.unmake_move(undo)
+            self.assertEqual((b.black, b.white), (BitBoard().black, BitBoard().white))
+
+    def test_next_states(self):
+        b = BitBoard()
+        states = [s.board for s in b.next_states(BLACK)]
+        expected = [s.board for s in Board().next_states(BLACK)]
+        self.assertEqual(sorted(states), sorted(expected))
+
+if __name__ == '__main__':
+    unittest.main()
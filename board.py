@@ -12,7 +12,62 @@ File này chứa tất cả các quy tắc và logic của game:
 """
 
 from config import WHITE, BLACK, EMPTY  # Hằng số màu quân cờ
-from copy import deepcopy               # Sao chép sâu để tạo bản copy board
+from zobrist import SQUARE_KEYS, grid_hash  # Khóa Zobrist cho bảng chuyển vị
+
+# 8 hướng (hàng, cột) theo thứ tự: Bắc, Đông Bắc, Đông, Đông Nam,
+# Nam, Tây Nam, Tây, Tây Bắc
+DIRECTIONS = [(-1, 0), (-1, 1), (0, 1), (1, 1),
+              (1, 0), (1, -1), (0, -1), (-1, -1)]
+DIRECTION_INDEX = {d: index for index, d in enumerate(DIRECTIONS)}
+
+
+def build_rays():
+    """
+    TÍNH TRƯỚC CÁC TIA (RAY) TỪ MỖI Ô THEO 8 HƯỚNG - CHẠY 1 LẦN KHI IMPORT
+
+    RAYS[row][col][d] là tuple các ô (i, j) theo thứ tự đi ra từ (row, col)
+    theo hướng DIRECTIONS[d], dừng ở mép bảng. Nhờ vậy check_direction,
+    flip, make_move chỉ cần duyệt tuple, không phải kiểm tra giới hạn bảng.
+    """
+    rays = []
+    for row in range(8):
+        rays_row = []
+        for column in range(8):
+            square_rays = []
+            for row_add, column_add in DIRECTIONS:
+                ray = []
+                i = row + row_add
+                j = column + column_add
+                while 0 <= i < 8 and 0 <= j < 8:
+                    ray.append((i, j))
+                    i += row_add
+                    j += column_add
+                square_rays.append(tuple(ray))
+            rays_row.append(tuple(square_rays))
+        rays.append(tuple(rays_row))
+    return tuple(rays)
+
+
+RAYS = build_rays()
+
+
+def flip_count(board, ray, color, other):
+    """
+    SỐ QUÂN BỊ LẬT TRÊN MỘT TIA KHI 'color' ĐẶT QUÂN Ở ĐẦU TIA
+
+    Đếm chuỗi quân đối phương liên tiếp; chỉ hợp lệ khi cuối chuỗi là quân
+    cùng màu, ngược lại trả về 0.
+    """
+    count = 0
+    for i, j in ray:
+        cell = board[i][j]
+        if cell == other:
+            count += 1
+        elif cell == color:
+            return count
+        else:
+            return 0
+    return 0
 
 
 class Board:
@@ -53,6 +108,8 @@ class Board:
         self.board[4][4] = WHITE  # Trắng ở [4,4]
 
         self.valid_moves = []  # Danh sách nước đi hợp lệ (được cập nhật mỗi lượt)
+        self.hash = grid_hash(self.board)  # Hash Zobrist, cập nhật mỗi khi đặt/lật quân
+        self.features = None  # FeatureTracker khi đánh giá tăng dần (evaluator.py)
 
     def __getitem__(self, i, j):
         """Truy cập phần tử board[i][j] - hỗ trợ cú pháp board[i,j]"""
@@ -87,23 +144,19 @@ class Board:
         if row < 0 or row > 7 or column < 0 or column > 7:
             return places
 
-        # Kiểm tra theo 8 hướng từ vị trí hiện tại
-        # (-1,0)=Bắc, (-1,1)=Đông Bắc, (0,1)=Đông, (1,1)=Đông Nam
-        # (1,0)=Nam, (1,-1)=Tây Nam, (0,-1)=Tây, (-1,-1)=Tây Bắc
-        for (x, y) in [
-                (-1, 0),   # Bắc
-                (-1, 1),   # Đông Bắc
-                (0, 1),    # Đông
-                (1, 1),    # Đông Nam
-                (1, 0),    # Nam
-                (1, -1),   # Tây Nam
-                (0, -1),   # Tây
-                (-1, -1)   # Tây Bắc
-            ]:
-            # Kiểm tra hướng này có vị trí hợp lệ không
-            pos = self.check_direction(row, column, x, y, other)
-            if pos:
-                places.append(pos)
+        # Kiểm tra theo 8 tia tính sẵn từ vị trí hiện tại
+        # (thứ tự: Bắc, Đông Bắc, Đông, Đông Nam, Nam, Tây Nam, Tây, Tây Bắc)
+        board = self.board
+        for ray in RAYS[row][column]:
+            # Ô đầu tiên phải là quân đối phương
+            if len(ray) < 2 or board[ray[0][0]][ray[0][1]] != other:
+                continue
+            # Đi qua chuỗi quân đối phương, ô dừng lại phải là ô trống
+            for i, j in ray:
+                if board[i][j] != other:
+                    if board[i][j] == EMPTY:
+                        places.append((i, j))
+                    break
         return places
 
     def check_direction(self, row, column, row_add, column_add, other_color):
@@ -119,21 +172,18 @@ class Board:
         Returns:
             (i, j) nếu tìm thấy vị trí hợp lệ, None nếu không
         """
-        i = row + row_add      # Vị trí hàng tiếp theo
-        j = column + column_add # Vị trí cột tiếp theo
+        ray = RAYS[row][column][DIRECTION_INDEX[(row_add, column_add)]]
+        board = self.board
 
         # Bước 1: Kiểm tra ô đầu tiên có phải là quân đối phương không
-        if (i >= 0 and j >= 0 and i < 8 and j < 8 and self.board[i][j] == other_color):
+        if len(ray) > 1 and board[ray[0][0]][ray[0][1]] == other_color:
             # Bước 2: Tiếp tục đi qua tất cả quân đối phương liên tiếp
-            i += row_add
-            j += column_add
-            while (i >= 0 and j >= 0 and i < 8 and j < 8 and self.board[i][j] == other_color):
-                i += row_add
-                j += column_add
-
-            # Bước 3: Kiểm tra ô cuối có trống không (nước đi hợp lệ)
-            if (i >= 0 and j >= 0 and i < 8 and j < 8 and self.board[i][j] == EMPTY):
-                return (i, j)  # Trả về vị trí có thể đặt quân
+            for i, j in ray:
+                if board[i][j] != other_color:
+                    # Bước 3: Ô cuối là ô trống -> nước đi hợp lệ
+                    if board[i][j] == EMPTY:
+                        return (i, j)  # Trả về vị trí có thể đặt quân
+                    return None
 
     def get_valid_moves(self, color):
         """
@@ -167,7 +217,7 @@ class Board:
                 # Nếu tìm thấy quân cùng màu
                 if self.board[i][j] == color:
                     # Tìm tất cả vị trí hợp lệ từ quân này
-                    places = places + self.lookup(i, j, color)
+                    places.extend(self.lookup(i, j, color))
 
         # Loại bỏ các vị trí trùng lặp (dùng set rồi chuyển về list)
         places = list(set(places))
@@ -191,6 +241,7 @@ class Board:
         if move in self.valid_moves:
             # Đặt quân vào vị trí được chọn
             self.board[move[0]][move[1]] = color
+            self.hash ^= SQUARE_KEYS[color][move[0] * 8 + move[1]]
 
             # Lật quân theo 8 hướng (1=Bắc, 2=ĐB, 3=Đông, ..., 8=TB)
             for i in range(1, 9):
@@ -210,68 +261,89 @@ class Board:
             position: Vị trí vừa đặt quân (row, col)
             color: Màu quân vừa đặt
         """
-        # Xác định vector di chuyển theo hướng
-        if direction == 1:
-            # Bắc: lên trên
-            row_inc = -1
-            col_inc = 0
-        elif direction == 2:
-            # Đông Bắc: lên trên, sang phải
-            row_inc = -1
-            col_inc = 1
-        elif direction == 3:
-            # Đông: sang phải
-            row_inc = 0
-            col_inc = 1
-        elif direction == 4:
-            # Đông Nam: xuống dưới, sang phải
-            row_inc = 1
-            col_inc = 1
-        elif direction == 5:
-            # Nam: xuống dưới
-            row_inc = 1
-            col_inc = 0
-        elif direction == 6:
-            # Tây Nam: xuống dưới, sang trái
-            row_inc = 1
-            col_inc = -1
-        elif direction == 7:
-            # Tây: sang trái
-            row_inc = 0
-            col_inc = -1
-        elif direction == 8:
-            # Tây Bắc: lên trên, sang trái
-            row_inc = -1
-            col_inc = -1
-
-        places = []  # Danh sách quân sẽ bị lật
-        i = position[0] + row_inc  # Vị trí hàng tiếp theo
-        j = position[1] + col_inc  # Vị trí cột tiếp theo
-
         # Xác định màu đối phương
         if color == WHITE:
             other = BLACK
         else:
             other = WHITE
 
-        # Kiểm tra ô đầu tiên có phải là quân đối phương không
-        if i in range(8) and j in range(8) and self.board[i][j] == other:
-            # Có ít nhất 1 quân đối phương để lật
-            places = places + [(i, j)]
-            i = i + row_inc
-            j = j + col_inc
-
-            # Tiếp tục tìm thêm quân đối phương
-            while i in range(8) and j in range(8) and self.board[i][j] == other:
-                places = places + [(i, j)]
-                i = i + row_inc
-                j = j + col_inc
-
-            # Kiểm tra cuối chuỗi có phải quân cùng màu không
-            if i in range(8) and j in range(8) and self.board[i][j] == color:
-                # Tìm thấy quân cùng màu -> lật tất cả quân ở giữa
-                for pos in places:
-                    self.board[pos[0]][pos[1]] = color  # Lật quân
+        # Tia tính sẵn theo hướng (direction 1..8 ứng với DIRECTIONS[0..7])
+        ray = RAYS[position[0]][position[1]][direction - 1]
+        count = flip_count(self.board, ray, color, other)
+
+        # Lật count quân đầu tiên trên tia (0 nếu hướng này không lật được)
+        for k in range(count):
+            i, j = ray[k]
+            self.board[i][j] = color  # Lật quân
+            # Cập nhật hash: bỏ khóa màu cũ, thêm khóa màu mới
+            self.hash ^= SQUARE_KEYS[other][i * 8 + j] ^ SQUARE_KEYS[color][i * 8 + j]
+
+    def make_move(self, move, color):
+        """
+        THỰC HIỆN NƯỚC ĐI TRỰC TIẾP TRÊN BẢNG - DÀNH CHO TÌM KIẾM AI
+
+        Khác apply_move():
+        - Không kiểm tra valid_moves (người gọi phải truyền nước đi hợp lệ)
+        - Trả về bản ghi hoàn tác để unmake_move() khôi phục bảng
+        => Minimax duyệt cây trên một bảng duy nhất, không cần deepcopy
+
+        Args:
+            move: Tuple (row, col) vị trí đặt quân
+            color: Màu quân (BLACK hoặc WHITE)
+
+        Returns:
+            tuple (move, flipped): Ô vừa đặt và danh sách ô bị lật
+        """
+        other = BLACK if color == WHITE else WHITE
+        board = self.board
+        row, column = move
+        flipped = []
+
+        for ray in RAYS[row][column]:
+            count = flip_count(board, ray, color, other)
+            if count:
+                flipped.extend(ray[:count])
+
+        board[row][column] = color
+        key = SQUARE_KEYS[color][row * 8 + column]
+        for i, j in flipped:
+            board[i][j] = color
+            key ^= SQUARE_KEYS[other][i * 8 + j] ^ SQUARE_KEYS[color][i * 8 + j]
+        self.hash ^= key
+        if self.features is not None:
+            self.features.make(board, move, flipped, color)
+        return (move, flipped)
+
+    def unmake_move(self, undo):
+        """
+        HOÀN TÁC NƯỚC ĐI CỦA make_move()
+
+        Args:
+            undo: Bản ghi (move, flipped) do make_move() trả về
+        """
+        move, flipped = undo
+        board = self.board
+        color = board[move[0]][move[1]]
+        other = BLACK if color == WHITE else WHITE
+        key = SQUARE_KEYS[color][move[0] * 8 + move[1]]
+        for i, j in flipped:
+            board[i][j] = other  # Trả quân bị lật về màu cũ
+            key ^= SQUARE_KEYS[other][i * 8 + j] ^ SQUARE_KEYS[color][i * 8 + j]
+        board[move[0]][move[1]] = EMPTY
+        self.hash ^= key
+        if self.features is not None:
+            self.features.unmake()
+
+    def copy(self):
+        """
+        BẢN COPY NHẸ CỦA BẢNG (chỉ copy 8 hàng, không dùng deepcopy)
+        """
+        newBoard = Board.__new__(Board)
+        newBoard.board = [row[:] for row in self.board]
+        newBoard.valid_moves = []
+        newBoard.hash = self.hash
+        newBoard.features = None
+        return newBoard
 
     def get_changes(self):
         """
@@ -420,7 +492,7 @@ class Board:
         Đây là generator (iterator) hiệu quả:
         1. Lấy tất cả nước đi hợp lệ
         2. Với mỗi nước đi:
-           - Tạo bản copy của bảng hiện tại
+           - Tạo bản copy nhẹ của bảng hiện tại (copy(), không deepcopy)
            - Thực hiện nước đi trên bản copy
            - Yield bảng mới (không lưu hết vào memory)
 
@@ -434,6 +506,6 @@ class Board:
         """
         valid_moves = self.get_valid_moves(color)  # Lấy nước đi hợp lệ
         for move in valid_moves:
-            newBoard = deepcopy(self)          # Tạo bản copy
-            newBoard.apply_move(move, color)   # Thực hiện nước đi
+            newBoard = self.copy()             # Tạo bản copy nhẹ (không deepcopy)
+            newBoard.make_move(move, color)    # Thực hiện nước đi
             yield newBoard                     # Trả về bảng mới
@@ -1,4 +1,7 @@
 from board import Board
+from bitboard import BitBoard
+from zobrist import grid_hash
+import random
 import unittest
 from config import WHITE, BLACK, EMPTY
 
@@ -15,5 +18,45 @@ class TestBoard(unittest.TestCase):
                 b = Board()
                 (row, column, color) = input
                 self.assertEqual(b.lookup(row, column, color), expected)
+
+    def test_make_unmake_move(self):
+        rng = random.Random(3)
+        b = Board()
+        color = BLACK
+        while not b.game_ended():
+            moves = b.get_valid_moves(color)
+            if moves:
+                for move in moves:
+                    before = [row[:] for row in b.board]
+                    expected = b.copy()
+                    expected.get_valid_moves(color)
+                    expected.apply_move(move, color)
+                    undo = b.make_move(move, color)
+                    self.assertEqual(b.board, expected.board)
+                    b.unmake_move(undo)
+                    self.assertEqual(b.board, before)
+                b.make_move(rng.choice(moves), color)
+            color = WHITE if color == BLACK else BLACK
+
+    def test_incremental_hash(self):
+        rng = random.Random(11)
+        b = Board()
+        bb = BitBoard()
+        color = BLACK
+        while not b.game_ended():
+            moves = b.get_valid_moves(color)
+            if moves:
+                move = rng.choice(moves)
+                undo = b.make_move(move, color)
+                self.assertEqual(b.hash, grid_hash(b.board))
+                b.unmake_move(undo)
+                self.assertEqual(b.hash, grid_hash(b.board))
+                b.apply_move(move, color)
+                bb.get_valid_moves(color)
+                bb.apply_move(move, color)
+                self.assertEqual(b.hash, grid_hash(b.board))
+                self.assertEqual(bb.hash, b.hash)
+            color = WHITE if color == BLACK else BLACK
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
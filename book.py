@@ -0,0 +1,237 @@
+"""
+book.py - SÁCH KHAI CUỘC (OPENING BOOK)
+
+Ở 10-15 nước đầu, các ván thường lặp lại cùng vị trí nhưng Computer vẫn
+tìm kiếm lại từ đầu. Sách khai cuộc lưu sẵn nước đi cho các vị trí này.
+
+Định dạng file: dãy bản ghi cố định RECORD (hash, nước đi, điểm, số lần),
+sắp xếp theo (hash, nước đi). OpeningBook mmap file và tìm nhị phân trực
+tiếp trên vùng nhớ, không nạp toàn bộ file vào Python.
+
+Đối xứng: bảng Othello có 8 phép đối xứng (4 phép quay x 2 phép lật).
+Hash lưu trong sách là hash nhỏ nhất trong 8 phiên bản của vị trí (hash
+chuẩn), nước đi được lưu trong hệ tọa độ của phiên bản đó => 8 vị trí
+đối xứng dùng chung một entry.
+
+Tạo sách:
+    python book.py book.bin --plies 6 --depth 4
+"""
+
+import os
+import mmap
+import struct
+import argparse
+
+from config import BLACK, WHITE, EMPTY, BOOK_PATH
+from zobrist import SQUARE_KEYS, SIDE_KEYS
+from board import Board
+from evaluator import IncrementalEvaluator
+from minimax import Minimax
+from transposition import TranspositionTable
+from symmetry import SYMMETRY_SQUARES, INVERSE_SQUARES
+
+# hash (uint64), ô của nước đi (uint8), điểm (int16), số lần (uint32)
+RECORD = struct.Struct('<QBhI')
+SCORE_LIMIT = 32767
+
+
+def canonical(board, color):
+    """
+    HASH CHUẨN CỦA VỊ TRÍ (nhỏ nhất trong 8 phiên bản đối xứng)
+
+    Args:
+        board: Board hoặc BitBoard
+        color: Người đi
+
+    Returns:
+        tuple (key, symmetry): Hash chuẩn và phép đối xứng tạo ra nó
+    """
+    keys = [SIDE_KEYS[color]] * 8
+    grid = board.board
+    for i in range(8):
+        for j in range(8):
+            piece = grid[i][j]
+            if piece != EMPTY:
+                squareKeys = SQUARE_KEYS[piece]
+                sq = i * 8 + j
+                for s in range(8):
+                    keys[s] ^= squareKeys[SYMMETRY_SQUARES[s][sq]]
+    key = min(keys)
+    return key, keys.index(key)
+
+
+class BookBuilder(object):
+
+    """
+    TẠO SÁCH KHAI CUỘC
+
+    Gom các cặp (vị trí, nước đi) kèm điểm, rồi ghi ra file đã sắp xếp.
+    Cùng một cặp thêm nhiều lần: điểm lấy trung bình, số lần cộng dồn.
+    """
+
+    def __init__(self):
+        self.entries = {}  # (hash chuẩn, ô chuẩn) -> [tổng điểm, số lần]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, board, color, move, score, count=1):
+        """
+        THÊM MỘT NƯỚC ĐI
+
+        Args:
+            move: Nước đi (row, col) trong hệ tọa độ của board
+            score: Điểm theo góc nhìn người đi 'color'
+        """
+        key, symmetry = canonical(board, color)
+        square = SYMMETRY_SQUARES[symmetry][move[0] * 8 + move[1]]
+        entry = self.entries.setdefault((key, square), [0, 0])
+        entry[0] += score * count
+        entry[1] += count
+
+    def add_game(self, moves, score, plies=None):
+        """
+        THÊM CÁC NƯỚC ĐI CỦA MỘT VÁN ĐẤU
+
+        Args:
+            moves: Danh sách nước đi từ vị trí đầu (None = bỏ lượt)
+            score: Kết quả ván theo góc nhìn Đen (ví dụ chênh lệch quân)
+            plies: Chỉ lấy số nước đầu tiên này (None = cả ván)
+        """
+        board = Board()
+        color = BLACK
+        for move in moves[:plies]:
+            if move is not None:
+                self.add(board, color, move,
+                         score if color == BLACK else -score)
+                board.make_move(move, color)
+            color = WHITE if color == BLACK else BLACK
+
+    def expand(self, plies, depth):
+        """
+        TẠO SÁCH BẰNG TÌM KIẾM
+
+        Duyệt mọi vị trí cách vị trí đầu tối đa 'plies' nước (mỗi vị trí
+        chuẩn một lần) và chấm điểm từng nước đi bằng Minimax độ sâu depth.
+        """
+        evaluator = IncrementalEvaluator()
+        minimax = Minimax(evaluator.score, TranspositionTable())
+        positions = [(Board(), BLACK)]
+        seen = set()
+        for ply in range(plies):
+            following = []
+            for board, color in positions:
+                other = WHITE if color == BLACK else BLACK
+                moves = board.get_valid_moves(color)
+                if not moves:
+                    if board.get_valid_moves(other):
+                        following.append((board, other))
+                    continue
+                for move in moves:
+                    child = board.copy()
+                    child.make_move(move, color)
+                    evaluator.attach(child)
+                    score = -minimax.search(child, depth - 1, other, color,
+                                            parentBoard=board)[0]
+                    evaluator.detach(child)
+                    self.add(board, color, move, score)
+                    key = canonical(child, other)[0]
+                    if key not in seen:
+                        seen.add(key)
+                        following.append((child, other))
+            positions = following
+
+    def write(self, path):
+        """Ghi sách ra file, bản ghi sắp xếp theo (hash, ô)"""
+        with open(path, 'wb') as f:
+            for (key, square), (total, count) in sorted(self.entries.items()):
+                score = max(-SCORE_LIMIT, min(SCORE_LIMIT, round(total / count)))
+                f.write(RECORD.pack(key, square, score, min(count, 0xFFFFFFFF)))
+
+
+class OpeningBook(object):
+
+    """
+    ĐỌC SÁCH KHAI CUỘC QUA mmap - TÌM NHỊ PHÂN THEO HASH CHUẨN
+    """
+
+    def __init__(self, path=BOOK_PATH):
+        self.file = open(path, 'rb')
+        size = os.fstat(self.file.fileno()).st_size
+        self.count = size // RECORD.size
+        self.data = None
+        if self.count:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        if self.data is not None:
+            self.data.close()
+        self.file.close()
+
+    def _lower_bound(self, key):
+        """Vị trí bản ghi đầu tiên có hash >= key"""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if RECORD.unpack_from(self.data, middle * RECORD.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def lookup(self, board, color):
+        """
+        TRA SÁCH
+
+        Returns:
+            list: Các (move, score, count), move trong hệ tọa độ của board
+        """
+        if not self.count:
+            return []
+        key, symmetry = canonical(board, color)
+        inverse = INVERSE_SQUARES[symmetry]
+        found = []
+        index = self._lower_bound(key)
+        while index < self.count:
+            record = RECORD.unpack_from(self.data, index * RECORD.size)
+            if record[0] != key:
+                break
+            square = inverse[record[1]]
+            found.append(((square >> 3, square & 7), record[2], record[3]))
+            index += 1
+        return found
+
+    def best_move(self, board, color):
+        """
+        NƯỚC ĐI TỐT NHẤT TRONG SÁCH (điểm cao nhất, rồi số lần nhiều nhất)
+
+        Returns:
+            tuple (move, score), hoặc None nếu vị trí không có trong sách
+        """
+        legal = board.get_valid_moves(color)
+        best = None
+        for move, score, count in self.lookup(board, color):
+            if move in legal and (best is None or (score, count) > best[1:]):
+                best = (move, score, count)
+        if best is None:
+            return None
+        return best[0], best[1]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build an opening book.')
+    parser.add_argument('path', nargs='?', default=BOOK_PATH)
+    parser.add_argument('--plies', type=int, default=6,
+                        help='positions up to this many plies from the start')
+    parser.add_argument('--depth', type=int, default=4,
+                        help='search depth used to score each move')
+    args = parser.parse_args()
+    if args.depth < 1:
+        parser.error('--depth must be at least 1')
+    builder = BookBuilder()
+    builder.expand(args.plies, args.depth)
+    builder.write(args.path)
+    print('%d entries written to %s' % (len(builder), args.path))
@@ -0,0 +1,61 @@
+from board import Board
+from evaluator import Evaluator
+from book import BookBuilder, OpeningBook, canonical
+from symmetry import SYMMETRIES
+import os
+import tempfile
+import unittest
+from config import WHITE, BLACK
+
+
+class TestOpeningBook(unittest.TestCase):
+    def test_symmetric_positions_share_key(self):
+        b = Board()
+        b.make_move((2, 3), BLACK)
+        keys = set()
+        for symmetry in SYMMETRIES:
+            other = Board()
+            for i in range(8):
+                for j in range(8):
+                    r, c = symmetry(i, j)
+                    other.board[r][c] = b.board[i][j]
+            keys.add(canonical(other, WHITE)[0])
+        self.assertEqual(keys, set([canonical(b, WHITE)[0]]))
+
+    def test_build_and_lookup(self):
+        builder = BookBuilder()
+        builder.expand(2, 2)
+        builder.add_game([(2, 3), (2, 2)], 10)
+        builder.add_game([(5, 4), (5, 5)], -4)  # (2, 3) (2, 2) rotated
+        path = os.path.join(tempfile.mkdtemp(), 'book.bin')
+        builder.write(path)
+        book = OpeningBook(path)
+        try:
+            self.assertEqual(len(book), len(builder))
+            for move in Board().get_valid_moves(BLACK):
+                b = Board()
+                b.make_move(move, BLACK)
+                entries = book.lookup(b, WHITE)
+                self.assertEqual(sorted(m for m, s, c in entries),
+                                 sorted(b.get_valid_moves(WHITE)))
+                self.assertIn(book.best_move(b, WHITE)[0],
+                              b.get_valid_moves(WHITE))
+            b = Board()
+            b.make_move((5, 4), BLACK)
+            counts = dict((m, c) for m, s, c in book.lookup(b, WHITE))
+            self.assertEqual(counts[(5, 5)], 3)
+        finally:
+            book.close()
+
+    def test_expand_depth_one(self):
+        builder = BookBuilder()
+        builder.expand(1, 1)
+        # each of the 4 first moves is scored by the evaluator against the
+        # start position
+        b = Board()
+        b.make_move((2, 3), BLACK)
+        expected = -Evaluator().score(Board(), b, 0, WHITE, BLACK)
+        self.assertEqual(list(builder.entries.values()), [[expected, 1]] * 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,3 +9,14 @@ MIN = 1
 DEFAULT_LEVEL = 2
 HUMAN = "human"
 COMPUTER = "computer"
+TT_MEMORY_MB = 16
+MOVE_TIME_BUDGET = None  # seconds per Computer move; None = fixed depth
+ENDGAME_EMPTIES = 12  # Computer solves exactly with this many empties or fewer
+INCREMENTAL_EVAL = True  # Computer updates evaluation features move by move
+SEARCH_WORKERS = 1  # processes for the Computer's root search; 1 = serial
+BOOK_PATH = "res/book.bin"  # opening book used by Computer when present
+PATTERN_WEIGHTS = "res/patterns.npz"  # pattern evaluator tables (defaults when absent)
+MCTS_PLAYOUTS = 2000  # playouts per MonteCarlo move
+MCTS_TIME_BUDGET = None  # seconds per MonteCarlo move; None = playouts only
+LOG_SEARCH_STATS = False  # log node counts, cutoffs and TT hits of every Computer move
+PONDER = True  # Computer searches on the human's time
@@ -0,0 +1,233 @@
+"""
+endgame.py - BỘ GIẢI CHÍNH XÁC CUỐI VÁN (ENDGAME SOLVER)
+
+Khi còn ít ô trống, thay vì đánh giá heuristic, ta tìm kiếm tới hết ván
+và trả về chênh lệch quân chính xác (quân của tôi - quân đối thủ).
+
+Nhanh hơn nhiều so với chạy Minimax tổng quát tới cuối ván vì:
+- Làm việc trực tiếp trên 2 số nguyên 64 bit (không tạo đối tượng Board)
+- Không gọi Evaluator: lá chỉ là phép đếm quân (popcount)
+- Sắp xếp nước đi theo parity: ưu tiên vùng (góc phần tư) có số ô trống lẻ
+- Fastest-first khi còn nhiều ô trống: thử nước đi để lại ít nước nhất
+  cho đối thủ trước
+- Hàm chuyên biệt cho 1, 2, 3 ô trống cuối cùng (không cần sinh nước đi)
+"""
+
+from bitboard import FULL, move_mask, flip_mask
+from minimax import SearchTimeout
+
+INFINITY = 100
+
+# 4 vùng góc phần tư 4x4, dùng cho sắp xếp theo parity
+QUADRANTS = (0x000000000F0F0F0F, 0x00000000F0F0F0F0,
+             0x0F0F0F0F00000000, 0xF0F0F0F000000000)
+
+# Ô ưu tiên trong cùng nhóm parity: góc trước, X-square sau cùng
+CORNERS = 0x8100000000000081
+X_SQUARES = 0x0042000000004200
+
+FASTEST_FIRST_EMPTIES = 7  # Trên mức này dùng fastest-first thay cho parity
+
+
+def _bits(mask):
+    """Tách mặt nạ thành danh sách các bit đơn"""
+    bits = []
+    while mask:
+        bit = mask & -mask
+        bits.append(bit)
+        mask ^= bit
+    return bits
+
+
+class EndgameSolver(object):
+
+    """
+    GIẢI CHÍNH XÁC VỊ TRÍ CUỐI VÁN
+
+    Điểm luôn là chênh lệch quân theo góc nhìn người đi: dương = thắng.
+    Ô trống còn lại khi ván kết thúc sớm không tính cho ai (giống cách
+    Othello.run đếm quân để xác định người thắng).
+    """
+
+    def __init__(self, fastest_first_empties=FASTEST_FIRST_EMPTIES):
+        self.fastestFirstEmpties = fastest_first_empties
+        self.nodes = 0
+        self.stopped = False
+
+    def stop(self):
+        """Dừng solve() đang chạy (từ luồng khác): solve() ném SearchTimeout.
+        Người gọi đặt lại stopped = False trước lần giải tiếp theo."""
+        self.stopped = True
+
+    def solve(self, board, player, alfa=-INFINITY, beta=INFINITY):
+        """
+        GIẢI VỊ TRÍ CHO NGƯỜI ĐI 'player'
+
+        Args:
+            board: Board hoặc BitBoard
+            player: Màu người đi
+
+        Returns:
+            tuple (score, move): Chênh lệch quân chính xác và nước đi tốt
+            nhất (None nếu phải bỏ lượt hoặc ván đã kết thúc)
+        """
+        own, opp = self._bitboards(board, player)
+        self.nodes = 1
+        moves = move_mask(own, opp)
+        if not moves:
+            return self._search(own, opp, alfa, beta), None
+
+        bestScore = -INFINITY
+        bestMove = None
+        for bit in self._order(own, opp, moves):
+            flips = flip_mask(bit, own, opp)
+            score = -self._search(opp & ~flips, own | bit | flips, -beta, -alfa)
+            if score > bestScore:
+                bestScore = score
+                sq = bit.bit_length() - 1
+                bestMove = (sq >> 3, sq & 7)
+                if score > alfa:
+                    alfa = score
+                    if alfa >= beta:
+                        break
+        return bestScore, bestMove
+
+    def _bitboards(self, board, player):
+        """Lấy (quân người đi, quân đối thủ) từ Board hoặc BitBoard"""
+        if hasattr(board, 'bits'):
+            return board.bits(player)
+        own = opp = 0
+        for i in range(8):
+            for j in range(8):
+                if board.board[i][j] == player:
+                    own |= 1 << (i * 8 + j)
+                elif board.board[i][j] != 0:
+                    opp |= 1 << (i * 8 + j)
+        return own, opp
+
+    def _order(self, own, opp, moves):
+        """
+        SẮP XẾP NƯỚC ĐI
+
+        - Còn nhiều ô trống: fastest-first (ít nước đi cho đối thủ trước)
+        - Còn ít ô trống: parity - vùng có số ô trống lẻ trước; trong
+          mỗi nhóm góc trước, X-square sau cùng
+        """
+        empty = ~(own | opp) & FULL
+        if empty.bit_count() > self.fastestFirstEmpties:
+            scored = []
+            for bit in _bits(moves):
+                flips = flip_mask(bit, own, opp)
+                replies = move_mask(opp & ~flips, own | bit | flips).bit_count()
+                if bit & CORNERS:
+                    replies -= 1
+                scored.append((replies, bit))
+            scored.sort()
+            return [bit for replies, bit in scored]
+
+        odd = 0
+        for quadrant in QUADRANTS:
+            if (empty & quadrant).bit_count() & 1:
+                odd |= quadrant
+        first = moves & odd
+        second = moves & ~odd
+        return _bits(first & CORNERS) + _bits(first & ~CORNERS & ~X_SQUARES) + \
+            _bits(first & X_SQUARES) + _bits(second & CORNERS) + \
+            _bits(second & ~CORNERS & ~X_SQUARES) + _bits(second & X_SQUARES)
+
+    def _search(self, own, opp, alfa, beta):
+        """NEGAMAX ALPHA-BETA TỔNG QUÁT (trên 3 ô trống)"""
+        self.nodes += 1
+        if self.stopped:
+            raise SearchTimeout()
+        empty = ~(own | opp) & FULL
+        n = empty.bit_count()
+        if n <= 3:
+            if n == 3:
+                return self._solve3(own, opp, alfa, beta, empty)
+            if n == 2:
+                return self._solve2(own, opp, alfa, beta, empty)
+            if n == 1:
+                return self._solve1(own, opp, empty)
+            return own.bit_count() - opp.bit_count()
+
+        moves = move_mask(own, opp)
+        if not moves:
+            if not move_mask(opp, own):
+                return own.bit_count() - opp.bit_count()  # Ván kết thúc
+            return -self._search(opp, own, -beta, -alfa)  # Bỏ lượt
+
+        bestScore = -INFINITY
+        for bit in self._order(own, opp, moves):
+            flips = flip_mask(bit, own, opp)
+            score = -self._search(opp & ~flips, own | bit | flips, -beta, -alfa)
+            if score > bestScore:
+                bestScore = score
+                if score > alfa:
+                    alfa = score
+                    if alfa >= beta:
+                        break
+        return bestScore
+
+    def _solve1(self, own, opp, bit):
+        """1 Ô TRỐNG CUỐI: chỉ cần tính số quân lật, không tạo bảng mới"""
+        self.nodes += 1
+        diff = own.bit_count() - opp.bit_count()
+        flips = flip_mask(bit, own, opp).bit_count()
+        if flips:
+            return diff + 2 * flips + 1
+        flips = flip_mask(bit, opp, own).bit_count()
+        if flips:
+            return diff - 2 * flips - 1
+        return diff  # Không ai đi được: ô trống không tính
+
+    def _solve2(self, own, opp, alfa, beta, empty, passed=False):
+        """2 Ô TRỐNG CUỐI: thử lần lượt 2 ô, mỗi nhánh kết thúc bằng _solve1"""
+        self.nodes += 1
+        first = empty & -empty
+        second = empty ^ first
+        bestScore = -INFINITY
+        flips = flip_mask(first, own, opp)
+        if flips:
+            bestScore = -self._solve1(opp & ~flips, own | first | flips, second)
+            if bestScore >= beta:
+                return bestScore
+        flips = flip_mask(second, own, opp)
+        if flips:
+            score = -self._solve1(opp & ~flips, own | second | flips, first)
+            if score > bestScore:
+                bestScore = score
+        if bestScore == -INFINITY:
+            if passed:
+                return own.bit_count() - opp.bit_count()
+            return -self._solve2(opp, own, -beta, -alfa, empty, True)
+        return bestScore
+
+    def _solve3(self, own, opp, alfa, beta, empty, passed=False):
+        """3 Ô TRỐNG CUỐI: ô ở vùng lẻ (thường là ô đơn lẻ) được thử trước"""
+        self.nodes += 1
+        squares = _bits(empty)
+        for quadrant in QUADRANTS:
+            count = (empty & quadrant).bit_count()
+            if count == 1:
+                single = empty & quadrant
+                squares.remove(single)
+                squares.insert(0, single)
+                break
+        bestScore = -INFINITY
+        for bit in squares:
+            flips = flip_mask(bit, own, opp)
+            if flips:
+                score = -self._solve2(opp & ~flips, own | bit | flips,
+                                      -beta, -alfa, empty ^ bit)
+                if score > bestScore:
+                    bestScore = score
+                    if score > alfa:
+                        alfa = score
+                        if alfa >= beta:
+                            return bestScore
+        if bestScore == -INFINITY:
+            if passed:
+                return own.bit_count() - opp.bit_count()
+            return -self._solve3(opp, own, -beta, -alfa, empty, True)
+        return bestScore
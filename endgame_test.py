@@ -0,0 +1,74 @@
+from bitboard import BitBoard, move_mask, flip_mask
+from board import Board
+from endgame import EndgameSolver
+from minimax import SearchTimeout
+import random
+import unittest
+from config import WHITE, BLACK
+
+
+def exact(own, opp):
+    """ Full-width negamax to the end of the game, the reference score. """
+    moves = move_mask(own, opp)
+    if not moves:
+        if not move_mask(opp, own):
+            return own.bit_count() - opp.bit_count()
+        return -exact(opp, own)
+    best = None
+    while moves:
+        bit = moves & -moves
+        moves ^= bit
+        flips = flip_mask(bit, own, opp)
+        score = -exact(opp & ~flips, own | bit | flips)
+        if best is None or score > best:
+            best = score
+    return best
+
+
+def endgame_board(empties, seed):
+    rng = random.Random(seed)
+    b = BitBoard()
+    color = BLACK
+    while b.count_stones()[2] > empties and not b.game_ended():
+        moves = b.get_valid_moves(color)
+        if moves:
+            b.apply_move(rng.choice(moves), color)
+        color = WHITE if color == BLACK else BLACK
+    return b, color
+
+
+class TestEndgameSolver(unittest.TestCase):
+    def test_matches_full_search(self):
+        for seed in range(20):
+            b, color = endgame_board(7, seed)
+            with self.subTest(seed=seed):
+                score, move = EndgameSolver().solve(b, color)
+                self.assertEqual(score, exact(*b.bits(color)))
+                if move is not None:
+                    self.assertIn(move, b.get_valid_moves(color))
+
+    def test_fastest_first_matches_full_search(self):
+        # above FASTEST_FIRST_EMPTIES the moves are ordered fastest-first
+        for seed in range(4):
+            b, color = endgame_board(9, seed)
+            with self.subTest(seed=seed):
+                score, move = EndgameSolver().solve(b, color)
+                self.assertEqual(score, exact(*b.bits(color)))
+
+    def test_list_board(self):
+        b, color = endgame_board(9, 3)
+        grid = Board()
+        grid.board = [row[:] for row in b.board]
+        self.assertEqual(EndgameSolver().solve(grid, color),
+                         EndgameSolver().solve(b, color))
+
+    def test_stop(self):
+        b, color = endgame_board(14, 3)
+        solver = EndgameSolver()
+        solver.stop()
+        self.assertRaises(SearchTimeout, solver.solve, b, color)
+        solver.stopped = False
+        self.assertEqual(solver.solve(b, color), EndgameSolver().solve(b, color))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,6 +18,30 @@ Công thức tính điểm được điều chỉnh theo 5 giai đoạn game d
 """
 
 from config import BLACK, WHITE, EMPTY
+from board import RAYS
+
+# Chỉ số các đặc trưng trong FeatureTracker.values (cộng thêm màu quân 1/2)
+DISCS = 0       # Số quân
+CORNERS = 3     # Số góc
+EDGES = 6       # Số ô cạnh (không tính góc)
+ADJACENT = 9    # Số ô trống kề bên (frontier) - giống Board.get_adjacent_count
+XMASK = 12      # Mặt nạ 4 bit: X-square nào đang có quân
+
+# Phân loại ô: 0 = thường, 1 = góc, 2 = cạnh, 3 = X-square
+SQUARE_KIND = [[0] * 8 for _ in range(8)]
+for _i in range(8):
+    for _j in range(8):
+        if _i in (0, 7) and _j in (0, 7):
+            SQUARE_KIND[_i][_j] = 1
+        elif _i in (0, 7) or _j in (0, 7):
+            SQUARE_KIND[_i][_j] = 2
+        elif _i in (1, 6) and _j in (1, 6):
+            SQUARE_KIND[_i][_j] = 3
+X_BIT = {(1, 1): 1, (1, 6): 2, (6, 1): 4, (6, 6): 8}
+
+# 8 ô kề bên của mỗi ô (ô đầu tiên của mỗi tia)
+NEIGHBOURS = [[tuple(ray[0] for ray in RAYS[_i][_j] if ray) for _j in range(8)]
+              for _i in range(8)]
 
 
 class Evaluator(object):
@@ -367,6 +391,7 @@ class Evaluator(object):
         5. Giai đoạn game (đầu/giữa/cuối)
 
         Công thức kết hợp sigmoid giúp chuyển điểm số thành %
+        Chấm nhiều vị trí một lúc: dùng batch.win_probability_batch
 
         Args:
             board: Bảng cờ hiện tại
@@ -378,60 +403,185 @@ class Evaluator(object):
             tuple: (xác_suất_thắng_player, xác_suất_thắng_opponent)
                   Các giá trị từ 0.05 đến 0.95 (5% đến 95%)
         """
-        from minimax import Minimax
+        # Cùng công thức với batch.win_probability_batch, tính cho 1 vị trí
+        from batch import win_probability_batch, stack_boards
+        player_win_prob, opponent_win_prob = win_probability_batch(
+            stack_boards([board]), player, depth)
+        return float(player_win_prob[0]), float(opponent_win_prob[0])
 
-        # 1. TÍNH ĐIỂM SỐ MINIMAX (chiến thuật AI)
-        current_score = self.score(board, board, depth, player, opponent)
 
-        # 2. THỐNG KÊ CƠ BẢN
-        whites, blacks, empty = board.count_stones()
-        total_pieces = whites + blacks
-
-        # 3. ĐẾM NƯỚC ĐI HỢP LỆ (linh hoạt)
-        player_moves = len(board.get_valid_moves(player))
-        opponent_moves = len(board.get_valid_moves(opponent))
-
-        # 4. ĐẾM GÓC KIỂM SOÁT
-        player_corners = 0
-        opponent_corners = 0
-        for i in [0, 7]:
-            for j in [0, 7]:
-                if board.board[i][j] == player:
-                    player_corners += 1
-                elif board.board[i][j] == opponent:
-                    opponent_corners += 1
-
-        # 5. ĐẾM QUÂN CỦA MỖI BÊN
-        if player == WHITE:
-            player_pieces = whites
-            opponent_pieces = blacks
+class FeatureTracker(object):
+    """
+    THEO DÕI ĐẶC TRƯNG BẢNG CỜ THEO TỪNG NƯỚC ĐI (TĂNG DẦN)
+
+    Gắn vào Board (board.features). Board.make_move() báo ô vừa đặt và các
+    ô bị lật, tracker chỉ tính lại phần bị ảnh hưởng thay vì quét 64 ô:
+    - Số quân, số góc, số ô cạnh, X-square có quân
+    - Số ô trống kề bên (frontier): chỉ các ô quanh ô vừa đặt và ô bị lật
+    unmake_move() khôi phục giá trị cũ từ ngăn xếp.
+    """
+
+    def __init__(self, board):
+        """Tính toàn bộ đặc trưng một lần cho bảng hiện tại"""
+        values = [0] * 13
+        grid = board.board
+        for i in range(8):
+            for j in range(8):
+                color = grid[i][j]
+                if color == EMPTY:
+                    continue
+                values[DISCS + color] += 1
+                kind = SQUARE_KIND[i][j]
+                if kind == 1:
+                    values[CORNERS + color] += 1
+                elif kind == 2:
+                    values[EDGES + color] += 1
+                elif kind == 3:
+                    values[XMASK] |= X_BIT[(i, j)]
+        values[ADJACENT + BLACK] = board.get_adjacent_count(BLACK)
+        values[ADJACENT + WHITE] = board.get_adjacent_count(WHITE)
+        self.values = values
+        self.stack = []
+
+    def make(self, grid, move, flipped, color):
+        """
+        CẬP NHẬT SAU KHI 'color' ĐẶT QUÂN TẠI move VÀ LẬT flipped
+
+        Args:
+            grid: Lưới 8x8 (đã thực hiện nước đi)
+        """
+        values = self.values
+        self.stack.append(values[:])
+        other = BLACK if color == WHITE else WHITE
+        count = len(flipped)
+        values[DISCS + color] += count + 1
+        values[DISCS + other] -= count
+
+        row, column = move
+        kind = SQUARE_KIND[row][column]
+        if kind == 1:
+            values[CORNERS + color] += 1
+        elif kind == 2:
+            values[EDGES + color] += 1
+        elif kind == 3:
+            values[XMASK] |= X_BIT[move]
+
+        # Ô vừa đặt không còn trống: mỗi quân kề bên mất 1 ô trống kề
+        # (quân vừa bị lật được tính theo màu cũ), ô mới có thêm ô trống kề
+        empties = 0
+        for i, j in NEIGHBOURS[row][column]:
+            neighbour = grid[i][j]
+            if neighbour == EMPTY:
+                empties += 1
+            else:
+                if neighbour == color and (i, j) in flipped:
+                    neighbour = other
+                values[ADJACENT + neighbour] -= 1
+        values[ADJACENT + color] += empties
+
+        # Quân bị lật chuyển phần đóng góp của nó từ màu cũ sang màu mới
+        for i, j in flipped:
+            kind = SQUARE_KIND[i][j]
+            if kind == 2:
+                values[EDGES + color] += 1
+                values[EDGES + other] -= 1
+            empties = 0
+            for ni, nj in NEIGHBOURS[i][j]:
+                if grid[ni][nj] == EMPTY:
+                    empties += 1
+            values[ADJACENT + color] += empties
+            values[ADJACENT + other] -= empties
+
+    def unmake(self):
+        """Khôi phục đặc trưng trước nước đi gần nhất"""
+        self.values = self.stack.pop()
+
+    def snapshot(self, board):
+        """
+        ĐẶC TRƯNG CỦA VỊ TRÍ CHA - DÙNG CHUNG CHO MỌI NÚT LÁ ANH EM
+
+        Tính luôn số nước đi hợp lệ của cả 2 bên một lần, thay vì mỗi lá
+        gọi lại get_valid_moves() trên bảng cha.
+        """
+        return ParentFeatures(self.values[:],
+                              len(board.get_valid_moves(BLACK)),
+                              len(board.get_valid_moves(WHITE)))
+
+
+class ParentFeatures(object):
+    """Đặc trưng đã tính sẵn của vị trí cha (thay cho startBoard)"""
+
+    def __init__(self, values, blackMoves, whiteMoves):
+        self.values = values
+        self.mobility = [0, blackMoves, whiteMoves]
+
+
+class IncrementalEvaluator(Evaluator):
+    """
+    CHẾ ĐỘ ĐÁNH GIÁ TĂNG DẦN - CÙNG KẾT QUẢ VỚI Evaluator.score
+
+    Dùng khi Minimax duyệt cây bằng make/unmake trên một Board có gắn
+    FeatureTracker: startBoard là ParentFeatures của nút cha, các đặc trưng
+    của lá đọc từ tracker. Chỉ còn số nước đi hợp lệ của lá là phải tính.
+    Các trường hợp khác (startBoard là Board) dùng Evaluator.score như cũ.
+    """
+
+    def attach(self, board):
+        """Bật theo dõi đặc trưng cho board (trước khi tìm kiếm)"""
+        board.features = FeatureTracker(board)
+
+    def detach(self, board):
+        """Tắt theo dõi đặc trưng (sau khi tìm kiếm)"""
+        board.features = None
+
+    def score(self, startBoard, board, currentDepth, player, opponent):
+        if not isinstance(startBoard, ParentFeatures) or board.features is None:
+            return Evaluator.score(self, startBoard, board, currentDepth,
+                                   player, opponent)
+        self.player = player
+        self.enemy = opponent
+        current = board.features.values
+        parent = startBoard.values
+
+        # KIỂM TRA ĐIỀU KIỆN THẮNG TUYỆT ĐỐI
+        if current[DISCS + player] == 0:
+            return -Evaluator.WIPEOUT_SCORE
+        if current[DISCS + opponent] == 0:
+            return Evaluator.WIPEOUT_SCORE
+
+        # XÁC ĐỊNH GIAI ĐOẠN GAME (BAND)
+        piece_count = current[DISCS + BLACK] + current[DISCS + WHITE]
+        if piece_count <= 16:
+            band = 0
+        elif piece_count <= 32:
+            band = 1
+        elif piece_count <= 48:
+            band = 2
+        elif piece_count <= 64 - currentDepth:
+            band = 3
         else:
-            player_pieces = blacks
-            opponent_pieces = whites
-
-        # 6. TÍNH CÁC CHỈ SỐ LỢI THẾ (-1 đến +1)
-        piece_advantage = (player_pieces - opponent_pieces) / max(total_pieces, 1)
-        mobility_advantage = (player_moves - opponent_moves) / max(player_moves + opponent_moves, 1)
-        corner_advantage = (player_corners - opponent_corners) / 4.0
-
-        # 7. TRỌNG SỐ THEO GIAI ĐOẠN GAME
-        if total_pieces < 20:    # Đầu game: Linh hoạt quan trọng
-            score_factor = 0.3 * piece_advantage + 0.4 * mobility_advantage + 0.3 * corner_advantage
-        elif total_pieces < 40:  # Giữa game: Cân bằng
-            score_factor = 0.4 * piece_advantage + 0.3 * mobility_advantage + 0.3 * corner_advantage
-        else:                    # Cuối game: Số quân quyết định
-            score_factor = 0.6 * piece_advantage + 0.2 * mobility_advantage + 0.2 * corner_advantage
-
-        # 8. KẾT HỢP ĐIỂM MINIMAX VÀ ĐIỂM THỐNG KÊ
-        normalized_score = current_score / 1000.0  # Chuẩn hóa điểm Minimax
-        combined_score = 0.7 * score_factor + 0.3 * normalized_score
-
-        # 9. CHUYỂN THÀNH TỈ LỆ % BẰNG HÀM SIGMOID
-        import math
-        probability = 1 / (1 + math.exp(-combined_score * 5))
-
-        # 10. GIỚI HẠN 5%-95% (để tránh hiển thị 0% hoặc 100%)
-        player_win_prob = max(0.05, min(0.95, probability))
-        opponent_win_prob = 1 - player_win_prob
-
-        return player_win_prob, opponent_win_prob
+            band = 4
+
+        # Evaluator.score tính số quân, góc, cạnh trên deltaBoard - chính là
+        # startBoard vì Board.compare trả về otherBoard - nên ở đây dùng
+        # đặc trưng của vị trí cha. Cùng lý do đó, điều kiện X-square
+        # (có quân trong deltaBoard nhưng trống trong startBoard) không bao
+        # giờ đúng và điểm X-square luôn bằng 0.
+        sc = Evaluator.PIECE_COUNT_WEIGHT[band] * \
+            (parent[DISCS + player] - parent[DISCS + opponent])
+        sc += Evaluator.CORNER_WEIGHT[band] * \
+            (parent[CORNERS + player] - parent[CORNERS + opponent])
+        sc += Evaluator.EDGE_WEIGHT[band] * \
+            (parent[EDGES + player] - parent[EDGES + opponent])
+
+        # Linh hoạt tiềm năng: thay đổi số ô trống kề bên so với nút cha
+        sc += Evaluator.POTENTIAL_MOBILITY_WEIGHT[band] * (
+            (current[ADJACENT + opponent] - parent[ADJACENT + opponent]) -
+            (current[ADJACENT + player] - parent[ADJACENT + player]))
+
+        # Linh hoạt thực tế: số nước đi của nút cha đã có sẵn trong snapshot
+        if Evaluator.MOBILITY_WEIGHT[band] != 0:
+            myScore = len(board.get_valid_moves(player)) - startBoard.mobility[player]
+            yourScore = len(board.get_valid_moves(opponent)) - startBoard.mobility[opponent]
+            sc += Evaluator.MOBILITY_WEIGHT[band] * (myScore - yourScore)
+        return sc
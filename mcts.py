@@ -0,0 +1,249 @@
+"""
+mcts.py - TÌM KIẾM CÂY MONTE CARLO (MCTS) - THAY THẾ CHO MINIMAX
+
+Thay vì duyệt hết cây tới độ sâu cố định, MCTS lặp lại 4 bước:
+1. Chọn (selection): đi xuống cây theo công thức UCT
+2. Mở rộng (expansion): thêm mọi nước đi của nút lá vào cây
+3. Mô phỏng (playout): chơi ngẫu nhiên tới hết ván
+4. Lan truyền (backpropagation): cập nhật số lần thắng dọc đường đi
+
+Càng nhiều playout càng mạnh, nên đổi CPU lấy sức mạnh một cách mượt mà.
+
+- Progressive bias (tùy chọn): điểm Evaluator của mỗi nước đi được cộng
+  vào UCT với trọng số giảm dần theo số lần thăm
+- Playout chạy trực tiếp trên 2 số nguyên bitboard, không tạo Board
+- Cây con được giữ lại giữa các nước đi
+"""
+
+import math
+import time
+import random
+
+from config import BLACK, WHITE, EMPTY, MCTS_PLAYOUTS, MCTS_TIME_BUDGET
+from bitboard import BitBoard, move_mask, flip_mask
+from minimax import SearchResult
+
+EXPLORATION = 1.4   # Hằng số khám phá của UCT (~ căn 2)
+BIAS_WEIGHT = 1.0   # Trọng số progressive bias
+BIAS_SCALE = 100.0  # Điểm Evaluator được chuẩn hóa bằng tanh(điểm / BIAS_SCALE)
+
+
+class Node(object):
+
+    """
+    NÚT CỦA CÂY MCTS
+
+    wins là số ván thắng (hòa = 0.5) của người vừa đi nước dẫn tới nút này
+    (tức parent.color), để nút cha chọn con có tỉ lệ thắng cao nhất.
+    """
+
+    __slots__ = ('black', 'white', 'color', 'move', 'parent', 'children',
+                 'visits', 'wins', 'bias')
+
+    def __init__(self, black, white, color, move=None, parent=None, bias=0.0):
+        self.black = black
+        self.white = white
+        self.color = color        # Người đi tại nút này
+        self.move = move          # Bit nước đi dẫn tới nút (None = bỏ lượt)
+        self.parent = parent
+        self.children = None      # None = chưa mở rộng, [] = ván kết thúc
+        self.visits = 0
+        self.wins = 0.0
+        self.bias = bias
+
+
+def _random_bit(moves, rng):
+    """Chọn ngẫu nhiên một bit trong mặt nạ moves"""
+    for _ in range(rng.randrange(moves.bit_count())):
+        moves &= moves - 1
+    return moves & -moves
+
+
+def _to_move(bit):
+    """Bit -> (row, col); None (bỏ lượt) giữ nguyên"""
+    if bit is None:
+        return None
+    sq = bit.bit_length() - 1
+    return (sq >> 3, sq & 7)
+
+
+class MCTS(object):
+
+    """
+    MCTS (UCT) VỚI PROGRESSIVE BIAS TÙY CHỌN
+
+    search() dừng khi đủ số playout hoặc hết thời gian (cái nào đến trước).
+    """
+
+    def __init__(self, evaluator=None, playouts=MCTS_PLAYOUTS,
+                 time_budget=MCTS_TIME_BUDGET, seed=None):
+        """
+        Args:
+            evaluator: Đối tượng có score() như Evaluator, dùng cho
+                       progressive bias (None = UCT thuần)
+            playouts: Số playout mỗi nước đi
+            time_budget: Giây cho mỗi nước đi (None = chỉ giới hạn playout)
+            seed: Seed cho playout ngẫu nhiên
+        """
+        self.evaluator = evaluator
+        self.playouts = playouts
+        self.timeBudget = time_budget
+        self.rng = random.Random(seed)
+        self.root = None
+        self.stopped = False  # Đặt từ luồng khác để dừng search() sớm
+
+    def _find_root(self, black, white, color):
+        """
+        DÙNG LẠI CÂY CŨ: tìm vị trí hiện tại trong 2 tầng dưới gốc cũ
+        (nước đi của mình và nước đáp trả của đối thủ)
+        """
+        level = [self.root] if self.root is not None else []
+        for _ in range(3):
+            following = []
+            for node in level:
+                if node.black == black and node.white == white and \
+                   node.color == color:
+                    node.parent = None  # Giải phóng phần cây còn lại
+                    return node
+                if node.children:
+                    following.extend(node.children)
+            level = following
+        return Node(black, white, color)
+
+    def _expand(self, node):
+        """Tạo mọi nút con; con có bias cao đứng trước"""
+        own, opp = (node.black, node.white) if node.color == BLACK else \
+            (node.white, node.black)
+        other = WHITE if node.color == BLACK else BLACK
+        moves = move_mask(own, opp)
+        children = []
+        if not moves:
+            if move_mask(opp, own):
+                children.append(Node(node.black, node.white, other, None, node))
+            node.children = children
+            return
+        while moves:
+            bit = moves & -moves
+            moves ^= bit
+            flips = flip_mask(bit, own, opp)
+            newOwn, newOpp = own | bit | flips, opp & ~flips
+            if node.color == BLACK:
+                child = Node(newOwn, newOpp, other, bit, node)
+            else:
+                child = Node(newOpp, newOwn, other, bit, node)
+            if self.evaluator is not None:
+                child.bias = self._bias(node, child)
+            children.append(child)
+        children.sort(key=lambda child: child.bias, reverse=True)
+        node.children = children
+
+    def _bias(self, node, child):
+        """Điểm Evaluator của nước đi theo góc nhìn người đi, trong (-1, 1)"""
+        parentBoard = BitBoard()
+        parentBoard.black, parentBoard.white = node.black, node.white
+        board = BitBoard()
+        board.black, board.white = child.black, child.white
+        # Giống Minimax: lá được đánh giá theo góc nhìn người đi tiếp theo
+        score = -self.evaluator.score(parentBoard, board, 0, child.color,
+                                      node.color)
+        return math.tanh(score / BIAS_SCALE)
+
+    def _select(self, node):
+        """Chọn con theo UCT + progressive bias; con chưa thăm được ưu tiên"""
+        logVisits = math.log(node.visits + 1)
+        best = None
+        bestValue = -1.0
+        for child in node.children:
+            if child.visits == 0:
+                return child
+            value = child.wins / child.visits + \
+                EXPLORATION * math.sqrt(logVisits / child.visits) + \
+                BIAS_WEIGHT * child.bias / (child.visits + 1)
+            if value > bestValue:
+                bestValue = value
+                best = child
+        return best
+
+    def _playout(self, black, white, color):
+        """
+        CHƠI NGẪU NHIÊN TỚI HẾT VÁN
+
+        Returns:
+            Màu người thắng, EMPTY nếu hòa
+        """
+        rng = self.rng
+        own, opp = (black, white) if color == BLACK else (white, black)
+        while True:
+            moves = move_mask(own, opp)
+            if moves:
+                bit = _random_bit(moves, rng)
+                flips = flip_mask(bit, own, opp)
+                own, opp = opp & ~flips, own | bit | flips
+            elif move_mask(opp, own):
+                own, opp = opp, own
+            else:
+                break
+            color = WHITE if color == BLACK else BLACK
+        diff = own.bit_count() - opp.bit_count()
+        if diff > 0:
+            return color
+        if diff < 0:
+            return WHITE if color == BLACK else BLACK
+        return EMPTY
+
+    def search(self, board, color, playouts=None, time_budget=None):
+        """
+        TÌM NƯỚC ĐI CHO 'color'
+
+        Args:
+            board: Board hoặc BitBoard
+            playouts, time_budget: Ghi đè giới hạn mặc định cho lần này
+
+        Returns:
+            SearchResult: move là nước được thăm nhiều nhất (None nếu phải
+            bỏ lượt), score là tỉ lệ thắng ước lượng (0-100), nodes là số
+            playout, pv là chuỗi nước được thăm nhiều nhất
+        """
+        if playouts is None:
+            playouts = self.playouts
+        if time_budget is None:
+            time_budget = self.timeBudget
+        bits = board if hasattr(board, 'bits') else BitBoard.from_board(board)
+        root = self._find_root(bits.black, bits.white, color)
+        self.root = root
+
+        deadline = None if time_budget is None else time.time() + time_budget
+        done = 0
+        while done < playouts and not self.stopped:
+            if deadline is not None and time.time() >= deadline:
+                break
+            node = root
+            while node.children:
+                node = self._select(node)
+            if node.children is None and (node.visits > 0 or node is root):
+                self._expand(node)
+                if node.children:
+                    node = self._select(node)
+            winner = self._playout(node.black, node.white, node.color)
+            while node is not None:
+                node.visits += 1
+                if node.parent is not None:
+                    if winner == node.parent.color:
+                        node.wins += 1.0
+                    elif winner == EMPTY:
+                        node.wins += 0.5
+                node = node.parent
+            done += 1
+
+        pv = []
+        node = root
+        while node.children:
+            node = max(node.children, key=lambda child: child.visits)
+            if node.visits == 0:
+                break
+            pv.append(_to_move(node.move))
+        if not root.children:
+            return SearchResult(None, 0, [], done, 0)
+        best = max(root.children, key=lambda child: child.visits)
+        score = int(round(100 * best.wins / best.visits)) if best.visits else 50
+        return SearchResult(_to_move(best.move), score, pv, done, len(pv))
@@ -0,0 +1,40 @@
+from bitboard import BitBoard
+from board import Board
+from evaluator import Evaluator
+from mcts import MCTS
+from minimax_test import midgame_board
+import unittest
+from config import WHITE, BLACK
+
+
+class TestMCTS(unittest.TestCase):
+    def test_search_and_reuse(self):
+        b, color = midgame_board(cls=Board)
+        other = WHITE if color == BLACK else BLACK
+        engine = MCTS(Evaluator(), playouts=300, seed=1)
+        result = engine.search(b, color)
+        self.assertEqual(result.nodes, 300)
+        self.assertIn(result.move, b.get_valid_moves(color))
+        self.assertEqual(result.pv[0], result.move)
+        self.assertEqual(engine.root.visits, 300)
+
+        b.get_valid_moves(color)
+        b.apply_move(result.move, color)
+        reply = b.get_valid_moves(other)[0]
+        b.apply_move(reply, other)
+        engine.search(b, color, playouts=10)
+        self.assertGreater(engine.root.visits, 10)  # subtree kept
+        self.assertIsNone(engine.root.parent)
+
+    def test_pass_and_game_over(self):
+        b = BitBoard()
+        b.black, b.white = 0x1, 1 << 63  # A1 and H8: nobody can move
+        result = MCTS(playouts=20, seed=1).search(b, BLACK)
+        self.assertIsNone(result.move)
+        b.black, b.white = 0x6, 0x1  # only white can move (D1)
+        result = MCTS(playouts=20, seed=1).search(b, BLACK)
+        self.assertIsNone(result.move)
+        self.assertEqual(result.pv[:2], [None, (0, 3)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,33 +3,359 @@
 # prunning algorithm for games like chess or reversi.
 # Thu Feb 18 21:54:38 Humberto Pinheiro
 
+import time
+from transposition import TranspositionTable, EXACT, LOWER, UPPER
+from zobrist import position_key
+
 INFINITY = 100000
+MAX_DEPTH = 60      # no game lasts longer than the 60 empty squares
+CHECK_EVERY = 32    # nodes between two clock checks
+ASPIRATION_WINDOW = 40  # half width of the root window around the last score
+
+
+class SearchTimeout(Exception):
+    """ Raised inside the search when the time budget is exhausted. """
+
+
+class SearchResult(object):
+    """ Outcome of a root search.
+    move - best move (None when the side to move must pass)
+    score - exact score of the position for the side to move
+    pv - principal variation, a list of moves (None marks a pass)
+    nodes - nodes visited
+    depth - depth of the last completed iteration
+    """
+
+    def __init__(self, move, score, pv, nodes, depth):
+        self.move = move
+        self.score = score
+        self.pv = pv
+        self.nodes = nodes
+        self.depth = depth
+
+    def __repr__(self):
+        return 'SearchResult(move=%s, score=%s, pv=%s, nodes=%s, depth=%s)' % (
+            self.move, self.score, self.pv, self.nodes, self.depth)
+
+
+class SearchStats(object):
+    """ Work done by one search, filled in by Minimax while it runs.
+    plyNodes - nodes visited at each ply from the root
+    leaves - positions scored by the evaluator at the horizon or at the
+             end of the game
+    cutoffs - beta cutoffs; firstCutoffs - those made by the first move
+    ttProbes, ttHits - transposition table lookups and successful ones
+    iterations - (depth, nodes, seconds) of each completed iteration
+    seconds - wall time of the whole search
+    """
+
+    def __init__(self):
+        self.plyNodes = [0] * (MAX_DEPTH + 2)
+        self.leaves = 0
+        self.cutoffs = 0
+        self.firstCutoffs = 0
+        self.ttProbes = 0
+        self.ttHits = 0
+        self.iterations = []
+        self.seconds = 0.0
+
+    @property
+    def nodes(self):
+        return sum(self.plyNodes)
+
+    def nodes_per_ply(self):
+        """ plyNodes without the unused deep plies """
+        last = len(self.plyNodes)
+        while last and not self.plyNodes[last - 1]:
+            last -= 1
+        return self.plyNodes[:last]
+
+    def first_cutoff_rate(self):
+        """ Share of the cutoffs made by the first move, a measure of
+        move ordering (1.0 is perfect) """
+        return self.firstCutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def tt_hit_rate(self):
+        return self.ttHits / self.ttProbes if self.ttProbes else 0.0
+
+    def nodes_per_second(self):
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+    def merge(self, other):
+        """ Adds the counts of another search (e.g. a worker's) """
+        for ply, count in enumerate(other.plyNodes):
+            self.plyNodes[ply] += count
+        self.leaves += other.leaves
+        self.cutoffs += other.cutoffs
+        self.firstCutoffs += other.firstCutoffs
+        self.ttProbes += other.ttProbes
+        self.ttHits += other.ttHits
+
+    def summary(self):
+        """ One line for the log """
+        return ('nodes=%d nps=%.0f leaves=%d cutoffs=%d first=%.1f%% '
+                'tt=%d/%d (%.1f%%) plies=%s iterations=%s' % (
+                    self.nodes, self.nodes_per_second(), self.leaves,
+                    self.cutoffs, 100 * self.first_cutoff_rate(),
+                    self.ttHits, self.ttProbes, 100 * self.tt_hit_rate(),
+                    self.nodes_per_ply(),
+                    ' '.join('d%d:%d/%.3fs' % iteration
+                             for iteration in self.iterations)))
 
 
 class Minimax(object):
 
-    def __init__(self, heuristic_eval):
+    def __init__(self, heuristic_eval, tt=None, orderer=None):
         """ Create a new minimax object
-        player - current player's color
-        opponent - opponent's color
+        heuristic_eval - evaluation function (startBoard, board, depth,
+                         player, opponent)
+        tt - optional TranspositionTable shared by every search
+        orderer - optional ordering.MoveOrderer; without one only the
+                  transposition table move is tried first
         """
         self.heuristic_eval = heuristic_eval
+        self.tt = tt
+        self.orderer = orderer
+        self.deadline = None
+        self.nodes = 0
+        self.pvTable = [[] for _ in range(MAX_DEPTH + 2)]
+        self.stats = SearchStats()  # of the last search
+        self.stopped = False
 
     # error: always return the same board in same cases
     def minimax(self, board, parentBoard, depth, player, opponent,
-                alfa=-INFINITY, beta=INFINITY):
+                alfa=-INFINITY, beta=INFINITY, ply=0):
+        if ply == 0:
+            self.stats = SearchStats()
+            start = time.time()
+        stats = self.stats
+        stats.plyNodes[ply] += 1
         bestChild = board
         if depth == 0:
+            stats.leaves += 1
             return (self.heuristic_eval(parentBoard, board, depth,
                                         player, opponent), board)
-        for child in board.next_states(player):
+        for index, child in enumerate(board.next_states(player)):
             score, newChild = self.minimax(
-                child, board, depth - 1, opponent, player, -beta, -alfa)
+                child, board, depth - 1, opponent, player, -beta, -alfa,
+                ply + 1)
             score = -score
             if score > alfa:
                 alfa = score
                 bestChild = child
             if beta <= alfa:
+                stats.cutoffs += 1
+                stats.firstCutoffs += index == 0
                 break
+        if ply == 0:
+            stats.seconds = time.time() - start
+            stats.iterations.append((depth, stats.nodes, stats.seconds))
         return (self.heuristic_eval(board, board, depth, player,
                                     opponent), bestChild)
+
+    def search(self, board, depth, player, opponent,
+               alfa=-INFINITY, beta=INFINITY, parentBoard=None, ply=0):
+        """ Principal variation search (NegaScout) walking the tree on a
+        single board with make_move/unmake_move instead of copying it for
+        every child. The first child gets the full window, the others a
+        null window and a re-search only when they land inside it.
+        Fail-soft: returns (score, move) with the backed-up child score;
+        move is None at leaves and terminal nodes. The principal variation
+        found below this node is left in self.pvTable[ply].
+
+        The evaluator scores a leaf against its parent position, so a
+        snapshot of the position is taken only at depth 1 nodes and shared
+        by all of their children. When the board tracks its features
+        (evaluator.IncrementalEvaluator) the snapshot is the tracker's
+        cached parent features rather than a copy of the board.
+
+        With a transposition table, interior nodes are probed by Zobrist
+        key and stored with their bound; the stored best move is tried
+        first. ply is the distance from the root, used for killer moves.
+        Nodes, leaves and cutoffs are counted in self.stats.
+        """
+        self.nodes += 1
+        if self.nodes % CHECK_EVERY == 0 and (
+                self.stopped or self.deadline is not None and
+                time.time() >= self.deadline):
+            raise SearchTimeout()
+
+        stats = self.stats
+        stats.plyNodes[ply] += 1
+        pvTable = self.pvTable
+        pvTable[ply] = []
+        if depth == 0:
+            stats.leaves += 1
+            return (self.heuristic_eval(parentBoard, board, depth,
+                                        player, opponent), None)
+
+        ttMove = None
+        if self.tt is not None:
+            key = position_key(board, player)
+            entry = self.tt.probe(key)
+            if entry is not None:
+                ttMove = entry[4]
+                if entry[1] >= depth:
+                    bound, score = entry[2], entry[3]
+                    if bound == EXACT or \
+                       (bound == LOWER and score >= beta) or \
+                       (bound == UPPER and score <= alfa):
+                        pvTable[ply] = [ttMove]
+                        return score, ttMove
+            origAlfa = alfa
+
+        moves = board.get_valid_moves(player)
+        frontier = None
+        if depth == 1:
+            if getattr(board, 'features', None) is None:
+                frontier = board.copy()
+            else:
+                # incremental evaluation: cached parent features instead
+                frontier = board.features.snapshot(board)
+
+        if not moves:
+            # no move: pass if the opponent can play, otherwise game over
+            if not board.get_valid_moves(opponent):
+                stats.leaves += 1
+                return (self.heuristic_eval(board, board, depth, player,
+                                            opponent), None)
+            score, _ = self.search(board, depth - 1, opponent, player,
+                                   -beta, -alfa, frontier, ply + 1)
+            pvTable[ply] = [None] + pvTable[ply + 1]
+            return -score, None
+
+        if self.orderer is not None:
+            self.orderer.order(board, moves, player, opponent, depth, ply,
+                               ttMove)
+        elif ttMove in moves:
+            moves.remove(ttMove)
+            moves.insert(0, ttMove)
+
+        bestScore = -INFINITY
+        bestMove = moves[0]
+        for index, move in enumerate(moves):
+            undo = board.make_move(move, player)
+            try:
+                if index == 0:
+                    score = -self.search(board, depth - 1, opponent, player,
+                                         -beta, -alfa, frontier, ply + 1)[0]
+                else:
+                    # null window: only proves the move is not better
+                    score = -self.search(board, depth - 1, opponent, player,
+                                         -alfa - 1, -alfa, frontier, ply + 1)[0]
+                    if alfa < score < beta:
+                        score = -self.search(board, depth - 1, opponent,
+                                             player, -beta, -alfa, frontier,
+                                             ply + 1)[0]
+            finally:
+                # keeps the board intact when a timeout unwinds the tree
+                board.unmake_move(undo)
+            if score > bestScore:
+                bestScore = score
+                bestMove = move
+                if score > alfa:
+                    alfa = score
+                    pvTable[ply] = [move] + pvTable[ply + 1]
+            if alfa >= beta:
+                stats.cutoffs += 1
+                stats.firstCutoffs += index == 0
+                if self.orderer is not None:
+                    self.orderer.cutoff(move, player, depth, ply)
+                break
+
+        if self.tt is not None:
+            if bestScore <= origAlfa:
+                bound = UPPER
+            elif bestScore >= beta:
+                bound = LOWER
+            else:
+                bound = EXACT
+            self.tt.store(key, depth, bound, bestScore, bestMove)
+        return bestScore, bestMove
+
+    def search_window(self, board, depth, player, opponent, guess):
+        """ Root search with an aspiration window of ASPIRATION_WINDOW
+        around guess (the previous iteration's score). A fail low or fail
+        high re-searches with that side opened up, so the returned score
+        is always exact.
+        """
+        alfa = guess - ASPIRATION_WINDOW
+        beta = guess + ASPIRATION_WINDOW
+        while True:
+            score, move = self.search(board, depth, player, opponent,
+                                      alfa, beta)
+            if score <= alfa and alfa > -INFINITY:
+                alfa = -INFINITY
+            elif score >= beta and beta < INFINITY:
+                beta = INFINITY
+            else:
+                return score, move
+
+    def stop(self):
+        """ Makes a running search give up as soon as possible, e.g. from
+        another thread: search raises SearchTimeout at its next clock
+        check. The caller clears self.stopped before the next search.
+        """
+        self.stopped = True
+
+    def iterative_search(self, board, player, opponent, max_depth=MAX_DEPTH,
+                         time_budget=None):
+        """ Iterative deepening: searches depth 1, 2, ... up to max_depth
+        until time_budget seconds have passed and returns the SearchResult
+        of the last completed iteration. The time budget never interrupts
+        depth 1, only stop() does. From depth 2 on, each iteration uses an
+        aspiration window around the previous score.
+
+        Each iteration leaves its best moves in the transposition table,
+        where the next, deeper iteration picks them up to order moves.
+        Without a table a temporary one is used for the call.
+
+        self.stats collects the counters of the whole call, with the nodes
+        and time of every completed iteration.
+
+        After stop() no new iteration starts and the running one is
+        abandoned, so the result may have no move at all.
+        """
+        ownTable = self.tt is None
+        if ownTable:
+            self.tt = TranspositionTable(memory_mb=1)
+        if self.orderer is not None:
+            self.orderer.new_search()
+        self.nodes = 0
+        stats = self.stats = SearchStats()
+        probes, hits = self.tt.probes, self.tt.hits
+        result = SearchResult(None, 0, [], 0, 0)
+        whites, blacks, empty = board.count_stones()
+        start = time.time()
+        try:
+            for depth in range(1, min(max_depth, empty) + 1):
+                if self.stopped:
+                    break
+                iterationStart = time.time()
+                try:
+                    if depth == 1:
+                        score, move = self.search(board, depth, player,
+                                                  opponent)
+                    else:
+                        score, move = self.search_window(
+                            board, depth, player, opponent, result.score)
+                except SearchTimeout:
+                    break
+                result = SearchResult(move, score, self.pvTable[0],
+                                      self.nodes, depth)
+                stats.iterations.append((depth, self.nodes,
+                                         time.time() - iterationStart))
+                if move is None:
+                    break  # no legal move or the game is over
+                if time_budget is not None:
+                    if time.time() - start >= time_budget:
+                        break
+                    self.deadline = start + time_budget
+        finally:
+            self.deadline = None
+            stats.seconds = time.time() - start
+            stats.ttProbes = self.tt.probes - probes
+            stats.ttHits = self.tt.hits - hits
+            if ownTable:
+                self.tt = None
+        return result
@@ -0,0 +1,137 @@
+from bitboard import BitBoard
+from board import Board
+from evaluator import Evaluator, IncrementalEvaluator
+from minimax import Minimax
+from transposition import TranspositionTable
+from ordering import MoveOrderer
+import random
+import time
+import unittest
+from config import WHITE, BLACK
+
+
+def midgame_board(plies=20, seed=5, cls=BitBoard):
+    rng = random.Random(seed)
+    b = cls()
+    color = BLACK
+    for _ in range(plies):
+        moves = b.get_valid_moves(color)
+        if moves:
+            b.apply_move(rng.choice(moves), color)
+        color = WHITE if color == BLACK else BLACK
+    return b, color
+
+
+def negamax(evaluator, board, depth, player, opponent, parent=None):
+    """ Plain negamax without pruning, the reference for search scores. """
+    if depth == 0:
+        return evaluator.score(parent, board, 0, player, opponent)
+    moves = board.get_valid_moves(player)
+    frontier = board.copy() if depth == 1 else None
+    if not moves:
+        if not board.get_valid_moves(opponent):
+            return evaluator.score(board, board, depth, player, opponent)
+        return -negamax(evaluator, board, depth - 1, opponent, player, frontier)
+    best = None
+    for move in moves:
+        undo = board.make_move(move, player)
+        score = -negamax(evaluator, board, depth - 1, opponent, player, frontier)
+        board.unmake_move(undo)
+        if best is None or score > best:
+            best = score
+    return best
+
+
+class TestMinimax(unittest.TestCase):
+    def test_pvs_matches_negamax(self):
+        evaluator = Evaluator()
+        for seed in range(5, 9):
+            with self.subTest(seed=seed):
+                b, color = midgame_board(seed=seed)
+                other = WHITE if color == BLACK else BLACK
+                expected = negamax(evaluator, b, 3, color, other)
+                minimax = Minimax(evaluator.score, orderer=MoveOrderer())
+                result = minimax.iterative_search(b, color, other, 3)
+                self.assertEqual(result.score, expected)
+                self.assertEqual(result.pv[0], result.move)
+                self.assertEqual(len(result.pv), 3)
+                self.assertEqual(result.nodes, minimax.nodes)
+
+    def test_tt_keeps_score(self):
+        b, color = midgame_board()
+        other = WHITE if color == BLACK else BLACK
+        plain = Minimax(Evaluator().score).search(b, 3, color, other)
+        cached = Minimax(Evaluator().score, TranspositionTable(1)).search(
+            b, 3, color, other)
+        self.assertEqual(plain[0], cached[0])
+
+    def test_ordering_keeps_score(self):
+        b, color = midgame_board(seed=6)
+        other = WHITE if color == BLACK else BLACK
+        plain = Minimax(Evaluator().score)
+        ordered = Minimax(Evaluator().score, orderer=MoveOrderer())
+        self.assertEqual(plain.search(b, 3, color, other)[0],
+                         ordered.search(b, 3, color, other)[0])
+        self.assertLess(ordered.nodes, plain.nodes)
+        self.assertGreater(ordered.stats.first_cutoff_rate(), 0.5)
+
+    def test_iterative_search_budget(self):
+        b, color = midgame_board()
+        other = WHITE if color == BLACK else BLACK
+        start = time.time()
+        result = Minimax(Evaluator().score).iterative_search(
+            b, color, other, time_budget=0.2)
+        self.assertLess(time.time() - start, 1.0)
+        self.assertIn(result.move, b.get_valid_moves(color))
+        self.assertGreaterEqual(result.depth, 1)
+
+    def test_incremental_eval_matches(self):
+        for plies in (10, 30, 50):
+            with self.subTest(plies=plies):
+                b, color = midgame_board(plies, cls=Board)
+                other = WHITE if color == BLACK else BLACK
+                full = Minimax(Evaluator().score).search(b, 3, color, other)
+                evaluator = IncrementalEvaluator()
+                evaluator.attach(b)
+                tracked = Minimax(evaluator.score).search(b, 3, color, other)
+                evaluator.detach(b)
+                self.assertEqual(full, tracked)
+
+    def test_stop(self):
+        b, color = midgame_board()
+        other = WHITE if color == BLACK else BLACK
+        minimax = Minimax(Evaluator().score)
+        minimax.stop()
+        result = minimax.iterative_search(b, color, other, 4)
+        self.assertIsNone(result.move)
+        self.assertEqual(result.depth, 0)
+        minimax.stopped = False
+        result = minimax.iterative_search(b, color, other, 2)
+        self.assertEqual(result.depth, 2)
+
+    def test_search_stats(self):
+        b, color = midgame_board()
+        other = WHITE if color == BLACK else BLACK
+        minimax = Minimax(Evaluator().score, TranspositionTable(),
+                          MoveOrderer())
+        result = minimax.iterative_search(b, color, other, 4)
+        stats = minimax.stats
+        self.assertEqual(stats.nodes, result.nodes)
+        self.assertEqual(len(stats.nodes_per_ply()), 5)
+        self.assertEqual([it[0] for it in stats.iterations], [1, 2, 3, 4])
+        self.assertEqual(stats.iterations[-1][1], result.nodes)
+        self.assertGreater(stats.leaves, 0)
+        self.assertLessEqual(stats.firstCutoffs, stats.cutoffs)
+        self.assertGreater(stats.cutoffs, 0)
+        self.assertLessEqual(stats.ttHits, stats.ttProbes)
+        self.assertGreater(stats.ttProbes, 0)
+        self.assertGreater(stats.nodes_per_second(), 0)
+
+        minimax.minimax(b, b, 2, color, other)
+        stats = minimax.stats
+        moves = len(b.get_valid_moves(color))
+        self.assertEqual(stats.nodes_per_ply()[:2], [1, moves])
+        self.assertEqual(stats.iterations[0][:2], (2, stats.nodes))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+ordering.py - SẮP XẾP NƯỚC ĐI CHO MINIMAX
+
+Alpha-beta cắt tỉa tốt nhất khi nước đi tốt được thử trước. Thứ tự từ
+Board.get_valid_moves gần như ngẫu nhiên (list(set(...))), nên file này
+cung cấp một bước sắp xếp có thể lắp ghép từ nhiều nguồn:
+
+1. Nước đi tốt nhất trong bảng chuyển vị (luôn đứng đầu)
+2. Killer moves: nước đi gây cắt beta ở cùng độ sâu (ply)
+3. History heuristic: nước đi từng gây cắt beta ở bất kỳ đâu
+4. Ưu tiên ô tĩnh: góc trước, X-square/C-square sau cùng
+5. Fastest-first: nước đi để lại ít nước đi nhất cho đối thủ
+
+MoveOrderer còn đếm tỉ lệ cắt beta ngay ở nước đi đầu tiên - thước đo
+chất lượng sắp xếp (càng gần 100% càng tốt).
+"""
+
+# Ưu tiên tĩnh của từng ô: góc cao nhất, X-square (1,1) thấp nhất,
+# C-square (0,1) thấp, cạnh khá
+SQUARE_PRIORITY = [
+    [100, -20, 10,  5,  5, 10, -20, 100],
+    [-20, -50, -2, -2, -2, -2, -50, -20],
+    [10,   -2,  1,  1,  1,  1,  -2,  10],
+    [5,    -2,  1,  0,  0,  1,  -2,   5],
+    [5,    -2,  1,  0,  0,  1,  -2,   5],
+    [10,   -2,  1,  1,  1,  1,  -2,  10],
+    [-20, -50, -2, -2, -2, -2, -50, -20],
+    [100, -20, 10,  5,  5, 10, -20, 100],
+]
+
+KILLER_BONUS = 1000   # Killer thứ nhất; killer thứ hai được KILLER_BONUS - 100
+HISTORY_MAX = 800     # Giới hạn điểm history để không lấn át killer
+MOBILITY_WEIGHT = 10  # Điểm trừ cho mỗi nước đi còn lại của đối thủ
+
+
+class SquarePriority(object):
+    """NGUỒN 1: ƯU TIÊN Ô TĨNH (góc trước, ô cạnh góc sau cùng)"""
+
+    def __init__(self, table=SQUARE_PRIORITY):
+        self.table = table
+
+    def score(self, board, move, player, opponent, depth, ply):
+        return self.table[move[0]][move[1]]
+
+    def update(self, move, player, depth, ply):
+        pass
+
+    def new_search(self):
+        pass
+
+
+class Killers(object):
+    """NGUỒN 2: KILLER MOVES - 2 nước đi gây cắt beta gần nhất ở mỗi ply"""
+
+    def __init__(self):
+        self.slots = {}  # ply -> [killer 1, killer 2]
+
+    def score(self, board, move, player, opponent, depth, ply):
+        slot = self.slots.get(ply)
+        if slot is not None:
+            if move == slot[0]:
+                return KILLER_BONUS
+            if move == slot[1]:
+                return KILLER_BONUS - 100
+        return 0
+
+    def update(self, move, player, depth, ply):
+        slot = self.slots.setdefault(ply, [None, None])
+        if move != slot[0]:
+            slot[1] = slot[0]
+            slot[0] = move
+
+    def new_search(self):
+        self.slots = {}
+
+
+class History(object):
+    """NGUỒN 3: HISTORY HEURISTIC - cộng depth^2 mỗi khi nước đi gây cắt beta"""
+
+    def __init__(self):
+        self.table = [[0] * 64 for _ in range(3)]  # [màu][ô]
+
+    def score(self, board, move, player, opponent, depth, ply):
+        return min(self.table[player][move[0] * 8 + move[1]], HISTORY_MAX)
+
+    def update(self, move, player, depth, ply):
+        self.table[player][move[0] * 8 + move[1]] += depth * depth
+
+    def new_search(self):
+        # Giảm một nửa để thông tin cũ mờ dần qua các nước đi
+        for row in self.table:
+            for i in range(64):
+                row[i] //= 2
+
+
+class Mobility(object):
+    """
+    NGUỒN 4: FASTEST-FIRST - ưu tiên nước đi để lại ít nước đi cho đối thủ
+
+    Phải thực hiện thử từng nước đi nên khá tốn, chỉ dùng khi độ sâu còn
+    lại >= min_depth (gần gốc, nơi sắp xếp tốt tiết kiệm nhiều nhất).
+    """
+
+    def __init__(self, min_depth=3):
+        self.min_depth = min_depth
+
+    def score(self, board, move, player, opponent, depth, ply):
+        if depth < self.min_depth:
+            return 0
+        undo = board.make_move(move, player)
+        replies = len(board.get_valid_moves(opponent))
+        board.unmake_move(undo)
+        return -MOBILITY_WEIGHT * replies
+
+    def update(self, move, player, depth, ply):
+        pass
+
+    def new_search(self):
+        pass
+
+
+class MoveOrderer(object):
+
+    """
+    BƯỚC SẮP XẾP NƯỚC ĐI - TỔNG HỢP ĐIỂM TỪ CÁC NGUỒN
+
+    Mỗi nguồn có score(board, move, player, opponent, depth, ply),
+    update(move, player, depth, ply) khi cắt beta, và new_search().
+    Nước đi trong bảng chuyển vị luôn được đặt lên đầu.
+    """
+
+    def __init__(self, sources=None):
+        """
+        Args:
+            sources: Danh sách nguồn; mặc định dùng cả 4 nguồn
+        """
+        if sources is None:
+            sources = [SquarePriority(), Killers(), History(), Mobility()]
+        self.sources = sources
+
+    def order(self, board, moves, player, opponent, depth, ply, ttMove=None):
+        """
+        SẮP XẾP DANH SÁCH NƯỚC ĐI (tại chỗ), điểm cao trước
+
+        Returns:
+            list: Chính danh sách moves đã được sắp xếp
+        """
+        if len(moves) > 1:
+            keys = {}
+            for move in moves:
+                key = 0
+                for source in self.sources:
+                    key += source.score(board, move, player, opponent, depth, ply)
+                keys[move] = key
+            moves.sort(key=keys.__getitem__, reverse=True)
+        if ttMove is not None and ttMove in moves:
+            moves.remove(ttMove)
+            moves.insert(0, ttMove)
+        return moves
+
+    def cutoff(self, move, player, depth, ply):
+        """
+        GHI NHẬN CẮT BETA: cập nhật killer/history
+        (số lần cắt được đếm trong minimax.SearchStats)
+        """
+        for source in self.sources:
+            source.update(move, player, depth, ply)
+
+    def new_search(self):
+        """Bắt đầu nước đi mới: xóa killer, làm mờ history"""
+        for source in self.sources:
+            source.new_search()
@@ -6,14 +6,21 @@ KHỞI TẠO TRÒ CHƠI VÀ VÒNG LẶP CHÍNH
 - Quản lý luồng chính: menu -> thiết lập -> chơi game -> kết thúc
 """
 
+import sys
 import pygame  # Thư viện đồ họa và xử lý sự kiện
+from pygame.locals import QUIT, KEYDOWN, K_ESCAPE, MOUSEBUTTONDOWN, \
+    NOEVENT, VIDEOEXPOSE, WINDOWEXPOSED, USEREVENT
 import ui       # Module giao diện người dùng
 import player   # Module các loại người chơi (Human, Computer)
 import board    # Module bảng cờ và logic game
 from config import BLACK, WHITE, HUMAN  # Hằng số màu và loại người chơi
-from evaluator import Evaluator          # Module đánh giá tình thế
+from winprob import WinProbability      # Tỉ lệ thắng từ điểm tìm kiếm / bảng tính sẵn
 import log      # Module ghi log
 
+AI_MOVE = USEREVENT + 1   # Sự kiện: Computer đã tìm xong nước đi
+THINKING_INTERVAL = 300   # ms giữa 2 lần vẽ lại chữ "Thinking"
+TIE = 0                   # Kết quả hòa (start_turn)
+
 # Thiết lập logger để ghi lại thông tin debug và hoạt động game
 logger = log.setup_custom_logger('root')
 
@@ -40,12 +47,12 @@ class Othello:
         KHỞI TẠO GAME
         - Tạo giao diện người dùng (GUI)
         - Tạo bảng cờ 8x8
-        - Tạo module đánh giá tình thế
+        - Tạo bảng nhớ tỉ lệ thắng
         - Hiển thị menu chính để người dùng chọn
         """
         self.gui = ui.Gui()               # Giao diện đồ họa với pygame
         self.board = board.Board()        # Bảng cờ 8x8 với logic game
-        self.evaluator = Evaluator()      # AI đánh giá tình thế và tính xác suất thắng
+        self.winProbability = WinProbability()  # Tỉ lệ thắng hiển thị, nhớ theo vị trí
         self.gui.show_menu(self.start)    # Hiển thị menu và chờ người dùng chọn
 
     def start(self, *args):
@@ -81,8 +88,7 @@ class Othello:
         self.gui.show_game()  # Chuyển từ menu sang màn hình chơi
 
         # Tính xác suất thắng ban đầu (ở vị thế khởi đầu thường là 50-50)
-        black_win_prob, white_win_prob = self.evaluator.calculate_win_probability(
-            self.board, BLACK, WHITE)
+        black_win_prob, white_win_prob = self.winProbability.estimate(self.board)
 
         # Cập nhật giao diện: bảng cờ, điểm số (2-2), người chơi hiện tại, xác suất thắng
         self.gui.update(self.board.board, 2, 2, self.now_playing.color,
@@ -99,65 +105,154 @@ class Othello:
         4. Chuyển lượt cho người chơi khác
         5. Lặp lại cho đến khi game kết thúc
 
+        Một bộ điều phối sự kiện duy nhất: vòng lặp ngủ trong
+        pygame.event.wait cho tới khi có sự kiện, nên khi chờ người chơi
+        gần như không tốn CPU.
+        - MOUSEBUTTONDOWN: nước đi của người
+        - AI_MOVE: Computer tìm xong ở luồng nền (start_move), kết quả được
+          gửi vào hàng đợi sự kiện thay vì hỏi vòng (poll)
+        - Hết thời gian chờ khi Computer đang tìm: vẽ chữ "Thinking"
+        - Cửa sổ cần vẽ lại (expose): vẽ lại toàn màn hình
+        - QUIT thoát game, Esc (khi Computer đang tìm) hủy ván và về menu
+        Trong lượt của người, AI tìm trước nước đáp trả cho nước đi người có
+        khả năng chọn nhất (ponder).
+
         Cách tính điểm: Đếm số quân đen vs trắng trên bảng
         """
-        clock = pygame.time.Clock()  # Điều khiển FPS (60 frame/giây)
+        self.pending = None  # Future: nước đi Computer đang tính ở luồng nền
+        winner = self.start_turn()
+
+        while winner is None:  # Vòng lặp game chính
+            timeout = THINKING_INTERVAL if self.pending is not None else 0
+            event = pygame.event.wait(timeout)  # 0 = chờ không giới hạn
+
+            if event.type == QUIT:
+                self.close_players()  # Luồng nền dừng ngay
+                sys.exit(0)
+
+            elif event.type == NOEVENT:
+                # Hết thời gian chờ: Computer vẫn đang suy nghĩ
+                if self.pending is not None:
+                    self.gui.show_thinking(self.now_playing.color)
+
+            elif event.type in (VIDEOEXPOSE, WINDOWEXPOSED):
+                self.gui.redraw()
+
+            elif event.type == KEYDOWN and event.key == K_ESCAPE:
+                if self.pending is not None:
+                    self.now_playing.cancel()  # Bỏ kết quả, về menu
+                    self.restart()
+                    return
+
+            elif event.type == AI_MOVE:
+                if event.future is not self.pending:
+                    continue  # Kết quả của tìm kiếm đã bị hủy
+                self.pending = None
+                self.gui.hide_thinking(self.now_playing.color)
+                score, self.board = self.now_playing.play(event.future.result())
+                self.show_position()
+                if not isinstance(self.other_player, player.Engine):
+                    # Đối thủ là người: AI tìm trước trong lúc người suy nghĩ
+                    self.now_playing.start_ponder()
+                winner = self.next_turn()
+
+            elif event.type == MOUSEBUTTONDOWN and self.pending is None:
+                # Human: click chuột vào một ô hợp lệ
+                move = self.gui.square_at(event.pos)
+                if move in self.board.get_valid_moves(self.now_playing.color):
+                    score, self.board = self.now_playing.play(move)
+                    self.show_position()
+                    winner = self.next_turn()
 
-        while True:  # Vòng lặp game chính
-            clock.tick(60)  # Giới hạn 60 FPS để game mượt mà
+        # HIỂN THỊ KẾT QUẢ CUỐI GAME
+        self.gui.show_winner(winner)
+        pygame.time.wait(1000)  # Chờ 1 giây để người chơi xem kết quả
+        self.restart()          # Khởi động lại game
 
+    def next_turn(self):
+        """
+        CHUYỂN LƯỢT: Hoán đổi người chơi hiện tại và người chơi khác
+        """
+        self.now_playing, self.other_player = self.other_player, self.now_playing
+        return self.start_turn()
+
+    def start_turn(self):
+        """
+        BẮT ĐẦU LƯỢT CỦA now_playing
+
+        - Không có nước đi hợp lệ: bỏ lượt
+        - Computer: bắt đầu tìm kiếm ở luồng nền, khi xong gửi sự kiện AI_MOVE
+        - Human: không làm gì, chờ click chuột
+
+        Returns:
+            Màu người thắng (TIE nếu hòa) khi game kết thúc, ngược lại None
+        """
+        while True:
             # KIỂM TRA ĐIỀU KIỆN KẾT THÚC GAME
             if self.board.game_ended():
                 whites, blacks, empty = self.board.count_stones()  # Đếm quân cuối game
 
                 # XÁC ĐỊNH NGƯỜI THẮNG DỰA TRÊN SỐ QUÂN
                 if whites > blacks:
-                    winner = WHITE      # Trắng thắng
+                    return WHITE      # Trắng thắng
                 elif blacks > whites:
-                    winner = BLACK      # Đen thắng
-                else:
-                    winner = None       # Hòa
-                break  # Thoát vòng lặp game
+                    return BLACK      # Đen thắng
+                return TIE            # Hòa
 
             # CẬP NHẬT TRẠNG THÁI CHO NGƯỜI CHƠI HIỆN TẠI
             self.now_playing.get_current_board(self.board)  # Đưa bảng cờ hiện tại cho người chơi
 
-            # LẤY DANH SÁCH NƯỚC ĐI HỢP LỆ
-            valid_moves = self.board.get_valid_moves(self.now_playing.color)
-
             # NẾU CÓ NƯỚC ĐI HỢP LỆ
-            if valid_moves != []:
-                # Người chơi thực hiện nước đi (Human: click chuột, Computer: minimax)
-                score, self.board = self.now_playing.get_move()
-
-                # ĐẾM LẠI QUÂN SAU NƯỚC ĐI
-                whites, blacks, empty = self.board.count_stones()
+            if self.board.get_valid_moves(self.now_playing.color) != []:
+                break
+            self.now_playing, self.other_player = self.other_player, self.now_playing
 
-                # TÍNH XÁC SUẤT THẮNG SAU NƯỚC ĐI (dùng AI đánh giá)
-                black_win_prob, white_win_prob = self.evaluator.calculate_win_probability(
-                    self.board, BLACK, WHITE)
+        if isinstance(self.now_playing, player.Engine):
+            self.pending = self.now_playing.start_move()
+            # Gọi từ luồng nền khi xong; pygame.event.post an toàn giữa các luồng
+            self.pending.add_done_callback(
+                lambda future: pygame.event.post(
+                    pygame.event.Event(AI_MOVE, future=future)))
+        return None
 
-                # CẬP NHẬT GIAO DIỆN với trạng thái mới
-                self.gui.update(self.board.board, blacks, whites,
-                                self.now_playing.color, black_win_prob, white_win_prob)
+    def show_position(self):
+        """
+        CẬP NHẬT GIAO DIỆN SAU MỘT NƯỚC ĐI: số quân và xác suất thắng
+        """
+        # ĐẾM LẠI QUÂN SAU NƯỚC ĐI
+        whites, blacks, empty = self.board.count_stones()
+
+        # TỈ LỆ THẮNG SAU NƯỚC ĐI: từ điểm Computer vừa tìm được nếu có,
+        # không chấm lại vị trí trên luồng giao diện
+        if isinstance(self.now_playing, player.Computer):
+            black_win_prob, white_win_prob = self.winProbability.estimate(
+                self.board, self.now_playing.lastResult,
+                self.now_playing.color, self.now_playing.lastSolved)
+        else:
+            black_win_prob, white_win_prob = self.winProbability.estimate(self.board)
 
-            # CHUYỂN LƯỢT: Hoán đổi người chơi hiện tại và người chơi khác
-            self.now_playing, self.other_player = self.other_player, self.now_playing
+        # CẬP NHẬT GIAO DIỆN với trạng thái mới
+        self.gui.update(self.board.board, blacks, whites,
+                        self.now_playing.color, black_win_prob, white_win_prob)
 
-        # HIỂN THỊ KẾT QUẢ CUỐI GAME
-        self.gui.show_winner(winner)
-        pygame.time.wait(1000)  # Chờ 1 giây để người chơi xem kết quả
-        self.restart()          # Khởi động lại game
+    def close_players(self):
+        """
+        DỪNG TÌM KIẾM ĐANG CHẠY VÀ GIẢI PHÓNG TÀI NGUYÊN CỦA CÁC AI
+        """
+        for current in (self.now_playing, self.other_player):
+            if isinstance(current, player.Engine):
+                current.close()
 
     def restart(self):
         """
         KHỞI ĐỘNG LẠI GAME
         - Tạo bảng cờ mới (trở về trạng thái ban đầu)
-        - Tạo evaluator mới
+        - Xóa bảng nhớ tỉ lệ thắng
         - Hiển thị menu để chọn lại
         """
+        self.close_players()            # Dừng và giải phóng AI của ván cũ
         self.board = board.Board()      # Bảng cờ mới với 4 quân ở giữa
-        self.evaluator = Evaluator()    # Evaluator mới
+        self.winProbability = WinProbability()  # Bảng nhớ tỉ lệ thắng mới
         self.gui.show_menu(self.start)  # Về menu chính
         self.run()                      # Bắt đầu vòng lặp game mới
 
@@ -0,0 +1,243 @@
+"""
+parallel.py - TÌM KIẾM SONG SONG Ở GỐC TRÊN NHIỀU NHÂN CPU
+
+Minimax chạy trong một tiến trình Python nên chỉ dùng được một nhân.
+ParallelSearch chia các nước đi ở gốc cho một ProcessPoolExecutor theo
+kiểu young brothers wait:
+1. Nước đi đầu tiên (tốt nhất ở lần lặp trước) được tìm một mình với cửa
+   sổ đầy đủ => có ngay một alpha tốt
+2. Các nước đi còn lại ("em") được tìm đồng thời với cửa sổ rỗng quanh
+   alpha; chỉ nước đi vượt alpha mới phải tìm lại với cửa sổ đầy đủ
+
+Alpha được chia sẻ giữa các worker qua một multiprocessing.Value: mỗi
+worker đọc alpha mới nhất khi nhận việc và cập nhật khi tìm được điểm
+chính xác cao hơn. Các worker dùng chung một SharedTranspositionTable
+nên vị trí một worker đã tìm không phải tìm lại ở worker khác. Pool được
+tạo một lần và dùng lại cho mọi nước đi.
+"""
+
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from config import SEARCH_WORKERS, TT_MEMORY_MB
+from evaluator import IncrementalEvaluator
+from minimax import Minimax, SearchResult, SearchStats, SearchTimeout, \
+    INFINITY, MAX_DEPTH
+from ordering import MoveOrderer, SQUARE_PRIORITY
+from transposition import SharedTranspositionTable
+
+_alpha = None   # multiprocessing.Value: alpha tốt nhất hiện tại ở gốc
+_worker = None  # (evaluator, Minimax) riêng của tiến trình worker
+
+
+class _SharedFlag(object):
+
+    """
+    CỜ DỪNG DÙNG CHUNG: đặt làm Minimax.stopped của worker, để
+    ParallelSearch.stop() ở tiến trình chính dừng được tìm kiếm của worker
+    """
+
+    def __init__(self, value):
+        self.value = value  # multiprocessing.Value('b')
+
+    def __bool__(self):
+        return self.value.value != 0
+
+
+def _init_worker(alpha, tt, stopped):
+    """Khởi tạo worker (chạy một lần trong mỗi tiến trình của pool)"""
+    global _alpha, _worker
+    _alpha = alpha
+    evaluator = IncrementalEvaluator()
+    minimax = Minimax(evaluator.score, tt, MoveOrderer())
+    minimax.stopped = _SharedFlag(stopped)
+    _worker = (evaluator, minimax)
+
+
+def _search_move(board, move, depth, player, opponent, deadline):
+    """
+    TÌM KIẾM MỘT NƯỚC ĐI Ở GỐC (chạy trong worker)
+
+    Returns:
+        tuple (move, score, exact, pv, nodes, stats), hoặc None nếu hết
+        giờ. exact = False nghĩa là score chỉ là cận trên (<= alpha lúc
+        tìm); stats là SearchStats của riêng nước đi này
+    """
+    evaluator, minimax = _worker
+    minimax.nodes = 0
+    stats = minimax.stats = SearchStats()
+    probes, hits = minimax.tt.probes, minimax.tt.hits
+    minimax.deadline = deadline
+    tracked = hasattr(board, 'features')
+    if tracked:
+        evaluator.attach(board)
+    frontier = None
+    if depth == 1:
+        frontier = board.features.snapshot(board) if tracked else board.copy()
+
+    alfa = _alpha.value
+    board.make_move(move, player)
+    try:
+        score = None
+        if alfa > -INFINITY:
+            # Cửa sổ rỗng: đa số nước đi chỉ cần chứng minh không tốt hơn
+            score = -minimax.search(board, depth - 1, opponent, player,
+                                    -alfa - 1, -alfa, frontier, 1)[0]
+        if score is None or score > alfa:
+            score = -minimax.search(board, depth - 1, opponent, player,
+                                    -INFINITY, -alfa, frontier, 1)[0]
+    except SearchTimeout:
+        return None
+    finally:
+        minimax.deadline = None
+        stats.ttProbes = minimax.tt.probes - probes
+        stats.ttHits = minimax.tt.hits - hits
+
+    exact = score > alfa
+    if exact:
+        with _alpha.get_lock():
+            if score > _alpha.value:
+                _alpha.value = score
+    return (move, score, exact, [move] + minimax.pvTable[1], minimax.nodes,
+            stats)
+
+
+class ParallelSearch(object):
+
+    """
+    TÌM KIẾM SONG SONG Ở GỐC - YOUNG BROTHERS WAIT
+
+    Cùng giao diện iterative_search() với Minimax. Cần ít nhất 2 nước đi
+    ở gốc; khi phải bỏ lượt hãy dùng Minimax thường.
+    """
+
+    def __init__(self, workers=SEARCH_WORKERS, memory_mb=TT_MEMORY_MB):
+        """
+        Args:
+            workers: Số tiến trình worker
+            memory_mb: Bộ nhớ cho bảng chuyển vị dùng chung
+        """
+        self.workers = workers
+        self.alpha = multiprocessing.Value('i', -INFINITY)
+        self.stopped = multiprocessing.Value('b', 0)
+        self.tt = SharedTranspositionTable(memory_mb)
+        self.pool = None
+        self.nodes = 0
+        self.stats = SearchStats()  # Cộng dồn từ các worker
+
+    def _get_pool(self):
+        """Tạo pool lần đầu, sau đó dùng lại (không spawn lại mỗi nước)"""
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(self.workers,
+                                            initializer=_init_worker,
+                                            initargs=(self.alpha, self.tt,
+                                                      self.stopped))
+        return self.pool
+
+    def stop(self):
+        """Dừng iterative_search() đang chạy (có thể từ luồng khác)"""
+        self.stopped.value = 1
+
+    def resume(self):
+        """Xóa cờ dừng trước lần tìm kiếm tiếp theo"""
+        self.stopped.value = 0
+
+    def close(self):
+        """Dừng các tiến trình worker và giải phóng bảng dùng chung"""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        if self.tt is not None:
+            self.tt.close()
+            self.tt = None
+
+    def search(self, board, depth, player, opponent, moves, deadline=None):
+        """
+        MỘT LẦN LẶP Ở ĐỘ SÂU depth
+
+        Args:
+            moves: Nước đi ở gốc, nước đi đầu tiên được tìm trước một mình
+
+        Returns:
+            list: Kết quả (move, score, exact, pv, nodes, stats) theo thứ
+            tự moves
+
+        Raises:
+            SearchTimeout: Khi hết giờ trước khi xong mọi nước đi
+        """
+        pool = self._get_pool()
+        self.alpha.value = -INFINITY
+        eldest = pool.submit(_search_move, board, moves[0], depth, player,
+                             opponent, deadline).result()
+        if eldest is None:
+            raise SearchTimeout()
+        futures = [pool.submit(_search_move, board, move, depth, player,
+                               opponent, deadline) for move in moves[1:]]
+        results = [eldest]
+        for future in futures:
+            result = future.result()
+            if result is None:
+                for other in futures:
+                    other.cancel()
+                for other in futures:
+                    if not other.cancelled():
+                        other.result()  # Chờ worker dừng theo deadline
+                raise SearchTimeout()
+            results.append(result)
+        self.nodes += sum(result[4] for result in results)
+        self.stats.plyNodes[0] += 1
+        for result in results:
+            self.stats.merge(result[5])
+        return results
+
+    def iterative_search(self, board, player, opponent, max_depth=MAX_DEPTH,
+                         time_budget=None):
+        """
+        TÌM KIẾM SÂU DẦN, GIỐNG Minimax.iterative_search()
+
+        Mỗi lần lặp sắp xếp lại các nước đi ở gốc theo điểm của lần lặp
+        trước (nước tốt nhất đầu tiên).
+
+        Returns:
+            SearchResult của lần lặp hoàn chỉnh cuối cùng
+        """
+        moves = board.get_valid_moves(player)
+        moves.sort(key=lambda move: SQUARE_PRIORITY[move[0]][move[1]],
+                   reverse=True)
+        self.nodes = 0
+        self.stats = SearchStats()
+        self.tt.new_search()
+        result = SearchResult(None, 0, [], 0, 0)
+        whites, blacks, empty = board.count_stones()
+        board = board.copy()
+        start = time.time()
+        deadline = None
+        for depth in range(1, min(max_depth, empty) + 1):
+            if self.stopped.value:
+                break
+            iterationStart = time.time()
+            try:
+                results = self.search(board, depth, player, opponent, moves,
+                                      deadline)
+            except SearchTimeout:
+                break
+            # Nước có điểm chính xác cao nhất; nước không chính xác có điểm
+            # <= alpha lúc tìm nên không thể là nước tốt nhất
+            best = None
+            for item in results:
+                if item[2] and (best is None or item[1] > best[1]):
+                    best = item
+            result = SearchResult(best[0], best[1], best[3], self.nodes, depth)
+            self.stats.iterations.append((depth, self.nodes,
+                                          time.time() - iterationStart))
+            scores = dict((item[0], (item[2], item[1])) for item in results)
+            moves.sort(key=scores.__getitem__, reverse=True)
+            moves.remove(best[0])
+            moves.insert(0, best[0])
+            if time_budget is not None:
+                if time.time() - start >= time_budget:
+                    break
+                deadline = start + time_budget
+        self.stats.seconds = time.time() - start
+        return result
@@ -0,0 +1,38 @@
+from board import Board
+from evaluator import Evaluator
+from minimax_test import midgame_board, negamax
+from parallel import ParallelSearch
+import unittest
+from config import WHITE, BLACK
+
+
+class TestParallelSearch(unittest.TestCase):
+    def test_matches_negamax(self):
+        search = ParallelSearch(2)
+        try:
+            for seed in (5, 6):
+                with self.subTest(seed=seed):
+                    b, color = midgame_board(seed=seed, cls=Board)
+                    other = WHITE if color == BLACK else BLACK
+                    expected = negamax(Evaluator(), b, 3, color, other)
+                    result = search.iterative_search(b, color, other, 3)
+                    self.assertEqual(result.score, expected)
+                    self.assertEqual(result.pv[0], result.move)
+                    self.assertEqual(result.depth, 3)
+        finally:
+            search.close()
+
+    def test_stop(self):
+        search = ParallelSearch(2)
+        try:
+            b, color = midgame_board(cls=Board)
+            other = WHITE if color == BLACK else BLACK
+            search.stop()
+            self.assertEqual(search.iterative_search(b, color, other, 3).depth, 0)
+            search.resume()
+            self.assertEqual(search.iterative_search(b, color, other, 2).depth, 2)
+        finally:
+            search.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+pattern.py - HÀM ĐÁNH GIÁ BẰNG BẢNG MẪU (PATTERN TABLES)
+
+Thay cho 6 đặc trưng viết tay của Evaluator, điểm của một vị trí là tổng
+các giá trị tra từ bảng mẫu:
+- Cạnh (8 ô), góc 2x5 (10 ô), góc 3x3 (9 ô)
+- Đường chéo dài 8, 7, 6, 5, 4 ô
+Mỗi mẫu được áp dụng ở mọi vị trí đối xứng của nó trên bảng (ví dụ 4 cạnh,
+8 góc 2x5) và các vị trí này dùng chung một bảng.
+
+Chỉ số của một mẫu là số hệ cơ số 3 của các ô: 0 = trống, 1 = quân người
+đi, 2 = quân đối thủ. Mỗi giai đoạn game (theo số quân) có một bộ bảng
+riêng, lưu dạng mảng NumPy trong một file .npz nén.
+
+Chưa có file trọng số thì dùng bộ trọng số mặc định suy ra từ bảng điểm
+từng ô (góc cao, X-square thấp) cộng điểm số quân ở giai đoạn cuối.
+"""
+
+import os
+import numpy as np
+
+from config import BLACK, PATTERN_WEIGHTS
+from evaluator import Evaluator
+from ordering import SQUARE_PRIORITY
+from symmetry import SYMMETRIES
+
+# Các mẫu gốc, mỗi mẫu là dãy ô (row, col)
+PATTERNS = (
+    ('edge', tuple((0, c) for c in range(8))),
+    ('corner2x5', tuple((r, c) for r in range(2) for c in range(5))),
+    ('corner3x3', tuple((r, c) for r in range(3) for c in range(3))),
+    ('diagonal8', tuple((i, i) for i in range(8))),
+    ('diagonal7', tuple((i, i + 1) for i in range(7))),
+    ('diagonal6', tuple((i, i + 2) for i in range(6))),
+    ('diagonal5', tuple((i, i + 3) for i in range(5))),
+    ('diagonal4', tuple((i, i + 4) for i in range(4))),
+)
+MAX_SQUARES = 10  # Mẫu dài nhất; mẫu ngắn hơn được đệm bằng ô giả số 64
+
+PHASES = 4          # Số giai đoạn game
+PHASE_DISCS = 15    # Mỗi giai đoạn kéo dài chừng này quân
+
+# Bộ trọng số mặc định theo giai đoạn: hệ số cho bảng điểm từng ô và
+# điểm cho mỗi quân (chênh lệch quân quan trọng dần về cuối ván)
+DEFAULT_POSITIONAL = (1.0, 1.0, 0.7, 0.3)
+DEFAULT_DISC = (0.0, 0.0, 2.0, 8.0)
+
+# Mã hóa ô theo góc nhìn người đi: RELATIVE[player][màu ô]
+RELATIVE = np.array([[0, 0, 0], [0, 1, 2], [0, 2, 1]], dtype=np.int64)
+
+
+def _instances():
+    """
+    TẤT CẢ VỊ TRÍ CỦA CÁC MẪU TRÊN BẢNG
+
+    Returns:
+        list: (chỉ số mẫu, dãy ô 0..63) - mỗi tập ô chỉ xuất hiện một lần
+    """
+    instances = []
+    for family, (name, squares) in enumerate(PATTERNS):
+        seen = set()
+        for symmetry in SYMMETRIES:
+            mapped = tuple(r * 8 + c for r, c in
+                           (symmetry(r, c) for r, c in squares))
+            if frozenset(mapped) not in seen:
+                seen.add(frozenset(mapped))
+                instances.append((family, mapped))
+    return instances
+
+
+INSTANCES = _instances()
+
+# Vị trí bắt đầu của bảng mỗi mẫu trong mảng trọng số phẳng
+OFFSETS = []
+TABLE_SIZE = 0
+for _name, _squares in PATTERNS:
+    OFFSETS.append(TABLE_SIZE)
+    TABLE_SIZE += 3 ** len(_squares)
+
+# SQUARES[k] = các ô của vị trí mẫu k (đệm ô 64), POWERS[k] = 3^i tương ứng
+SQUARES = np.full((len(INSTANCES), MAX_SQUARES), 64, dtype=np.int64)
+POWERS = np.zeros((len(INSTANCES), MAX_SQUARES), dtype=np.int64)
+BASES = np.zeros(len(INSTANCES), dtype=np.int64)
+for _k, (_family, _squares) in enumerate(INSTANCES):
+    SQUARES[_k, :len(_squares)] = _squares
+    POWERS[_k, :len(_squares)] = [3 ** _i for _i in range(len(_squares))]
+    BASES[_k] = OFFSETS[_family]
+
+
+def default_weights():
+    """
+    BỘ TRỌNG SỐ MẶC ĐỊNH
+
+    Giá trị của mỗi cấu hình = tổng điểm các ô của nó, chia cho số mẫu phủ
+    ô đó, nên tổng mọi lần tra bảng đúng bằng điểm theo bảng điểm từng ô.
+
+    Returns:
+        ndarray: Mảng float32 kích thước (PHASES, TABLE_SIZE)
+    """
+    coverage = np.zeros(64)
+    for family, squares in INSTANCES:
+        coverage[list(squares)] += 1
+    square_value = np.array(SQUARE_PRIORITY, dtype=np.float64).ravel()
+
+    weights = np.zeros((PHASES, TABLE_SIZE), dtype=np.float32)
+    for family, (name, squares) in enumerate(PATTERNS):
+        size = len(squares)
+        # digits[i, j] = chữ số thứ j (hệ 3) của cấu hình i
+        digits = (np.arange(3 ** size)[:, None] // 3 ** np.arange(size)) % 3
+        sign = np.where(digits == 1, 1.0, np.where(digits == 2, -1.0, 0.0))
+        # Mọi vị trí của mẫu có cùng số ô phủ nên lấy theo vị trí gốc
+        cells = [r * 8 + c for r, c in squares]
+        share = 1.0 / coverage[cells]
+        for phase in range(PHASES):
+            value = DEFAULT_POSITIONAL[phase] * square_value[cells] + \
+                DEFAULT_DISC[phase]
+            weights[phase, OFFSETS[family]:OFFSETS[family] + 3 ** size] = \
+                (sign * value * share).sum(axis=1)
+    return weights
+
+
+def save_weights(path, weights):
+    """Ghi bảng trọng số (PHASES, TABLE_SIZE) ra file .npz nén"""
+    np.savez_compressed(path, weights=weights.astype(np.float32),
+                        sizes=np.array([len(s) for n, s in PATTERNS]))
+
+
+def load_weights(path):
+    """Đọc bảng trọng số từ file .npz, kiểm tra khớp với các mẫu hiện tại"""
+    with np.load(path) as data:
+        weights = data['weights']
+        sizes = list(data['sizes'])
+    if sizes != [len(s) for n, s in PATTERNS] or \
+       weights.shape != (PHASES, TABLE_SIZE):
+        raise ValueError('pattern weights in %s do not match PATTERNS' % path)
+    return weights
+
+
+class PatternEvaluator(object):
+
+    """
+    ĐÁNH GIÁ BẰNG BẢNG MẪU - CÙNG CHỮ KÝ score() VỚI Evaluator
+
+    Chỉ dùng vị trí hiện tại (board); startBoard và currentDepth được bỏ
+    qua. Điểm là số nguyên theo góc nhìn 'player'.
+    """
+
+    def __init__(self, path=PATTERN_WEIGHTS, weights=None):
+        """
+        Args:
+            path: File trọng số .npz (không có file => trọng số mặc định)
+            weights: Mảng trọng số có sẵn, ưu tiên hơn path
+        """
+        if weights is None:
+            if path is not None and os.path.exists(path):
+                weights = load_weights(path)
+            else:
+                weights = default_weights()
+        self.weights = weights
+        self.cells = np.zeros(65, dtype=np.int64)  # Ô 64 luôn trống (đệm)
+
+    def indexes(self, board, player):
+        """Chỉ số (trong mảng trọng số phẳng) của mọi vị trí mẫu"""
+        cells = self.cells
+        cells[:64] = RELATIVE[player][np.asarray(board.board).ravel()]
+        return (cells[SQUARES] * POWERS).sum(axis=1) + BASES
+
+    def score(self, startBoard, board, currentDepth, player, opponent):
+        whites, blacks, empty = board.count_stones()
+        mine, yours = (blacks, whites) if player == BLACK else (whites, blacks)
+        if mine == 0:
+            return -Evaluator.WIPEOUT_SCORE
+        if yours == 0:
+            return Evaluator.WIPEOUT_SCORE
+        phase = min((whites + blacks - 4) // PHASE_DISCS, PHASES - 1)
+        return int(round(float(
+            self.weights[phase][self.indexes(board, player)].sum())))
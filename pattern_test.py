@@ -0,0 +1,57 @@
+from board import Board
+from symmetry import SYMMETRIES
+from minimax import Minimax
+from minimax_test import midgame_board
+from ordering import SQUARE_PRIORITY
+from pattern import PatternEvaluator, default_weights, save_weights
+import os
+import tempfile
+import unittest
+from config import WHITE, BLACK
+
+
+class TestPatternEvaluator(unittest.TestCase):
+    def test_default_weights_are_positional(self):
+        evaluator = PatternEvaluator(None)
+        b, color = midgame_board(10, cls=Board)
+        other = WHITE if color == BLACK else BLACK
+        expected = 0
+        for i in range(8):
+            for j in range(8):
+                if b.board[i][j] == color:
+                    expected += SQUARE_PRIORITY[i][j]
+                elif b.board[i][j] == other:
+                    expected -= SQUARE_PRIORITY[i][j]
+        score = evaluator.score(b, b, 0, color, other)
+        self.assertIsInstance(score, int)
+        self.assertEqual(score, expected)
+        self.assertEqual(evaluator.score(b, b, 0, other, color), -expected)
+
+    def test_symmetric_positions(self):
+        evaluator = PatternEvaluator(None)
+        b, color = midgame_board(40, seed=3, cls=Board)
+        other = WHITE if color == BLACK else BLACK
+        expected = evaluator.score(b, b, 0, color, other)
+        for symmetry in SYMMETRIES:
+            mapped = Board()
+            for i in range(8):
+                for j in range(8):
+                    r, c = symmetry(i, j)
+                    mapped.board[r][c] = b.board[i][j]
+            self.assertEqual(evaluator.score(mapped, mapped, 0, color, other),
+                             expected)
+
+    def test_weights_file(self):
+        weights = default_weights()
+        weights[2] *= 2
+        path = os.path.join(tempfile.mkdtemp(), 'patterns.npz')
+        save_weights(path, weights)
+        evaluator = PatternEvaluator(path)
+        self.assertTrue((evaluator.weights == weights).all())
+        b, color = midgame_board(cls=Board)
+        other = WHITE if color == BLACK else BLACK
+        score, move = Minimax(evaluator.score).search(b, 3, color, other)
+        self.assertIn(move, b.get_valid_moves(color))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+perft.py - ĐẾM NÚT LÁ (PERFT): KIỂM TRA VÀ ĐO TỐC ĐỘ SINH NƯỚC ĐI
+
+perft(n) là số vị trí lá sau đúng n nước từ một vị trí. So với số tham
+chiếu đã biết sẽ phát hiện ngay lỗi sinh nước đi / lật quân, và số nút
+mỗi giây là thước đo tốc độ của bộ sinh nước đi.
+
+Quy ước (giống các bảng perft Othello phổ biến):
+- Bỏ lượt tính là một nước (tốn một ply)
+- Vị trí kết thúc ván trước độ sâu n được tính là một lá
+
+Backend (bảng cờ) có thể thay thế:
+- board: board.Board (dạng lưới)
+- bitboard: bitboard.BitBoard
+- bits: trực tiếp trên 2 số nguyên (nhanh nhất, làm chuẩn so sánh)
+Bất kỳ lớp nào có get_valid_moves/make_move/unmake_move đều dùng được.
+
+Chạy từ dòng lệnh:
+    python perft.py 6 --backend board
+    python perft.py 4 --position=<64 ô X/O/-><X hoặc O> --divide
+"""
+
+import time
+import argparse
+
+from config import BLACK, WHITE, EMPTY
+from board import Board
+from bitboard import BitBoard, move_mask, flip_mask
+from zobrist import grid_hash
+
+# Số lá tham chiếu từ vị trí đầu, Đen đi trước
+REFERENCE = {1: 4, 2: 12, 3: 56, 4: 244, 5: 1396, 6: 8200, 7: 55092,
+             8: 390216, 9: 3005288}
+
+BACKENDS = {'board': Board, 'bitboard': BitBoard, 'bits': BitBoard}
+
+
+def perft(board, color, depth):
+    """
+    PERFT TRÊN MỘT BẢNG BẤT KỲ (make_move/unmake_move)
+
+    Args:
+        board: Board, BitBoard hoặc lớp có cùng API
+        color: Người đi
+        depth: Số ply
+
+    Returns:
+        int: Số lá
+    """
+    if depth == 0:
+        return 1
+    other = WHITE if color == BLACK else BLACK
+    moves = board.get_valid_moves(color)
+    if not moves:
+        if not board.get_valid_moves(other):
+            return 1  # Ván kết thúc: là lá
+        return perft(board, other, depth - 1)  # Bỏ lượt
+    if depth == 1:
+        return len(moves)
+    total = 0
+    for move in moves:
+        undo = board.make_move(move, color)
+        total += perft(board, other, depth - 1)
+        board.unmake_move(undo)
+    return total
+
+
+def perft_bits(own, opp, depth):
+    """PERFT TRỰC TIẾP TRÊN BITBOARD (quân người đi, quân đối thủ)"""
+    if depth == 0:
+        return 1
+    moves = move_mask(own, opp)
+    if not moves:
+        if not move_mask(opp, own):
+            return 1
+        return perft_bits(opp, own, depth - 1)
+    if depth == 1:
+        return moves.bit_count()
+    total = 0
+    while moves:
+        bit = moves & -moves
+        moves ^= bit
+        flips = flip_mask(bit, own, opp)
+        total += perft_bits(opp & ~flips, own | bit | flips, depth - 1)
+    return total
+
+
+def parse_position(text, backend='board'):
+    """
+    ĐỌC VỊ TRÍ DẠNG CHUỖI: 64 ô theo hàng (X = Đen, O = Trắng, - = trống)
+    và một ký tự người đi (X hoặc O)
+
+    Returns:
+        tuple (board, color)
+    """
+    text = ''.join(text.split())
+    if len(text) != 65 or text[64] not in 'XO' or \
+       set(text[:64]) - set('XO-'):
+        raise ValueError('position must be 64 squares of X/O/- and the side '
+                         'to move (X or O)')
+    board = Board()
+    for sq in range(64):
+        board.board[sq >> 3][sq & 7] = {'X': BLACK, 'O': WHITE, '-': EMPTY}[text[sq]]
+    board.hash = grid_hash(board.board)
+    if backend != 'board':
+        board = BitBoard.from_board(board)
+    return board, BLACK if text[64] == 'X' else WHITE
+
+
+def run(board, color, depth, backend):
+    """Đếm perft bằng backend đã chọn"""
+    if backend == 'bits':
+        own, opp = board.bits(color)
+        return perft_bits(own, opp, depth)
+    return perft(board, color, depth)
+
+
+def divide(board, color, depth, backend):
+    """Số lá dưới từng nước đi ở gốc - dùng để khoanh vùng lỗi"""
+    other = WHITE if color == BLACK else BLACK
+    counts = []
+    for move in sorted(board.get_valid_moves(color)):
+        undo = board.make_move(move, color)
+        counts.append((move, run(board, other, depth - 1, backend)))
+        board.unmake_move(undo)
+    return counts
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Othello perft.')
+    parser.add_argument('depth', type=int)
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='bits')
+    parser.add_argument('--position', help='64 squares (X/O/-) + side to move')
+    parser.add_argument('--divide', action='store_true',
+                        help='print the count below each root move')
+    args = parser.parse_args()
+
+    if args.position:
+        board, color = parse_position(args.position, args.backend)
+    else:
+        board, color = BACKENDS[args.backend](), BLACK
+    if args.divide:
+        for move, count in divide(board, color, args.depth, args.backend):
+            print('%s%d %d' % ('abcdefgh'[move[1]], move[0] + 1, count))
+
+    for depth in range(1, args.depth + 1):
+        start = time.time()
+        nodes = run(board, color, depth, args.backend)
+        elapsed = time.time() - start
+        line = 'perft(%d) = %d  %.3fs  %.0f nodes/s' % (
+            depth, nodes, elapsed, nodes / elapsed if elapsed else 0)
+        if not args.position and depth in REFERENCE:
+            line += '  ok' if nodes == REFERENCE[depth] else \
+                '  MISMATCH (expected %d)' % REFERENCE[depth]
+        print(line)
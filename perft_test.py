@@ -0,0 +1,38 @@
+from bitboard import BitBoard
+from board import Board
+from perft import perft, perft_bits, parse_position, divide, REFERENCE
+import unittest
+from config import WHITE, BLACK
+
+
+class TestPerft(unittest.TestCase):
+    def test_reference_counts(self):
+        for depth in range(1, 6):
+            with self.subTest(depth=depth):
+                self.assertEqual(perft(Board(), BLACK, depth), REFERENCE[depth])
+                self.assertEqual(perft(BitBoard(), BLACK, depth),
+                                 REFERENCE[depth])
+        b = BitBoard()
+        self.assertEqual(perft_bits(b.black, b.white, 7), REFERENCE[7])
+
+    def test_board_is_restored(self):
+        b = Board()
+        before = [row[:] for row in b.board], b.hash
+        perft(b, BLACK, 4)
+        self.assertEqual(([row[:] for row in b.board], b.hash), before)
+
+    def test_passes_and_game_over(self):
+        # black to move has no move, white can play D1 to end the game
+        b, color = parse_position('OXX' + '-' * 61 + 'X', 'bitboard')
+        self.assertEqual(perft(b, color, 1), 1)   # the pass
+        self.assertEqual(perft(b, color, 2), 1)   # pass, D1
+        self.assertEqual(perft(b, color, 5), 1)   # game over is a leaf
+        start = '-' * 27 + 'OX------XO' + '-' * 27 + 'X'
+        board, color = parse_position(start)
+        self.assertEqual(sum(count for move, count in
+                             divide(board, color, 4, 'board')), REFERENCE[4])
+        with self.assertRaises(ValueError):
+            parse_position('X' * 64)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,10 +3,25 @@
 Human and Computer classes
 """
 
-from evaluator import Evaluator
-from config import WHITE, BLACK
-from minimax import Minimax
+from evaluator import Evaluator, IncrementalEvaluator
+from config import WHITE, BLACK, MOVE_TIME_BUDGET, ENDGAME_EMPTIES, \
+    INCREMENTAL_EVAL, SEARCH_WORKERS, BOOK_PATH, MCTS_PLAYOUTS, \
+    MCTS_TIME_BUDGET, LOG_SEARCH_STATS, PONDER
+from minimax import Minimax, SearchResult, SearchTimeout, MAX_DEPTH
+from endgame import EndgameSolver
+from transposition import TranspositionTable
+from ordering import MoveOrderer, SQUARE_PRIORITY
+from parallel import ParallelSearch
+from book import OpeningBook
+from mcts import MCTS
+from zobrist import position_key
+from concurrent.futures import ThreadPoolExecutor, wait
+import os
 import random
+import logging
+import log
+
+logger = logging.getLogger('root')
 
 
 def change_color(color):
@@ -32,6 +47,11 @@ class Human:
             move = self.gui.get_mouse_input()
             if move in validMoves:
                 break
+        return self.play(move)
+
+    def play(self, move):
+        """ Plays a valid move, e.g. a click the game loop received """
+        self.current_board.get_valid_moves(self.color)
         self.current_board.apply_move(move, self.color)
         return 0, self.current_board
 
@@ -39,20 +59,252 @@ class Human:
         self.current_board = board
 
 
-class Computer(object):
+class Engine(object):
 
-    def __init__(self, color, prune=3):
-        self.depthLimit = prune
-        evaluator = Evaluator()
-        self.minimaxObj = Minimax(evaluator.score)
-        self.color = color
+    """ Base of the computer players. A subclass finds a move with
+    choose_move(board, time_budget), which leaves the board as it was, and
+    makes a running choose_move give up in stop(). The move is then played
+    right away (get_move) or searched in a background thread (start_move)
+    while the caller keeps its event loop going. """
+
+    executor = None  # background thread of start_move, created on first use
+    lastResult = None
+    lastSolved = False  # lastResult.score is the exact final disc differential
 
     def get_current_board(self, board):
         self.current_board = board
 
-    def get_move(self):
-        return self.minimaxObj.minimax(self.current_board, None, self.depthLimit, self.color,
-                                       change_color(self.color))
+    def get_move(self, time_budget=None):
+        """ Finds the move on the current board and plays it """
+        self.resume()
+        return self.play(self.choose_move(self.current_board, time_budget))
+
+    def start_move(self, time_budget=None):
+        """ Same as get_move, but the search runs in a background thread
+        on a copy of the current board. Returns a concurrent.futures.Future
+        of the SearchResult; pass the result to play() once it is done, or
+        call cancel().
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        self.resume()
+        return self.executor.submit(self.choose_move,
+                                    self.current_board.copy(), time_budget)
+
+    def start_ponder(self):
+        """ Called after this player's move while the opponent thinks;
+        engines that ponder search ahead in the background. """
+
+    def cancel(self):
+        """ Stops a search started by start_move; it returns at once with
+        a result that is to be dropped. """
+        self.stop()
+
+    def play(self, result):
+        """ Plays the move of a SearchResult on the current board """
+        self.current_board.get_valid_moves(self.color)
+        self.current_board.apply_move(result.move, self.color)
+        return result.score, self.current_board
+
+    def close(self):
+        """ Stops any running search and releases the background thread """
+        if self.executor is not None:
+            self.stop()
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+class Computer(Engine):
+
+    def __init__(self, color, prune=3, time_budget=MOVE_TIME_BUDGET,
+                 endgame_empties=ENDGAME_EMPTIES, incremental=INCREMENTAL_EVAL,
+                 workers=SEARCH_WORKERS, book_path=BOOK_PATH, evaluator=None,
+                 log_stats=LOG_SEARCH_STATS, ponder=PONDER):
+        """ log_stats - log the search statistics of every move
+        ponder - search on the opponent's time, see start_ponder """
+        self.depthLimit = prune
+        self.timeBudget = time_budget
+        self.endgameEmpties = endgame_empties
+        self.solver = EndgameSolver()
+        # same scores either way; the incremental one tracks features on
+        # the board during the search instead of rescanning it at each leaf
+        if evaluator is None:
+            evaluator = IncrementalEvaluator() if incremental else Evaluator()
+        self.evaluator = evaluator
+        self.incremental = isinstance(evaluator, IncrementalEvaluator)
+        # the table lives as long as the player, so it is reused across moves
+        self.tt = TranspositionTable()
+        self.orderer = MoveOrderer()
+        self.minimaxObj = Minimax(self.evaluator.score, self.tt, self.orderer)
+        # worker processes are started on the first move and kept
+        self.parallel = ParallelSearch(workers) if workers > 1 else None
+        self.book = None
+        if book_path is not None and os.path.exists(book_path):
+            self.book = OpeningBook(book_path)
+        # minimax.SearchStats of the last move, None when it was not searched
+        self.stats = None
+        self.logStats = log_stats
+        if log_stats and not logger.handlers:
+            log.setup_custom_logger('root')
+        self.ponder = ponder
+        self.ponderFuture = None  # search running on the opponent's time
+        self.ponderMove = None    # the opponent move it expects
+        self.ponderKey = None     # position_key of the position it searches
+        self.color = color
+
+    def get_move(self, time_budget=None):
+        """ Plays the opening book move when the position is in the book,
+        otherwise searches on the current board with make/unmake and plays
+        the best move on it.
+        time_budget - seconds for this move (defaults to the player's own
+                      budget). With a budget the search deepens until time
+                      runs out; without one it stops at depthLimit.
+        """
+        if self.ponderFuture is not None:
+            return self.play(self.start_move(time_budget).result())
+        return Engine.get_move(self, time_budget)
+
+    def start_ponder(self):
+        """ Pondering: while the opponent chooses a move on the current
+        board, searches in the background the position after the reply it
+        most likely plays - the second move of our principal variation,
+        or the best square by SQUARE_PRIORITY without one. When the
+        opponent plays that move start_move takes the running search over,
+        so the reply is often instant; otherwise the search is stopped, but
+        it has filled the transposition table for the real one.
+        """
+        if not self.ponder or self.ponderFuture is not None:
+            return
+        other = change_color(self.color)
+        board = self.current_board.copy()
+        moves = board.get_valid_moves(other)
+        if not moves:
+            return
+        pv = self.lastResult.pv if self.lastResult is not None else []
+        if len(pv) > 1 and pv[1] in moves:
+            guess = pv[1]
+        else:
+            guess = max(moves, key=lambda move: SQUARE_PRIORITY[move[0]][move[1]])
+        board.make_move(guess, other)
+        if not board.get_valid_moves(self.color):
+            return  # we would have to pass: nothing to search
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        self.resume()
+        self.ponderMove = guess
+        self.ponderKey = position_key(board, self.color)
+        self.ponderFuture = self.executor.submit(self.choose_move, board)
+
+    def start_move(self, time_budget=None):
+        """ Engine.start_move, reusing the ponder search when the opponent
+        played the expected move (a ponder hit) """
+        ponder = self.ponderFuture
+        self.ponderFuture = None
+        if ponder is not None:
+            if self.ponderKey == position_key(self.current_board, self.color):
+                return ponder
+            # ponder miss: stop it, the thread is free again in a moment
+            self.stop()
+            wait([ponder])
+        return Engine.start_move(self, time_budget)
+
+    def stop(self):
+        self.minimaxObj.stop()
+        self.solver.stop()
+        if self.parallel is not None:
+            self.parallel.stop()
+
+    def resume(self):
+        """ Clears stop() before the next search """
+        self.minimaxObj.stopped = False
+        self.solver.stopped = False
+        if self.parallel is not None:
+            self.parallel.resume()
+
+    def close(self):
+        """ Also shuts the worker processes down, frees the shared
+        transposition table of a parallel search and unmaps the book """
+        self.ponderFuture = None
+        Engine.close(self)
+        if self.parallel is not None:
+            self.parallel.close()
+            self.parallel = None
+        if self.book is not None:
+            self.book.close()
+            self.book = None
+
+    def choose_move(self, board, time_budget=None):
+        """ Finds the move for board without playing it; the board is left
+        as it was. Returns the SearchResult, also kept in lastResult. """
+        if time_budget is None:
+            time_budget = self.timeBudget
+        maxDepth = self.depthLimit if time_budget is None else MAX_DEPTH
+        whites, blacks, empty = board.count_stones()
+        self.stats = None
+        self.lastSolved = False
+        bookMove = None
+        if self.book is not None:
+            bookMove = self.book.best_move(board, self.color)
+        if bookMove is not None:
+            # known opening position: no search at all
+            move, score = bookMove
+            self.lastResult = SearchResult(move, score, [move], 0, 0)
+        elif empty <= self.endgameEmpties:
+            # few empties left: play perfectly, score is the disc differential
+            try:
+                score, move = self.solver.solve(board, self.color)
+            except SearchTimeout:
+                score, move = 0, None  # stopped
+            self.lastResult = SearchResult(move, score, [move],
+                                           self.solver.nodes, empty)
+            self.lastSolved = move is not None
+        elif self.parallel is not None and \
+                len(board.get_valid_moves(self.color)) > 1:
+            self.lastResult = self.parallel.iterative_search(
+                board, self.color, change_color(self.color),
+                maxDepth, time_budget)
+            self.stats = self.parallel.stats
+        else:
+            self.tt.new_search()
+            tracked = self.incremental and hasattr(board, 'features')
+            if tracked:
+                self.evaluator.attach(board)
+            try:
+                self.lastResult = self.minimaxObj.iterative_search(
+                    board, self.color, change_color(self.color),
+                    maxDepth, time_budget)
+            finally:
+                if tracked:
+                    self.evaluator.detach(board)
+            self.stats = self.minimaxObj.stats
+        if self.logStats and self.stats is not None:
+            logger.info('search %s depth=%d: %s', self.lastResult.move,
+                        self.lastResult.depth, self.stats.summary())
+        return self.lastResult
+
+
+class MonteCarlo(Engine):
+
+    """ Computer player searching with Monte Carlo tree search instead of
+    minimax. The tree is kept between moves. """
+
+    def __init__(self, color, playouts=MCTS_PLAYOUTS,
+                 time_budget=MCTS_TIME_BUDGET, bias=True, seed=None):
+        """ bias - use the Evaluator as progressive bias in the tree """
+        self.engine = MCTS(Evaluator() if bias else None, playouts,
+                           time_budget, seed)
+        self.color = color
+
+    def stop(self):
+        self.engine.stopped = True
+
+    def resume(self):
+        self.engine.stopped = False
+
+    def choose_move(self, board, time_budget=None):
+        self.lastResult = self.engine.search(board, self.color,
+                                             time_budget=time_budget)
+        return self.lastResult
 
 
 class RandomPlayer (Computer):
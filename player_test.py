@@ -0,0 +1,114 @@
+from board import Board
+from config import BLACK, WHITE
+from book import BookBuilder
+from player import Computer, MonteCarlo
+from multiprocessing.shared_memory import SharedMemory
+import os
+import tempfile
+import unittest
+
+
+class TestComputer(unittest.TestCase):
+
+    def test_start_move_matches_get_move(self):
+        background = Computer(BLACK, 3, book_path=None)
+        background.get_current_board(Board())
+        future = background.start_move()
+        result = future.result(timeout=30)
+        # the search ran on a copy: nothing is played until play()
+        self.assertEqual(background.current_board.count_stones(), (2, 2, 60))
+        score, board = background.play(result)
+        self.assertEqual(board.count_stones()[2], 59)
+        background.close()
+
+        foreground = Computer(BLACK, 3, book_path=None)
+        foreground.get_current_board(Board())
+        expected, expectedBoard = foreground.get_move()
+        self.assertEqual((score, board.board), (expected, expectedBoard.board))
+
+    def test_cancel(self):
+        computer = Computer(WHITE, 40, book_path=None)
+        board = Board()
+        board.get_valid_moves(BLACK)
+        board.apply_move((2, 3), BLACK)
+        computer.get_current_board(board)
+        # without cancel a depth 40 search would not finish in the timeout
+        future = computer.start_move()
+        computer.cancel()
+        future.result(timeout=10)
+        self.assertTrue(computer.minimaxObj.stopped)
+        self.assertEqual(board.count_stones()[2], 59)
+        # a later search is not affected by the cancelled one
+        score, board = computer.get_move(time_budget=0.2)
+        self.assertEqual(board.count_stones()[2], 58)
+        computer.close()
+
+    def test_close_releases_workers(self):
+        computer = Computer(BLACK, 2, book_path=None, workers=2)
+        computer.get_current_board(Board())
+        computer.get_move()
+        name = computer.parallel.tt.shm.name
+        computer.close()
+        self.assertIsNone(computer.parallel)
+        self.assertRaises(FileNotFoundError, SharedMemory, name)
+
+    def test_close_releases_book(self):
+        builder = BookBuilder()
+        builder.expand(1, 1)
+        path = os.path.join(tempfile.mkdtemp(), 'book.bin')
+        builder.write(path)
+        computer = Computer(BLACK, 2, book_path=path)
+        book = computer.book
+        computer.close()
+        self.assertIsNone(computer.book)
+        self.assertTrue(book.file.closed)
+
+    def test_ponder_hit(self):
+        computer = Computer(WHITE, 3, book_path=None)
+        board = Board()
+        board.get_valid_moves(BLACK)
+        board.apply_move((2, 3), BLACK)
+        computer.get_current_board(board)
+        computer.get_move()
+        computer.start_ponder()
+        ponder = computer.ponderFuture
+        self.assertIn(computer.ponderMove, board.get_valid_moves(BLACK))
+        board.apply_move(computer.ponderMove, BLACK)
+        self.assertIs(computer.start_move(), ponder)
+        result = ponder.result(timeout=30)
+
+        fresh = Computer(WHITE, 3, book_path=None)
+        fresh.get_current_board(board.copy())
+        self.assertEqual(result.score, fresh.choose_move(board.copy()).score)
+        computer.close()
+
+    def test_ponder_miss(self):
+        computer = Computer(WHITE, 3, book_path=None)
+        board = Board()
+        board.get_valid_moves(BLACK)
+        board.apply_move((2, 3), BLACK)
+        computer.get_current_board(board)
+        computer.get_move()
+        computer.start_ponder()
+        ponder = computer.ponderFuture
+        moves = board.get_valid_moves(BLACK)
+        moves.remove(computer.ponderMove)
+        board.apply_move(moves[0], BLACK)
+        future = computer.start_move()
+        self.assertIsNot(future, ponder)
+        self.assertIn(future.result(timeout=30).move,
+                      board.get_valid_moves(WHITE))
+        computer.close()
+
+    def test_cancel_monte_carlo(self):
+        computer = MonteCarlo(BLACK, playouts=10 ** 9, seed=1)
+        computer.get_current_board(Board())
+        future = computer.start_move()
+        computer.cancel()
+        result = future.result(timeout=10)
+        self.assertLess(result.nodes, 10 ** 9)
+        computer.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
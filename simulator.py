@@ -0,0 +1,214 @@
+"""
+simulator.py - TỰ ĐẤU HÀNG LOẠT KHÔNG GIAO DIỆN (LOCKSTEP, NUMPY)
+
+Othello.run chơi từng ván qua vòng lặp pygame, còn RandomPlayer chọn mỗi
+nước đi bằng một lần gọi Python. SelfPlay chạy N ván song song: mỗi lượt
+là một bước cho cả N ván cùng lúc trên mảng bitboard NumPy:
+- Nước đi hợp lệ: batch.move_masks (dịch bit theo 8 hướng)
+- Lật quân: lan theo 8 hướng từ ô vừa đặt, vector hóa trên N ván
+- Bỏ lượt / kết thúc: ván không có nước đi thì bỏ lượt, 2 lần bỏ lượt
+  liên tiếp thì kết thúc
+
+Chiến lược: 'random' (ngẫu nhiên đều) hoặc 'greedy' (lật nhiều quân nhất,
+hòa thì chọn ngẫu nhiên).
+
+Chạy từ dòng lệnh:
+    python simulator.py 10000 --black random --white greedy --out games.npz
+"""
+
+import time
+import argparse
+import numpy as np
+
+from config import BLACK, WHITE
+from bitboard import START_BLACK, START_WHITE, INNER
+from batch import SHIFTS, move_masks, popcount
+
+POLICIES = ('random', 'greedy')
+PASS = -1       # Mã nước đi: bỏ lượt
+FINISHED = -2   # Mã nước đi: ván đã kết thúc (đệm)
+
+SQUARE_BITS = np.array([1 << sq for sq in range(64)], dtype=np.uint64)
+
+
+def flip_masks(moves, own, opp):
+    """
+    QUÂN BỊ LẬT KHI ĐẶT QUÂN TẠI moves (mỗi ván một bit)
+
+    Theo mỗi hướng: chuỗi quân đối phương liên tiếp từ ô vừa đặt, chỉ lật
+    khi ngay sau chuỗi là quân của mình.
+    """
+    inner = opp & np.uint64(INNER)
+    flips = np.zeros_like(own)
+    for shift, horizontal in SHIFTS:
+        mask = inner if horizontal else opp
+        x = (moves << shift) & mask
+        for _ in range(5):
+            x |= (x << shift) & mask
+        flips |= np.where((x << shift) & own, x, np.uint64(0))
+        x = (moves >> shift) & mask
+        for _ in range(5):
+            x |= (x >> shift) & mask
+        flips |= np.where((x >> shift) & own, x, np.uint64(0))
+    return flips
+
+
+def _squares(masks):
+    """Mặt nạ (N,) uint64 -> ma trận (N, 64) 0/1, cột = số ô"""
+    masks = np.ascontiguousarray(masks, dtype=np.uint64)
+    return np.unpackbits(masks.view(np.uint8).reshape(len(masks), 8),
+                         axis=1, bitorder='little')
+
+
+def choose_random(legal, own, opp, rng):
+    """Chọn ngẫu nhiên đều một nước đi trong mỗi mặt nạ legal"""
+    cells = _squares(legal)
+    counts = cells.sum(axis=1)
+    picks = (rng.random(len(legal)) * counts).astype(np.int64)
+    return np.argmax(np.cumsum(cells, axis=1) > picks[:, None], axis=1)
+
+
+def choose_greedy(legal, own, opp, rng):
+    """Chọn nước đi lật nhiều quân nhất (hòa => ngẫu nhiên)"""
+    gains = np.full((len(legal), 64), -1.0)
+    for sq in range(64):
+        bit = SQUARE_BITS[sq]
+        playable = (legal & bit) != 0
+        if playable.any():
+            moves = np.where(playable, bit, np.uint64(0))
+            count = popcount(flip_masks(moves, own, opp))
+            gains[:, sq] = np.where(playable, count, -1.0)
+    gains += rng.random(gains.shape) * 0.5
+    return np.argmax(gains, axis=1)
+
+
+CHOOSERS = {'random': choose_random, 'greedy': choose_greedy}
+
+
+class SelfPlay(object):
+
+    """
+    N VÁN TỰ ĐẤU CHẠY SONG SONG THEO TỪNG LƯỢT
+
+    Sau run():
+    - black, white: Bitboard cuối cùng của mỗi ván (N,) uint64
+    - moves: Ma trận (N, số lượt) int8 - số ô (row * 8 + col),
+      PASS = bỏ lượt, FINISHED = ván đã kết thúc
+    """
+
+    def __init__(self, games, black='random', white='random', seed=None):
+        """
+        Args:
+            games: Số ván
+            black, white: Chiến lược của Đen và Trắng ('random'/'greedy')
+            seed: Seed cho bộ sinh số ngẫu nhiên
+        """
+        for policy in (black, white):
+            if policy not in CHOOSERS:
+                raise ValueError('unknown policy %r, expected one of %s'
+                                 % (policy, ', '.join(POLICIES)))
+        self.games = games
+        self.policies = {BLACK: black, WHITE: white}
+        self.rng = np.random.default_rng(seed)
+        self.black = None
+        self.white = None
+        self.moves = None
+
+    def run(self):
+        """
+        CHƠI TẤT CẢ CÁC VÁN TỚI KHI KẾT THÚC
+
+        Returns:
+            SelfPlay: Chính đối tượng này (để viết gọn SelfPlay(...).run())
+        """
+        n = self.games
+        own = np.full(n, START_BLACK, dtype=np.uint64)   # Quân người đi
+        opp = np.full(n, START_WHITE, dtype=np.uint64)   # Quân đối thủ
+        side = np.full(n, BLACK, dtype=np.int8)          # Màu người đi
+        passed = np.zeros(n, dtype=bool)                 # Lượt trước bỏ lượt
+        done = np.zeros(n, dtype=bool)
+        history = []
+
+        while not done.all():
+            legal = np.where(done, np.uint64(0), move_masks(own, opp))
+            playing = legal != 0
+            column = np.full(n, FINISHED, dtype=np.int8)
+            column[~done & ~playing] = PASS
+
+            squares = np.zeros(n, dtype=np.int64)
+            for color, policy in self.policies.items():
+                group = playing & (side == color)
+                if group.any():
+                    squares[group] = CHOOSERS[policy](
+                        legal[group], own[group], opp[group], self.rng)
+            column[playing] = squares[playing]
+            history.append(column)
+
+            bits = np.where(playing, SQUARE_BITS[squares], np.uint64(0))
+            flips = flip_masks(bits, own, opp)
+            newOwn = own | bits | flips
+            newOpp = opp & ~flips
+
+            # Hai lần bỏ lượt liên tiếp: ván kết thúc
+            done |= ~playing & passed
+            passed = ~playing
+            own, opp = np.where(done, own, newOpp), np.where(done, opp, newOwn)
+            side = np.where(done, side, 3 - side).astype(np.int8)
+
+        # Ván kết thúc ở lượt người đi 'side': own là quân của side
+        self.black = np.where(side == BLACK, own, opp)
+        self.white = np.where(side == BLACK, opp, own)
+        self.moves = np.stack(history, axis=1) if history else \
+            np.zeros((n, 0), dtype=np.int8)
+        return self
+
+    def results(self):
+        """
+        KẾT QUẢ CÁC VÁN
+
+        Returns:
+            tuple (blacks, whites): Số quân cuối ván của mỗi bên (N,)
+        """
+        return popcount(self.black), popcount(self.white)
+
+    def game_moves(self, index):
+        """Danh sách nước đi (row, col) của một ván, None = bỏ lượt"""
+        moves = []
+        for square in self.moves[index]:
+            if square == FINISHED:
+                break
+            moves.append(None if square == PASS else (square >> 3, square & 7))
+        # Bỏ lượt cuối cùng (cả 2 bên đều không đi được) không phải nước đi
+        while moves and moves[-1] is None:
+            moves.pop()
+        return moves
+
+    def save(self, path):
+        """Ghi kết quả và nước đi ra file .npz nén"""
+        blacks, whites = self.results()
+        np.savez_compressed(path, blacks=blacks.astype(np.int8),
+                            whites=whites.astype(np.int8), moves=self.moves,
+                            policies=np.array([self.policies[BLACK],
+                                               self.policies[WHITE]]))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Headless self-play.')
+    parser.add_argument('games', type=int)
+    parser.add_argument('--black', choices=POLICIES, default='random')
+    parser.add_argument('--white', choices=POLICIES, default='random')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--out', help='write results and moves to this .npz')
+    args = parser.parse_args()
+
+    start = time.time()
+    play = SelfPlay(args.games, args.black, args.white, args.seed).run()
+    elapsed = time.time() - start
+    blacks, whites = play.results()
+    print('%d games in %.2fs (%.0f games/s)' % (args.games, elapsed,
+                                                args.games / elapsed))
+    print('black wins %d, white wins %d, draws %d' % (
+        (blacks > whites).sum(), (whites > blacks).sum(),
+        (blacks == whites).sum()))
+    if args.out:
+        play.save(args.out)
@@ -0,0 +1,37 @@
+from board import Board
+from simulator import SelfPlay
+import unittest
+from config import WHITE, BLACK
+
+
+class TestSelfPlay(unittest.TestCase):
+    def test_games_replay_on_board(self):
+        play = SelfPlay(100, 'random', 'greedy', seed=1).run()
+        blacks, whites = play.results()
+        for game in range(100):
+            b = Board()
+            color = BLACK
+            for move in play.game_moves(game):
+                moves = b.get_valid_moves(color)
+                if move is None:
+                    self.assertEqual(moves, [])
+                else:
+                    self.assertIn(move, moves)
+                    if color == WHITE:
+                        # greedy: no legal move flips more discs
+                        gain = len(b.copy().make_move(move, color)[1])
+                        best = max(len(b.copy().make_move(m, color)[1])
+                                   for m in moves)
+                        self.assertEqual(gain, best)
+                    b.apply_move(move, color)
+                color = WHITE if color == BLACK else BLACK
+            self.assertTrue(b.game_ended())
+            w, bl, empty = b.count_stones()
+            self.assertEqual((bl, w), (blacks[game], whites[game]))
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            SelfPlay(10, 'minimax')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+"""
+symmetry.py - 8 PHÉP ĐỐI XỨNG CỦA BẢNG OTHELLO
+
+Bảng có 8 phép đối xứng (4 phép quay x 2 phép lật). Sách khai cuộc dùng
+chúng để gộp các vị trí đối xứng, bộ đánh giá mẫu dùng để sinh mọi vị
+trí của một mẫu trên bảng.
+"""
+
+# 8 phép đối xứng trên tọa độ (row, col)
+SYMMETRIES = (
+    lambda r, c: (r, c),            # Giữ nguyên
+    lambda r, c: (c, 7 - r),        # Quay 90 độ
+    lambda r, c: (7 - r, 7 - c),    # Quay 180 độ
+    lambda r, c: (7 - c, r),        # Quay 270 độ
+    lambda r, c: (r, 7 - c),        # Lật ngang
+    lambda r, c: (7 - r, c),        # Lật dọc
+    lambda r, c: (c, r),            # Lật theo đường chéo chính
+    lambda r, c: (7 - c, 7 - r),    # Lật theo đường chéo phụ
+)
+
+# SYMMETRY_SQUARES[s][ô] = ô sau phép đối xứng s; INVERSE_SQUARES ngược lại
+SYMMETRY_SQUARES = []
+INVERSE_SQUARES = []
+for _symmetry in SYMMETRIES:
+    _forward = [0] * 64
+    _inverse = [0] * 64
+    for _sq in range(64):
+        _r, _c = _symmetry(_sq >> 3, _sq & 7)
+        _forward[_sq] = _r * 8 + _c
+        _inverse[_r * 8 + _c] = _sq
+    SYMMETRY_SQUARES.append(_forward)
+    INVERSE_SQUARES.append(_inverse)
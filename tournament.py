@@ -0,0 +1,259 @@
+"""
+tournament.py - GIẢI ĐẤU TỰ ĐỘNG GIỮA CÁC CẤU HÌNH ENGINE (KHÔNG GIAO DIỆN)
+
+Cho các cấu hình engine đấu vòng tròn với nhau trên một bộ khai cuộc,
+mỗi khai cuộc chơi 2 ván đổi màu, các ván chạy song song trên
+ProcessPoolExecutor. Báo cáo:
+- Elo của mỗi engine so với phần còn lại, kèm khoảng tin cậy 95%
+- Số ván/giây của cả giải, số nút/giây trung bình của mỗi engine
+
+Cấu hình engine: "loại:khóa=giá trị,...", ví dụ
+    minimax:depth=4
+    minimax:time=0.5,eval=pattern
+    mcts:playouts=500,bias=0
+
+Chạy từ dòng lệnh:
+    python tournament.py minimax:depth=3 minimax:depth=3,eval=pattern \\
+        --openings 8 --workers 4
+"""
+
+import math
+import time
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from config import BLACK, WHITE
+from board import Board
+from book import canonical
+from evaluator import Evaluator, IncrementalEvaluator
+from pattern import PatternEvaluator
+from player import Computer, MonteCarlo
+
+EVALUATORS = {'classic': Evaluator, 'incremental': IncrementalEvaluator,
+              'pattern': PatternEvaluator}
+OPENING_PLIES = 4  # Số nước ngẫu nhiên của mỗi khai cuộc
+
+
+def parse_engine(spec):
+    """
+    PHÂN TÍCH CHUỖI CẤU HÌNH ENGINE
+
+    Returns:
+        tuple (kind, options): 'minimax' hoặc 'mcts' và dict tùy chọn
+    """
+    kind, _, rest = spec.partition(':')
+    options = {}
+    for item in filter(None, rest.split(',')):
+        key, _, value = item.partition('=')
+        options[key] = value
+    if kind == 'minimax':
+        allowed = ('depth', 'time', 'eval')
+    elif kind == 'mcts':
+        allowed = ('playouts', 'time', 'bias')
+    else:
+        raise ValueError('unknown engine %r in %r' % (kind, spec))
+    for key in options:
+        if key not in allowed:
+            raise ValueError('unknown option %r for %s (allowed: %s)'
+                             % (key, kind, ', '.join(allowed)))
+    if options.get('eval', 'incremental') not in EVALUATORS:
+        raise ValueError('unknown evaluator %r' % options['eval'])
+    return kind, options
+
+
+def make_player(spec, color):
+    """Tạo người chơi từ chuỗi cấu hình (không dùng sách khai cuộc)"""
+    kind, options = parse_engine(spec)
+    budget = float(options['time']) if 'time' in options else None
+    if kind == 'mcts':
+        return MonteCarlo(color, int(options.get('playouts', 1000)), budget,
+                          bias=options.get('bias', '1') != '0')
+    evaluator = EVALUATORS[options.get('eval', 'incremental')]()
+    return Computer(color, int(options.get('depth', 3)), budget,
+                    book_path=None, evaluator=evaluator)
+
+
+def make_openings(count, plies=OPENING_PLIES, seed=0):
+    """
+    TẠO BỘ KHAI CUỘC: 'count' vị trí khác nhau (kể cả đối xứng) sau
+    'plies' nước ngẫu nhiên từ vị trí đầu
+
+    Returns:
+        list: Mỗi khai cuộc là danh sách nước đi (row, col)
+    """
+    rng = random.Random(seed)
+    openings = []
+    seen = set()
+    attempts = 0
+    while len(openings) < count and attempts < count * 100:
+        attempts += 1
+        board = Board()
+        color = BLACK
+        moves = []
+        for _ in range(plies):
+            move = rng.choice(board.get_valid_moves(color))
+            board.make_move(move, color)
+            moves.append(move)
+            color = WHITE if color == BLACK else BLACK
+        key = canonical(board, color)[0]
+        if key not in seen:
+            seen.add(key)
+            openings.append(moves)
+    return openings
+
+
+def play_game(task):
+    """
+    CHƠI MỘT VÁN (chạy trong worker)
+
+    Args:
+        task: (black spec, white spec, nước khai cuộc)
+
+    Returns:
+        tuple (blacks, whites, stats): stats[màu] = [nút, giây suy nghĩ]
+    """
+    blackSpec, whiteSpec, opening = task
+    players = {BLACK: make_player(blackSpec, BLACK),
+               WHITE: make_player(whiteSpec, WHITE)}
+    stats = {BLACK: [0, 0.0], WHITE: [0, 0.0]}
+    board = Board()
+    color = BLACK
+    for move in opening:
+        board.make_move(move, color)
+        color = WHITE if color == BLACK else BLACK
+    while not board.game_ended():
+        if board.get_valid_moves(color):
+            current = players[color]
+            current.get_current_board(board)
+            start = time.time()
+            score, board = current.get_move()
+            stats[color][1] += time.time() - start
+            stats[color][0] += current.lastResult.nodes
+        color = WHITE if color == BLACK else BLACK
+    for current in players.values():
+        current.close()
+    whites, blacks, empty = board.count_stones()
+    return blacks, whites, stats
+
+
+def elo(score, games):
+    """
+    ELO TỪ TỈ LỆ ĐIỂM, KÈM KHOẢNG TIN CẬY 95%
+
+    Args:
+        score: Tổng điểm (thắng 1, hòa 0.5)
+        games: Số ván
+
+    Returns:
+        tuple (elo, low, high)
+    """
+    def to_elo(p):
+        p = min(max(p, 0.5 / games), 1 - 0.5 / games)
+        return -400 * math.log10(1 / p - 1)
+
+    p = score / games
+    margin = 1.96 * math.sqrt(max(p * (1 - p), 0.25 / games) / games)
+    return to_elo(p), to_elo(p - margin), to_elo(p + margin)
+
+
+class Tournament(object):
+
+    """
+    GIẢI ĐẤU VÒNG TRÒN
+
+    Mỗi cặp engine chơi mọi khai cuộc 2 lần (đổi màu).
+    """
+
+    def __init__(self, engines, openings, workers=1):
+        """
+        Args:
+            engines: Danh sách chuỗi cấu hình engine
+            openings: Danh sách khai cuộc (nước đi)
+            workers: Số tiến trình; 1 = chơi tuần tự trong tiến trình này
+        """
+        for spec in engines:
+            parse_engine(spec)
+        self.engines = engines
+        self.openings = openings
+        self.workers = workers
+        self.results = []  # (chỉ số đen, chỉ số trắng, quân đen, quân trắng)
+        self.nodes = [0] * len(engines)
+        self.seconds = [0.0] * len(engines)
+        self.elapsed = 0.0
+
+    def tasks(self):
+        """Danh sách ván: (chỉ số đen, chỉ số trắng, khai cuộc)"""
+        games = []
+        for i in range(len(self.engines)):
+            for j in range(i + 1, len(self.engines)):
+                for opening in self.openings:
+                    games.append((i, j, opening))
+                    games.append((j, i, opening))
+        return games
+
+    def run(self):
+        games = self.tasks()
+        work = [(self.engines[b], self.engines[w], opening)
+                for b, w, opening in games]
+        start = time.time()
+        if self.workers > 1:
+            with ProcessPoolExecutor(self.workers) as pool:
+                outcomes = list(pool.map(play_game, work))
+        else:
+            outcomes = [play_game(task) for task in work]
+        self.elapsed = time.time() - start
+        for (b, w, opening), (blacks, whites, stats) in zip(games, outcomes):
+            self.results.append((b, w, blacks, whites))
+            for index, color in ((b, BLACK), (w, WHITE)):
+                self.nodes[index] += stats[color][0]
+                self.seconds[index] += stats[color][1]
+        return self
+
+    def scores(self):
+        """Tổng điểm và số ván của mỗi engine"""
+        points = [0.0] * len(self.engines)
+        played = [0] * len(self.engines)
+        for b, w, blacks, whites in self.results:
+            played[b] += 1
+            played[w] += 1
+            if blacks > whites:
+                points[b] += 1
+            elif whites > blacks:
+                points[w] += 1
+            else:
+                points[b] += 0.5
+                points[w] += 0.5
+        return points, played
+
+    def report(self):
+        """Bảng kết quả dạng chuỗi"""
+        points, played = self.scores()
+        lines = ['%-40s %6s %7s %18s %10s' % ('engine', 'games', 'score',
+                                             'elo (95% ci)', 'nodes/s')]
+        for index, spec in enumerate(self.engines):
+            rating, low, high = elo(points[index], played[index])
+            nps = self.nodes[index] / self.seconds[index] \
+                if self.seconds[index] else 0
+            lines.append('%-40s %6d %6.1f%% %+6.0f [%+5.0f,%+5.0f] %10.0f' % (
+                spec, played[index], 100 * points[index] / played[index],
+                rating, low, high, nps))
+        lines.append('%d games in %.1fs (%.2f games/s)' % (
+            len(self.results), self.elapsed,
+            len(self.results) / self.elapsed if self.elapsed else 0))
+        return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Engine tournament.')
+    parser.add_argument('engines', nargs='+',
+                        help='engine specs, e.g. minimax:depth=4,eval=pattern')
+    parser.add_argument('--openings', type=int, default=8)
+    parser.add_argument('--opening-plies', type=int, default=OPENING_PLIES)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+    if len(args.engines) < 2:
+        parser.error('at least two engines are needed')
+    openings = make_openings(args.openings, args.opening_plies, args.seed)
+    print(Tournament(args.engines, openings, args.workers).run().report())
@@ -0,0 +1,34 @@
+from tournament import Tournament, parse_engine, make_openings, elo
+import unittest
+
+
+class TestTournament(unittest.TestCase):
+    def test_parse_engine(self):
+        self.assertEqual(parse_engine('minimax:depth=4,eval=pattern'),
+                         ('minimax', {'depth': '4', 'eval': 'pattern'}))
+        self.assertEqual(parse_engine('mcts'), ('mcts', {}))
+        for spec in ('alphabeta', 'minimax:playouts=3', 'minimax:eval=nn'):
+            with self.assertRaises(ValueError):
+                parse_engine(spec)
+
+    def test_elo(self):
+        self.assertEqual(elo(5, 10)[0], 0)
+        rating, low, high = elo(7.5, 10)
+        self.assertAlmostEqual(rating, 190.8, places=1)
+        self.assertLess(low, rating)
+        self.assertGreater(high, rating)
+        self.assertAlmostEqual(elo(10, 10)[0], -elo(0, 10)[0])
+
+    def test_round_robin(self):
+        openings = make_openings(1)
+        tournament = Tournament(['minimax:depth=1', 'mcts:playouts=20'],
+                                openings).run()
+        points, played = tournament.scores()
+        self.assertEqual(played, [2, 2])
+        self.assertEqual(sum(points), 2)
+        self.assertEqual(set((b, w) for b, w, x, y in tournament.results),
+                         set([(0, 1), (1, 0)]))
+        self.assertIn('games/s', tournament.report())
+
+if __name__ == '__main__':
+    unittest.main()
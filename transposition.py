@@ -0,0 +1,203 @@
+"""
+transposition.py - BẢNG CHUYỂN VỊ (TRANSPOSITION TABLE) CHO MINIMAX
+
+Othello có rất nhiều chuyển vị: các thứ tự nước đi khác nhau dẫn tới
+cùng một vị trí. Bảng này lưu kết quả tìm kiếm theo khóa Zobrist để
+không phải tìm lại từ đầu.
+
+- Kích thước cố định, giới hạn theo bộ nhớ (config.TT_MEMORY_MB)
+- Mỗi entry: (khóa, độ sâu, loại cận, điểm, nước đi tốt nhất, thế hệ)
+- Chính sách thay thế: ưu tiên độ sâu, nhưng entry của lần tìm kiếm cũ
+  (khác thế hệ) luôn bị thay
+
+SharedTranspositionTable có cùng giao diện nhưng nằm trong
+multiprocessing.shared_memory, để các tiến trình worker (parallel.py)
+dùng chung một bảng thay vì mỗi tiến trình tự tìm lại cùng vị trí.
+"""
+
+from multiprocessing import shared_memory
+from config import TT_MEMORY_MB
+
+# Loại cận của điểm lưu trong bảng
+EXACT = 0   # Điểm chính xác
+LOWER = 1   # Điểm >= giá trị lưu (đã cắt beta)
+UPPER = 2   # Điểm <= giá trị lưu (không vượt được alpha)
+
+# Ước lượng bộ nhớ cho một entry (tuple 6 phần tử + khóa + nước đi + ô list)
+ENTRY_BYTES = 200
+
+# Bảng dùng chung: mỗi entry là 2 số uint64 (khóa ^ dữ liệu, dữ liệu)
+SHARED_ENTRY_BYTES = 16
+SCORE_OFFSET = 1 << 31  # Điểm lưu dạng không âm trong 32 bit
+
+
+class TranspositionTable(object):
+
+    """
+    BẢNG CHUYỂN VỊ KÍCH THƯỚC CỐ ĐỊNH
+
+    Chỉ số ô = khóa & mask (số ô là lũy thừa của 2). Computer giữ một bảng
+    suốt ván đấu và gọi new_search() trước mỗi nước đi.
+    """
+
+    def __init__(self, memory_mb=TT_MEMORY_MB):
+        """
+        Args:
+            memory_mb: Giới hạn bộ nhớ (MB) của bảng
+        """
+        slots = 1
+        while slots * 2 * ENTRY_BYTES <= memory_mb * 1024 * 1024:
+            slots *= 2
+        self.mask = slots - 1
+        self.table = [None] * slots
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+
+    def __len__(self):
+        """Số ô của bảng"""
+        return self.mask + 1
+
+    def new_search(self):
+        """Bắt đầu lần tìm kiếm mới: entry cũ trở thành ứng viên bị thay"""
+        self.generation = (self.generation + 1) & 0xFF
+
+    def clear(self):
+        """Xóa toàn bộ bảng (ví dụ khi bắt đầu ván mới)"""
+        self.table = [None] * (self.mask + 1)
+        self.generation = 0
+
+    def probe(self, key):
+        """
+        TRA BẢNG THEO KHÓA
+
+        Returns:
+            tuple (key, depth, bound, score, move, generation) hoặc None
+        """
+        self.probes += 1
+        entry = self.table[key & self.mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key, depth, bound, score, move):
+        """
+        LƯU KẾT QUẢ TÌM KIẾM
+
+        Thay entry cũ khi ô trống, entry thuộc lần tìm kiếm trước,
+        hoặc độ sâu mới >= độ sâu đã lưu.
+        """
+        index = key & self.mask
+        old = self.table[index]
+        if old is None or old[5] != self.generation or depth >= old[1]:
+            self.table[index] = (key, depth, bound, score, move, self.generation)
+
+
+class SharedTranspositionTable(object):
+
+    """
+    BẢNG CHUYỂN VỊ TRONG BỘ NHỚ DÙNG CHUNG (NHIỀU TIẾN TRÌNH)
+
+    Mảng cố định các entry 16 byte, mỗi entry gồm 2 từ 64 bit:
+    - Từ 0: khóa ^ dữ liệu
+    - Từ 1: dữ liệu = độ sâu | cận << 8 | thế hệ << 10 | nước đi << 18
+                      | (điểm + SCORE_OFFSET) << 25
+    Không dùng khóa (lock): hai tiến trình ghi cùng lúc có thể để lại từ 0
+    của entry này với từ 1 của entry kia, khi đó từ 0 ^ từ 1 không còn
+    bằng khóa và probe() coi như không có entry (chỉ mất một lần tra bảng).
+    Thế hệ nằm ở từ cuối cùng của vùng nhớ để mọi tiến trình cùng thấy.
+
+    Khi pickle (truyền cho worker) chỉ gửi tên vùng nhớ; worker gắn vào
+    cùng vùng nhớ đó.
+    """
+
+    def __init__(self, memory_mb=TT_MEMORY_MB, name=None):
+        """
+        Args:
+            memory_mb: Giới hạn bộ nhớ (MB) của bảng
+            name: Tên vùng nhớ đã có (None = tạo mới, tiến trình này sở hữu)
+        """
+        slots = 1
+        while slots * 2 * SHARED_ENTRY_BYTES <= memory_mb * 1024 * 1024:
+            slots *= 2
+        self.memory_mb = memory_mb
+        self.mask = slots - 1
+        size = slots * SHARED_ENTRY_BYTES + 8
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.owner = True  # Vùng nhớ mới luôn được khởi tạo toàn 0
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.view = self.shm.buf[:size]
+        self.words = self.view.cast('Q')
+        self.genIndex = slots * 2
+        self.probes = 0
+        self.hits = 0
+
+    def __getstate__(self):
+        return (self.memory_mb, self.shm.name)
+
+    def __setstate__(self, state):
+        self.__init__(state[0], state[1])
+
+    def __len__(self):
+        """Số ô của bảng"""
+        return self.mask + 1
+
+    @property
+    def generation(self):
+        return self.words[self.genIndex]
+
+    def new_search(self):
+        """Bắt đầu lần tìm kiếm mới: entry cũ trở thành ứng viên bị thay"""
+        self.words[self.genIndex] = (self.words[self.genIndex] + 1) & 0xFF
+
+    def clear(self):
+        """Xóa toàn bộ bảng (ví dụ khi bắt đầu ván mới)"""
+        self.view[:] = bytes(len(self.view))
+
+    def probe(self, key):
+        """
+        TRA BẢNG THEO KHÓA
+
+        Returns:
+            tuple (key, depth, bound, score, move, generation) hoặc None
+        """
+        self.probes += 1
+        index = (key & self.mask) << 1
+        data = self.words[index + 1]
+        if data == 0 or self.words[index] ^ data != key:
+            return None
+        self.hits += 1
+        square = (data >> 18) & 0x7F
+        move = None if square == 0 else divmod(square - 1, 8)
+        return (key, data & 0xFF, (data >> 8) & 0x3, (data >> 25) - SCORE_OFFSET,
+                move, (data >> 10) & 0xFF)
+
+    def store(self, key, depth, bound, score, move):
+        """
+        LƯU KẾT QUẢ TÌM KIẾM - cùng chính sách thay thế với
+        TranspositionTable
+        """
+        words = self.words
+        index = (key & self.mask) << 1
+        generation = words[self.genIndex]
+        old = words[index + 1]
+        if old != 0 and (old >> 10) & 0xFF == generation and \
+           depth < old & 0xFF:
+            return
+        square = 0 if move is None else move[0] * 8 + move[1] + 1
+        data = depth | bound << 8 | generation << 10 | square << 18 | \
+            (score + SCORE_OFFSET) << 25
+        words[index] = key ^ data
+        words[index + 1] = data
+
+    def close(self):
+        """Tách khỏi vùng nhớ; tiến trình sở hữu giải phóng luôn vùng nhớ"""
+        self.words.release()
+        self.view.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,49 @@
+from board import Board
+from evaluator import Evaluator
+from minimax import Minimax
+from minimax_test import midgame_board
+from transposition import SharedTranspositionTable, EXACT, LOWER
+import pickle
+import unittest
+from config import WHITE, BLACK
+
+
+class TestSharedTranspositionTable(unittest.TestCase):
+    def test_store_probe(self):
+        tt = SharedTranspositionTable(1)
+        try:
+            key = 0x123456789ABCDEF0
+            self.assertIsNone(tt.probe(key))
+            tt.store(key, 5, LOWER, -321, (2, 3))
+            self.assertEqual(tt.probe(key), (key, 5, LOWER, -321, (2, 3), 0))
+            tt.store(key, 3, EXACT, 7, None)  # shallower: kept
+            self.assertEqual(tt.probe(key)[1], 5)
+            tt.new_search()
+            tt.store(key, 3, EXACT, 7, None)  # older generation: replaced
+            self.assertEqual(tt.probe(key), (key, 3, EXACT, 7, None, 1))
+            # a torn entry (words from two different writes) is a miss
+            index = (key & tt.mask) << 1
+            tt.words[index] ^= 1 << 40
+            self.assertIsNone(tt.probe(key))
+
+            other = pickle.loads(pickle.dumps(tt))  # attaches by name
+            other.store(key, 4, EXACT, 11, (0, 0))
+            self.assertEqual(tt.probe(key)[3], 11)
+            other.close()
+        finally:
+            tt.close()
+
+    def test_search_keeps_score(self):
+        b, color = midgame_board(cls=Board)
+        other = WHITE if color == BLACK else BLACK
+        plain = Minimax(Evaluator().score).search(b, 3, color, other)
+        tt = SharedTranspositionTable(1)
+        try:
+            shared = Minimax(Evaluator().score, tt).search(b, 3, color, other)
+            self.assertEqual(plain[0], shared[0])
+            self.assertGreater(tt.hits, 0)
+        finally:
+            tt.close()
+
+if __name__ == '__main__':
+    unittest.main()
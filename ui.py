@@ -73,6 +73,7 @@ class Gui:
                                onchange=self.set_player_1)
         self.menu.add.selector('Second player', [[COMPUTER, 2], [HUMAN, 1]],
                                onchange=self.set_player_2)
+        pygame.event.set_allowed(MOUSEMOTION)  # the menu highlights on hover
         self.menu.mainloop(self.screen)
 
     def set_player_1(self, value, player):
@@ -107,6 +108,9 @@ class Gui:
     def show_game(self):
         """ Game screen. """
         self.reset_menu()
+        # the game ignores mouse motion, so moving the mouse does not wake
+        # the event loop
+        pygame.event.set_blocked(MOUSEMOTION)
 
         # draws initial screen
         self.background = pygame.Surface(self.screen.get_size()).convert()
@@ -117,104 +121,133 @@ class Gui:
         self.screen.blit(self.background, (0, 0), self.background.get_rect())
         self.screen.blit(self.board_img, self.BOARD_POS,
                          self.board_img.get_rect())
-        self.put_stone((3, 3), WHITE)
-        self.put_stone((4, 4), WHITE)
-        self.put_stone((3, 4), BLACK)
-        self.put_stone((4, 3), BLACK)
+        # board as drawn on screen, update() redraws only what differs
+        self.rendered = [[0] * 8 for _ in range(8)]
+        self.panels = {}  # last values drawn in the score/probability panels
+        for pos, color in (((3, 3), WHITE), ((4, 4), WHITE),
+                           ((3, 4), BLACK), ((4, 3), BLACK)):
+            self.draw_square(pos, color)
         pygame.display.flip()
 
-    def put_stone(self, pos, color):
-        """ draws piece with given position and color """
-        if pos == None:
-            return
-
-        # flip orientation (because xy screen orientation)
-        pos = (pos[1], pos[0])
-
+    def draw_square(self, pos, color):
+        """ Draws one square (a stone, a tip or, for 0, an empty square)
+        on the screen surface only; returns its rect for
+        pygame.display.update """
         if color == BLACK:
             img = self.black_img
         elif color == WHITE:
             img = self.white_img
-        else:
+        elif color == 'tip':
             img = self.tip_img
+        else:
+            img = self.clear_img
 
-        x = pos[0] * self.SQUARE_SIZE + self.BOARD[0]
-        y = pos[1] * self.SQUARE_SIZE + self.BOARD[1]
-
-        self.screen.blit(img, (x, y), img.get_rect())
+        # flip orientation (because xy screen orientation)
+        x = pos[1] * self.SQUARE_SIZE + self.BOARD[0]
+        y = pos[0] * self.SQUARE_SIZE + self.BOARD[1]
+        self.rendered[pos[0]][pos[1]] = color
+        return self.screen.blit(img, (x, y), img.get_rect())
+
+    def redraw(self):
+        """ Draws the whole game screen again from what was last rendered,
+        e.g. after the window was uncovered """
+        self.screen.blit(self.background, (0, 0), self.background.get_rect())
+        self.screen.blit(self.board_img, self.BOARD_POS,
+                         self.board_img.get_rect())
+        for i in range(8):
+            for j in range(8):
+                if self.rendered[i][j]:
+                    self.draw_square((i, j), self.rendered[i][j])
+        if 'score' in self.panels:
+            self.showScore(*self.panels['score'])
+        if 'probability' in self.panels:
+            self.showWinProbability(*self.panels['probability'])
         pygame.display.flip()
 
+    def put_stone(self, pos, color):
+        """ draws piece with given position and color """
+        if pos == None:
+            return
+        pygame.display.update(self.draw_square(pos, color))
+
     def clear_square(self, pos):
         """ Puts in the given position a background image, to simulate that the
         piece was removed.
         """
-        # flip orientation
-        pos = (pos[1], pos[0])
-
-        x = pos[0] * self.SQUARE_SIZE + self.BOARD[0]
-        y = pos[1] * self.SQUARE_SIZE + self.BOARD[1]
-        self.screen.blit(self.clear_img, (x, y), self.clear_img.get_rect())
-        pygame.display.flip()
+        pygame.display.update(self.draw_square(pos, 0))
+
+    def square_at(self, pos):
+        """ Board square (row, col) under the screen point pos, None when
+        the point is out of board """
+        (mouse_x, mouse_y) = pos
+        if mouse_x >= self.BOARD_SIZE + self.BOARD[0] or \
+           mouse_x < self.BOARD[0] or \
+           mouse_y >= self.BOARD_SIZE + self.BOARD[1] or \
+           mouse_y < self.BOARD[1]:
+            return None
+
+        # find place, flipping orientation
+        return ((mouse_y - self.BOARD[1]) // self.SQUARE_SIZE,
+                (mouse_x - self.BOARD[0]) // self.SQUARE_SIZE)
 
     def get_mouse_input(self):
-        """ Get place clicked by mouse
+        """ Get place clicked by mouse; sleeps in pygame.event.wait until
+        there is an event
         """
         while True:
-            for event in pygame.event.get():
-                if event.type == MOUSEBUTTONDOWN:
-                    (mouse_x, mouse_y) = pygame.mouse.get_pos()
-
-                    # click was out of board, ignores
-                    if mouse_x > self.BOARD_SIZE + self.BOARD[0] or \
-                       mouse_x < self.BOARD[0] or \
-                       mouse_y > self.BOARD_SIZE + self.BOARD[1] or \
-                       mouse_y < self.BOARD[1]:
-                        continue
-
-                    # find place
-                    position = ((mouse_x - self.BOARD[0]) // self.SQUARE_SIZE), \
-                               ((mouse_y - self.BOARD[1]) // self.SQUARE_SIZE)
-                    # flip orientation
-                    position = (position[1], position[0])
+            event = pygame.event.wait()
+            if event.type == MOUSEBUTTONDOWN:
+                position = self.square_at(event.pos)
+                # click was out of board, ignores
+                if position is not None:
                     return position
 
-                elif event.type == QUIT:
-                    sys.exit(0)
-
-            time.sleep(.05)
+            elif event.type == QUIT:
+                sys.exit(0)
 
     def update(self, board, blacks, whites, current_player_color, black_win_prob=None, white_win_prob=None):
-        """Updates screen
+        """Updates screen: redraws only the squares that differ from the
+        last rendered board and the panels whose values changed, then
+        pushes just those rects to the display
         """
+        dirty = []
         for i in range(8):
             for j in range(8):
-                if board[i][j] != 0:
-                    self.put_stone((i, j), board[i][j])
+                if board[i][j] != self.rendered[i][j]:
+                    dirty.append(self.draw_square((i, j), board[i][j]))
 
         blacks_str = '%02d ' % int(blacks)
         whites_str = '%02d ' % int(whites)
-        self.showScore(blacks_str, whites_str, current_player_color)
+        score = (blacks_str, whites_str, current_player_color)
+        if self.panels.get('score') != score:
+            self.panels['score'] = score
+            dirty.extend(self.showScore(*score))
 
         # Hiển thị tỉ lệ thắng nếu có
         if black_win_prob is not None and white_win_prob is not None:
-            self.showWinProbability(black_win_prob, white_win_prob)
+            probs = (black_win_prob, white_win_prob)
+            if self.panels.get('probability') != probs:
+                self.panels['probability'] = probs
+                dirty.append(self.showWinProbability(*probs))
 
-        pygame.display.flip()
+        if dirty:
+            pygame.display.update(dirty)
 
     def showScore(self, blackStr, whiteStr, current_player_color):
+        """ Draws both scores; returns the rects drawn """
         black_background = self.YELLOW if current_player_color == WHITE else self.BACKGROUND
         white_background = self.YELLOW if current_player_color == BLACK else self.BACKGROUND
         text = self.scoreFont.render(blackStr, True, self.BLACK,
                                      black_background)
         text2 = self.scoreFont.render(whiteStr, True, self.WHITE,
                                       white_background)
-        self.screen.blit(text,
-                         (self.BLACK_LAB_POS[0], self.BLACK_LAB_POS[1] + 40))
-        self.screen.blit(text2,
-                         (self.WHITE_LAB_POS[0], self.WHITE_LAB_POS[1] + 40))
+        return [self.screen.blit(text,
+                                 (self.BLACK_LAB_POS[0], self.BLACK_LAB_POS[1] + 40)),
+                self.screen.blit(text2,
+                                 (self.WHITE_LAB_POS[0], self.WHITE_LAB_POS[1] + 40))]
 
     def showWinProbability(self, black_win_prob, white_win_prob):
-        """Hiển thị tỉ lệ thắng của cả hai bên"""
+        """Hiển thị tỉ lệ thắng của cả hai bên, trả về vùng đã vẽ"""
         # Xóa vùng hiển thị cũ
         clear_rect = pygame.Rect(0, self.WIN_PROB_POS[1], self.SCREEN_SIZE[0], 80)
         pygame.draw.rect(self.screen, self.BACKGROUND, clear_rect)
@@ -255,6 +288,28 @@ class Gui:
         label = self.probFont.render(label_text, True, self.WHITE)
         label_x = (self.SCREEN_SIZE[0] - label.get_width()) // 2
         self.screen.blit(label, (label_x, bar_y + 20))
+        return clear_rect
+
+    def thinking_rect(self, color):
+        """ Area of the thinking indicator, under the score of color """
+        x = self.BLACK_LAB_POS[0] if color == BLACK else self.WHITE_LAB_POS[0]
+        return pygame.Rect(x, self.BLACK_LAB_POS[1] + 110, 80, 20)
+
+    def show_thinking(self, color):
+        """ Animated "thinking" label shown while the computer searches in
+        the background; redraws only its own area """
+        rect = self.thinking_rect(color)
+        dots = '.' * (int(time.time() * 3) % 4)
+        text = self.probFont.render('Thinking' + dots, True, self.WHITE)
+        pygame.draw.rect(self.screen, self.BACKGROUND, rect)
+        self.screen.blit(text, rect.topleft)
+        pygame.display.update(rect)
+
+    def hide_thinking(self, color):
+        """ Clears the label of show_thinking """
+        rect = self.thinking_rect(color)
+        pygame.draw.rect(self.screen, self.BACKGROUND, rect)
+        pygame.display.update(rect)
 
     def wait_quit(self):
         # wait user to close window
@@ -266,5 +321,5 @@ class Gui:
 
     def show_valid_moves(self, valid_moves):
         logger.debug('valid movies: %s', valid_moves)
-        for move in valid_moves:
-            self.put_stone(move, 'tip')
+        pygame.display.update([self.draw_square(move, 'tip')
+                               for move in valid_moves])
@@ -0,0 +1,123 @@
+"""
+winprob.py - ƯỚC LƯỢNG TỈ LỆ THẮNG ĐỂ HIỂN THỊ, KHÔNG ĐÁNH GIÁ LẠI
+
+Evaluator.calculate_win_probability chấm lại cả vị trí (điểm tĩnh, số
+nước đi của hai bên...) sau mỗi nước, trên luồng giao diện. Ở đây tỉ lệ
+thắng lấy từ dữ liệu đã có, qua bảng logistic tính sẵn khi import:
+- Computer vừa tìm kiếm: điểm của lần tìm đó (lastResult.score), tra bảng
+  theo (số ô trống, điểm). Nếu lần tìm đã giải tới cuối ván (bộ giải tàn
+  cuộc), điểm là hiệu số quân nên kết quả là chắc chắn.
+- Không có điểm tìm kiếm (nước của người): tra bảng theo (số ô trống,
+  hiệu số quân, hiệu số góc) - chỉ cần đếm quân, không sinh nước đi.
+Kết quả được nhớ theo hash Zobrist của vị trí.
+"""
+
+import math
+
+from config import BLACK, WHITE
+
+SCORE_LIMIT = 640   # Điểm tìm kiếm bị kẹp vào [-640, 640]: xác suất đã bão hòa
+SCORE_STEP = 4      # Bảng lưu mỗi 4 điểm một giá trị
+SCORE_SCALE = 70.0  # Điểm 70 ở cuối ván ~ 73% thắng
+PROBABILITY_MIN = 0.05
+PROBABILITY_MAX = 0.95
+CORNERS = ((0, 0), (0, 7), (7, 0), (7, 7))
+
+
+def _logistic(x):
+    p = 1 / (1 + math.exp(-x))
+    return min(max(p, PROBABILITY_MIN), PROBABILITY_MAX)
+
+
+def _phase_weights(pieces):
+    """Trọng số (số quân, góc) theo giai đoạn, như calculate_win_probability"""
+    if pieces < 20:
+        return 0.3, 0.3
+    if pieces < 40:
+        return 0.4, 0.3
+    return 0.6, 0.2
+
+
+# SCORE_TABLE[ô trống][(điểm + SCORE_LIMIT) // SCORE_STEP]: cùng một điểm
+# ít chắc chắn hơn khi ván còn dài, nên độ dốc giảm theo số ô trống
+SCORE_TABLE = [[_logistic(score / (SCORE_SCALE * (1 + empties / 32.0)))
+                for score in range(-SCORE_LIMIT, SCORE_LIMIT + 1, SCORE_STEP)]
+               for empties in range(65)]
+
+# FEATURE_TABLE[ô trống][2 * số quân đen][hiệu số góc + 4] (2 * số quân đen =
+# hiệu số quân + số quân, chỉ số không âm)
+FEATURE_TABLE = []
+for _empties in range(65):
+    _pieces = 64 - _empties
+    _pieceWeight, _cornerWeight = _phase_weights(_pieces)
+    FEATURE_TABLE.append([[_logistic(5 * (
+        _pieceWeight * _discs / max(_pieces, 1) + _cornerWeight * _corners / 4.0))
+        for _corners in range(-4, 5)] for _discs in range(-_pieces, _pieces + 1)])
+
+
+def score_probability(score, empties, solved=False):
+    """
+    XÁC SUẤT THẮNG TỪ ĐIỂM TÌM KIẾM (góc nhìn người được tính điểm)
+
+    Args:
+        solved: Điểm là hiệu số quân chính xác ở cuối ván
+    """
+    if solved:
+        return 1.0 if score > 0 else 0.0 if score < 0 else 0.5
+    score = min(max(int(score), -SCORE_LIMIT), SCORE_LIMIT)
+    return SCORE_TABLE[empties][(score + SCORE_LIMIT + SCORE_STEP // 2)
+                                // SCORE_STEP]
+
+
+def feature_probability(board):
+    """
+    XÁC SUẤT THẮNG CỦA ĐEN TỪ SỐ QUÂN VÀ SỐ GÓC
+
+    Returns:
+        tuple: (xác_suất_đen, số ô trống)
+    """
+    whites, blacks, empty = board.count_stones()
+    grid = board.board
+    corners = 0
+    for i, j in CORNERS:
+        if grid[i][j] == BLACK:
+            corners += 1
+        elif grid[i][j] == WHITE:
+            corners -= 1
+    return FEATURE_TABLE[empty][2 * blacks][corners + 4], empty
+
+
+class WinProbability(object):
+    """
+    TỈ LỆ THẮNG CỦA VỊ TRÍ ĐANG HIỂN THỊ, NHỚ THEO HASH VỊ TRÍ
+
+    Một đối tượng cho mỗi ván (bảng nhớ không cần giới hạn: một ván có
+    tối đa 60 vị trí).
+    """
+
+    def __init__(self):
+        self.cache = {}
+
+    def estimate(self, board, result=None, color=None, solved=False):
+        """
+        TỈ LỆ THẮNG SAU NƯỚC ĐI VỪA ĐÁNH
+
+        Args:
+            board: Vị trí sau nước đi
+            result: SearchResult của Computer vừa đi (None nếu người đi)
+            color: Màu của Computer đó - điểm trong result theo góc nhìn này
+            solved: result.score là hiệu số quân chính xác (Computer.lastSolved)
+
+        Returns:
+            tuple: (xác_suất_thắng_đen, xác_suất_thắng_trắng)
+        """
+        if result is None and board.hash in self.cache:
+            return self.cache[board.hash]
+
+        black, empty = feature_probability(board)
+        if result is not None and result.move is not None:
+            probability = score_probability(result.score, empty, solved)
+            black = probability if color == BLACK else 1 - probability
+
+        self.cache[board.hash] = (black, 1 - black)
+        return self.cache[board.hash]
@@ -0,0 +1,65 @@
+from board import Board
+from minimax import SearchResult
+from player import Computer
+from winprob import WinProbability, score_probability, feature_probability
+import unittest
+from config import WHITE, BLACK
+
+
+class TestWinProbability(unittest.TestCase):
+    def test_start_is_even(self):
+        black, white = WinProbability().estimate(Board())
+        self.assertAlmostEqual(black, 0.5)
+        self.assertAlmostEqual(white, 0.5)
+
+    def test_score_table(self):
+        for empties in (50, 20, 5):
+            with self.subTest(empties=empties):
+                self.assertAlmostEqual(score_probability(0, empties), 0.5)
+                self.assertGreater(score_probability(60, empties), 0.5)
+                self.assertAlmostEqual(score_probability(60, empties),
+                                       1 - score_probability(-60, empties))
+                self.assertEqual(score_probability(10 ** 6, empties), 0.95)
+        # the same score is worth more near the end of the game
+        self.assertGreater(score_probability(60, 5), score_probability(60, 50))
+        self.assertEqual(score_probability(2, 3, solved=True), 1.0)
+        self.assertEqual(score_probability(-2, 3, solved=True), 0.0)
+
+    def test_features(self):
+        board = Board()
+        board.get_valid_moves(BLACK)
+        board.apply_move((2, 3), BLACK)
+        black, empty = feature_probability(board)
+        self.assertEqual(empty, 59)
+        self.assertGreater(black, 0.5)
+        board.board[0][0] = WHITE
+        self.assertLess(feature_probability(board)[0], black)
+
+    def test_search_score(self):
+        board = Board()
+        board.get_valid_moves(BLACK)
+        board.apply_move((2, 3), BLACK)
+        computer = Computer(WHITE, 3, book_path=None)
+        result = computer.choose_move(board)
+        self.assertFalse(computer.lastSolved)
+        board.get_valid_moves(WHITE)
+        board.apply_move(result.move, WHITE)
+
+        black, white = WinProbability().estimate(board, result, WHITE)
+        self.assertAlmostEqual(white, score_probability(result.score, 58))
+        self.assertAlmostEqual(black + white, 1)
+        computer.close()
+
+    def test_cached_per_position(self):
+        board = Board()
+        estimator = WinProbability()
+        won = SearchResult((2, 3), 10, [(2, 3)], 0, 60)
+        self.assertEqual(estimator.estimate(board, won, BLACK, solved=True),
+                         (1.0, 0.0))
+        # later lookups without a search reuse the value of the position
+        self.assertEqual(estimator.estimate(board), (1.0, 0.0))
+        self.assertEqual(WinProbability().estimate(board), (0.5, 0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
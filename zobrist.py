@@ -0,0 +1,68 @@
+"""
+zobrist.py - KHÓA ZOBRIST CHO BẢNG CỜ OTHELLO
+
+Mỗi cặp (màu, ô) có một khóa ngẫu nhiên 64 bit. Hash của một vị trí là
+XOR của khóa mọi quân đang có trên bảng, nên khi đặt/lật quân chỉ cần
+XOR thêm vài khóa (cập nhật tăng dần, không phải duyệt lại 64 ô).
+
+Board và BitBoard dùng chung các khóa này: cùng một vị trí luôn cho
+cùng một hash, bất kể cách biểu diễn bảng.
+"""
+
+import random
+from config import WHITE, BLACK, EMPTY
+
+_rng = random.Random(0x0DE11A)  # Seed cố định để hash ổn định giữa các lần chạy
+
+# SQUARE_KEYS[color][row * 8 + col] - ô trống có khóa 0
+SQUARE_KEYS = [[0] * 64,
+               [_rng.getrandbits(64) for _ in range(64)],
+               [_rng.getrandbits(64) for _ in range(64)]]
+
+# Khóa lượt đi: XOR thêm khi đến lượt Trắng (cùng bảng, khác lượt => khác hash)
+SIDE_KEYS = [0, 0, _rng.getrandbits(64)]
+
+# BYTE_KEYS[color][byte][value] - XOR khóa của các bit bật trong 1 byte,
+# để tính khóa cho cả một mặt nạ bit chỉ với 8 lần tra bảng
+BYTE_KEYS = [None, [], []]
+for _color in (BLACK, WHITE):
+    for _byte in range(8):
+        _keys = [0] * 256
+        for _value in range(1, 256):
+            _low = _value & -_value
+            _keys[_value] = _keys[_value ^ _low] ^ \
+                SQUARE_KEYS[_color][_byte * 8 + _low.bit_length() - 1]
+        BYTE_KEYS[_color].append(_keys)
+
+
+def square_key(color, row, column):
+    """Khóa của một quân màu 'color' tại (row, column)"""
+    return SQUARE_KEYS[color][row * 8 + column]
+
+
+def mask_key(color, mask):
+    """XOR khóa của mọi ô trong mặt nạ bit (dùng cho BitBoard)"""
+    keys = BYTE_KEYS[color]
+    key = 0
+    byte = 0
+    while mask:
+        if mask & 0xFF:
+            key ^= keys[byte][mask & 0xFF]
+        mask >>= 8
+        byte += 1
+    return key
+
+
+def grid_hash(grid):
+    """Tính hash từ đầu cho lưới 8x8 (dùng khi khởi tạo hoặc sửa bảng trực tiếp)"""
+    key = 0
+    for i in range(8):
+        for j in range(8):
+            if grid[i][j] != EMPTY:
+                key ^= SQUARE_KEYS[grid[i][j]][i * 8 + j]
+    return key
+
+
+def position_key(board, color):
+    """Khóa tra bảng chuyển vị: hash của bảng kết hợp lượt đi"""
+    return board.hash ^ SIDE_KEYS[color]